@@ -0,0 +1,224 @@
+"""Compare the work done by the worklist dedupe functions with the recursive implementation they replaced.
+
+The recursive implementation is reproduced here, counting the full passes it makes over the shards and the number of
+shards each pass examines. It is run inside a :func:`~policyglass.memo.memo_scope`, as the worklist implementation
+is. The worklist implementation reports the shards it examines in a ``DedupeStats``. Both are run on the same random
+policies. The recursive implementation's work grows so quickly with the number of shards, and for some policies never
+stops, that it is stopped once it has examined ``RECURSIVE_EXAMINED_LIMIT`` shards.
+
+The number of shards each returns is printed too. They can differ as ``dedupe_policy_shards`` only splits a shard
+where the split loses none of its permissions, which the recursive implementation did not check.
+
+Run with ``python benchmarks/dedupe_passes.py`` from the root of the repository.
+"""
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from policyglass import Policy  # noqa: E402
+from policyglass.memo import memo_scope  # noqa: E402
+from policyglass.policy_shard import (  # noqa: E402
+    DedupeStats,
+    PolicyShard,
+    _subtract_deny_shards,
+    dedupe_policy_shard_subsets,
+    dedupe_policy_shards,
+)
+
+ACTIONS = ["*", "s3:*", "s3:Get*", "s3:GetObject", "s3:PutObject", "s3:List*", "ec2:*", "ec2:Describe*", "iam:Pass*"]
+RESOURCES = ["*", "arn:aws:s3:::bucket/*", "arn:aws:s3:::bucket/key", "arn:aws:s3:::*", "arn:aws:ec2:*:111:*"]
+PRINCIPALS = ["*", "111111111111", "arn:aws:iam::111111111111:role/role-name", "222222222222"]
+CONDITIONS = [None, {"StringEquals": {"aws:PrincipalOrgID": "o-1"}}, {"Bool": {"aws:SecureTransport": "false"}}]
+#: The recursive implementation can take minutes, or never finish, so it is stopped after examining this many shards.
+RECURSIVE_EXAMINED_LIMIT = 10000
+
+
+class RecursiveLimitExceeded(Exception):
+    """The recursive implementation examined more than ``RECURSIVE_EXAMINED_LIMIT`` shards."""
+
+
+class RecursiveCounts:
+    """The passes made by the recursive implementation."""
+
+    def __init__(self) -> None:
+        self.passes = 0
+        self.examined = 0
+
+    def add_pass(self, shards: List[PolicyShard]) -> None:
+        """Count a pass over ``shards``.
+
+        Parameters:
+            shards: The shards the pass examines.
+
+        Raises:
+            RecursiveLimitExceeded: if more than ``RECURSIVE_EXAMINED_LIMIT`` shards have been examined.
+        """
+        self.passes += 1
+        self.examined += len(shards)
+        if self.examined > RECURSIVE_EXAMINED_LIMIT:
+            raise RecursiveLimitExceeded()
+
+
+def recursive_dedupe_policy_shard_subsets(
+    shards: Iterable[PolicyShard], counts: RecursiveCounts, check_reverse: bool = True
+) -> List[PolicyShard]:
+    """Dedupe policy shards that are subsets of each other, as the recursive implementation did.
+
+    Parameters:
+        shards: The shards to deduplicate.
+        counts: Counts the passes made.
+        check_reverse: Whether to check these shards in reverse as well (only disabled when calling itself).
+    """
+    deduped_shards: List[PolicyShard] = []
+    removed_shards: List[PolicyShard] = []
+    sorted_shards = list(shards)
+    counts.add_pass(sorted_shards)
+
+    if check_reverse:
+        sorted_shards = sorted(sorted_shards, key=lambda x: x.effective_resource, reverse=True)
+
+    for undeduped_shard in sorted_shards:
+        if any(undeduped_shard.issubset(deduped_shard) for deduped_shard in deduped_shards):
+            removed_shards.append(undeduped_shard)
+            continue
+
+        deduped_shards.append(undeduped_shard)
+
+    if check_reverse:
+        deduped_shards = recursive_dedupe_policy_shard_subsets(reversed(deduped_shards), counts, False)
+    if removed_shards:
+        deduped_shards = recursive_dedupe_policy_shard_subsets(deduped_shards, counts)
+    return deduped_shards
+
+
+def recursive_dedupe_policy_shards(
+    shards: Iterable[PolicyShard], counts: RecursiveCounts, check_reverse: bool = True
+) -> List[PolicyShard]:
+    """Dedupe policy shards that are subsets of each other and remove intersections, as the recursive version did.
+
+    Parameters:
+        shards: The shards to deduplicate.
+        counts: Counts the passes made.
+        check_reverse: Whether to check these shards in reverse as well (only disabled when calling itself).
+    """
+    deduped_shards: List[PolicyShard] = []
+    difference_shards: List[PolicyShard] = []
+    removed_shards: List[PolicyShard] = []
+    shards = list(shards)
+    counts.add_pass(shards)
+    for undeduped_shard in shards:
+        difference_buffer = []
+        removed_buffer = []
+
+        for deduped_shard in deduped_shards:
+            if undeduped_shard.issubset(deduped_shard):
+                removed_buffer.append(undeduped_shard)
+                break
+            if deduped_shard.issubset(undeduped_shard):
+                break
+
+            if undeduped_shard.effect != deduped_shard.effect or not deduped_shard.intersection(undeduped_shard):
+                continue
+            differences = undeduped_shard.difference(deduped_shard, dedupe_result=False)
+            if differences and differences != [undeduped_shard]:
+                for difference in differences:
+                    if difference < undeduped_shard and not difference.intersection(deduped_shard):
+                        difference_buffer.append(difference)
+
+        if removed_buffer:
+            removed_shards.extend(removed_buffer)
+            continue
+        if difference_buffer:
+            difference_shards.extend(difference_buffer)
+            continue
+        deduped_shards.append(undeduped_shard)
+
+    deduped_shards = deduped_shards + difference_shards
+    if check_reverse:
+        deduped_shards = recursive_dedupe_policy_shards(reversed(deduped_shards), counts, False)
+    if removed_shards or difference_shards:
+        deduped_shards = recursive_dedupe_policy_shards(deduped_shards, counts)
+    return deduped_shards
+
+
+def random_statement(rng: random.Random, conditions: bool) -> Dict:
+    """Return a random statement.
+
+    Parameters:
+        rng: The random number generator to use.
+        conditions: Whether the statement may have a condition.
+    """
+    statement = {
+        "Effect": rng.choice(["Allow", "Allow", "Deny"]),
+        "Action": rng.sample(ACTIONS, rng.randint(1, 3)),
+        "Resource": rng.sample(RESOURCES, rng.randint(1, 2)),
+        "Principal": {"AWS": rng.sample(PRINCIPALS, rng.randint(1, 2))},
+    }
+    condition = rng.choice(CONDITIONS) if conditions else None
+    if condition:
+        statement["Condition"] = condition
+    return statement
+
+
+def random_allow_shards(rng: random.Random, statement_count: int, conditions: bool) -> List[PolicyShard]:
+    """Return the allow shards of a random policy with its deny shards subtracted, ready to be deduplicated.
+
+    Parameters:
+        rng: The random number generator to use.
+        statement_count: The number of statements in the policy.
+        conditions: Whether the statements may have conditions.
+    """
+    shards = Policy(Statement=[random_statement(rng, conditions) for _ in range(statement_count)]).policy_shards
+    allow_shards = [shard for shard in shards if shard.effect == "Allow"]
+    deny_shards = [shard for shard in shards if shard.effect == "Deny"]
+    return [shard for result in _subtract_deny_shards(allow_shards, deny_shards) for shard in result]
+
+
+def timed(function: Callable[[], List[PolicyShard]]) -> Tuple[List[PolicyShard], float]:
+    """Return the result of ``function`` and how long it took in seconds.
+
+    Parameters:
+        function: The function to call.
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Print the work done deduping random policies of increasing size by both implementations."""
+    sys.setrecursionlimit(100000)
+    print(
+        f"{'function':<28} {'conditions':>10} {'shards':>6} {'passes':>6} {'examined':>9} {'seconds':>8} "
+        f"{'result':>6} {'examined':>9} {'seconds':>8} {'result':>6}"
+    )
+    print(f"{'':<46} {'recursive':^31} {'worklist':^25}")
+    functions = [
+        (dedupe_policy_shard_subsets, recursive_dedupe_policy_shard_subsets),
+        (dedupe_policy_shards, recursive_dedupe_policy_shards),
+    ]
+    for conditions in (False, True):
+        for statement_count in range(2, 9):
+            shards = random_allow_shards(random.Random(statement_count), statement_count, conditions)
+            for function, recursive_function in functions:
+                counts = RecursiveCounts()
+                try:
+                    with memo_scope():
+                        recursive_result, recursive_seconds = timed(lambda: recursive_function(shards, counts))
+                    recursive = f"{recursive_seconds:>8.3f} {len(recursive_result):>6}"
+                except RecursiveLimitExceeded:
+                    recursive = f"{'stopped':>8} {'-':>6}"
+                stats = DedupeStats()
+                result, seconds = timed(lambda: function(shards, stats=stats))
+                print(
+                    f"{function.__name__:<28} {str(conditions):>10} {len(shards):>6} {counts.passes:>6} "
+                    f"{counts.examined:>9} {recursive} {stats.examined:>9} {seconds:>8.3f} {len(result):>6}"
+                )
+
+
+if __name__ == "__main__":
+    main()
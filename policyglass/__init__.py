@@ -18,6 +18,7 @@ from .policy_shard import (
     policy_shards_to_json,
 )
 from .principal import EffectivePrincipal, Principal, PrincipalCollection, PrincipalType, PrincipalValue
+from .product_shard import ProductShard
 from .resource import EffectiveResource, Resource
 from .statement import Statement
 
@@ -41,6 +42,7 @@ __all__ = [
     "EffectivePrincipal",
     "EffectiveCondition",
     "PolicyShard",
+    "ProductShard",
     "policy_shards_effect",
     "dedupe_policy_shards",
     "policy_shards_to_json",
@@ -1,7 +1,8 @@
 """Action class."""
-from fnmatch import fnmatch
 
+from .action_catalog import active_action_catalog
 from .effective_arp import EffectiveARP
+from .iam_glob import match_glob
 from .models import CaseInsensitiveString
 
 
@@ -27,7 +28,7 @@ class Action(CaseInsensitiveString):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
-        return fnmatch(self.lower(), other.lower())
+        return match_glob(self._folded, other._folded)
 
     def __lt__(self, other: object) -> bool:
         """Whether this object contains but is not equal to (i.e. a proper subset) another object.
@@ -64,3 +65,40 @@ class EffectiveAction(EffectiveARP[Action]):
     """
 
     _arp_type = Action
+
+    def issubset(self, other: object) -> bool:
+        """Whether this object contains all the elements of another object (i.e. is a subset of the other object).
+
+        While an :mod:`~policyglass.action_catalog` is enabled this object is not a subset if it has catalog actions
+        that ``other`` does not. Otherwise the patterns are compared, as this object's pattern may match actions
+        missing from the catalog.
+
+        Parameters:
+            other: The object to determine if our object contains.
+        """
+        catalog = active_action_catalog()
+        if catalog is not None and isinstance(other, self.__class__):
+            bits = catalog.effective_bits(self)
+            other_bits = catalog.effective_bits(other)
+            if bits is not None and bits & ~(other_bits or 0):
+                return False
+        return super().issubset(other)
+
+    def in_exclusions(self, other: Action) -> bool:
+        """Check if the Action is contained within the exclusions.
+
+        While an :mod:`~policyglass.action_catalog` is enabled it is not if the exclusions do not match all the
+        catalog actions of ``other``. Otherwise the patterns are compared.
+
+        Parameters:
+            other: The object to look for in the exclusions of this object.
+        """
+        catalog = active_action_catalog()
+        if catalog is not None:
+            other_bits = catalog.action_bits(other)
+            excluded_bits = 0
+            for exclusion in self.exclusions:
+                excluded_bits |= catalog.action_bits(exclusion)
+            if other_bits & ~excluded_bits:
+                return False
+        return super().in_exclusions(other)
@@ -0,0 +1,224 @@
+"""Opt-in catalog of concrete IAM actions for quickly ruling out comparisons of EffectiveActions.
+
+Comparing EffectiveActions as patterns compares every pair of their inclusions and exclusions. While an
+:class:`ActionCatalog` is enabled, each EffectiveAction whose inclusion matches an action in the catalog is converted
+to an ``int`` with one bit per matching catalog action that its exclusions do not match. If an EffectiveAction has a
+catalog action that another does not, a single bitwise comparison shows it is not a subset of the other, and
+``in_exclusions`` likewise shows an Action is not excluded if it matches a catalog action no exclusion matches.
+``intersection`` and ``difference`` benefit through those two methods.
+
+A wildcard may match actions missing from an outdated catalog, so the catalog is only ever used to rule things out.
+It never shows that one EffectiveAction is a subset of another, that two have nothing in common or that nothing is
+left of one, so enabling a catalog never changes the result of a comparison, only how quickly it is found.
+
+The catalog is not bundled with PolicyGlass because the list of IAM actions changes constantly. Load one with
+:meth:`ActionCatalog.from_json`.
+
+Enable or disable the catalog outside of calls to the dedupe and effect functions, as they memoise comparisons for
+the duration of each call.
+
+Example:
+    Compare EffectiveActions against a catalog.
+
+        >>> from policyglass import Action, EffectiveAction
+        >>> from policyglass.action_catalog import ActionCatalog, action_catalog
+        >>> catalog = ActionCatalog(["s3:GetObject", "s3:GetObjectAcl", "s3:PutObject"])
+        >>> get = EffectiveAction(Action("s3:Get*"))
+        >>> with action_catalog(catalog):
+        ...     get.issubset(EffectiveAction(Action("s3:*"), frozenset({Action("s3:GetObjectAcl")})))
+        False
+"""
+import json
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .iam_glob import classify_glob, compile_glob
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .action import Action
+    from .effective_arp import EffectiveARP
+
+#: Greater than any character which can appear in an action name, used to find the end of a prefix range.
+_PREFIX_END = "\U0010ffff"
+
+
+class ActionCatalog:
+    """A sorted list of concrete IAM actions which maps Action patterns to bitsets of the actions they match.
+
+    Each action is case folded and assigned the bit of its position in the sorted list, so the actions of a service
+    and the actions sharing a prefix occupy a contiguous run of bits.
+    """
+
+    def __init__(self, actions: Iterable[str]) -> None:
+        """Initialise the catalog.
+
+        Parameters:
+            actions: The names of the actions, e.g. ``s3:GetObject``.
+
+        Raises:
+            ValueError: If an action has no service prefix or contains a wildcard.
+        """
+        names = set()
+        for action in actions:
+            name = str(action).lower()
+            if ":" not in name or "*" in name or "?" in name:
+                raise ValueError(f"Catalog actions must be concrete service:action names, not {action!r}")
+            names.add(name)
+        self._names: List[str] = sorted(names)
+        self._services: Dict[str, Tuple[int, int]] = {}
+        for position, name in enumerate(self._names):
+            service = name.partition(":")[0]
+            start, _ = self._services.get(service, (position, position))
+            self._services[service] = (start, position + 1)
+        self._action_bits: Dict[str, int] = {}
+        self._effective_bits: Dict["EffectiveARP[Action]", Optional[int]] = {}
+
+    @classmethod
+    def from_json(cls, file: Union[str, IO[str]]) -> "ActionCatalog":
+        """Load a catalog from a JSON file.
+
+        The file may contain a list of action names (``["s3:GetObject", ...]``), or an object mapping each service
+        prefix to a list of its action names with or without the prefix (``{"s3": ["GetObject", ...]}``).
+
+        Parameters:
+            file: The path of the file or an open file.
+
+        Raises:
+            ValueError: If the JSON is neither a list nor an object of lists.
+        """
+        if isinstance(file, str):
+            with open(file) as opened_file:
+                data = json.load(opened_file)
+        else:
+            data = json.load(file)
+        if isinstance(data, list):
+            return cls(data)
+        if isinstance(data, dict) and all(isinstance(names, list) for names in data.values()):
+            return cls(
+                name if ":" in name else f"{service}:{name}" for service, names in data.items() for name in names
+            )
+        raise ValueError("An action catalog must be a list of actions or an object mapping services to actions")
+
+    def __len__(self) -> int:
+        """Return the number of actions in the catalog."""
+        return len(self._names)
+
+    def action_bits(self, action: "Action") -> int:
+        """Return the bitset of the catalog actions matched by ``action``.
+
+        Parameters:
+            action: The Action pattern to match.
+        """
+        pattern = action._folded
+        bits = self._action_bits.get(pattern)
+        if bits is None:
+            bits = self._action_bits[pattern] = self._match(pattern)
+        return bits
+
+    def effective_bits(self, effective_action: "EffectiveARP[Action]") -> Optional[int]:
+        """Return the bitset of the catalog actions matched by the inclusion of ``effective_action`` but no exclusion.
+
+        Returns None if the inclusion matches no catalog actions, or its exclusions match all of them, as the catalog
+        cannot describe it.
+
+        Parameters:
+            effective_action: The EffectiveAction to convert.
+        """
+        try:
+            return self._effective_bits[effective_action]
+        except KeyError:
+            pass
+        bits: Optional[int] = self.action_bits(effective_action.inclusion)
+        if bits:
+            for exclusion in effective_action.exclusions:
+                bits &= ~self.action_bits(exclusion)
+        if not bits:
+            bits = None
+        self._effective_bits[effective_action] = bits
+        return bits
+
+    def actions(self, bits: int) -> List[str]:
+        """Return the case folded names of the catalog actions in ``bits``.
+
+        Parameters:
+            bits: The bitset to convert.
+        """
+        return [name for position, name in enumerate(self._names) if bits >> position & 1]
+
+    def clear_cache(self) -> None:
+        """Drop the bitsets calculated so far."""
+        self._action_bits.clear()
+        self._effective_bits.clear()
+
+    def _match(self, pattern: str) -> int:
+        """Return the bitset of the catalog actions matched by the case folded ``pattern``.
+
+        Parameters:
+            pattern: The case folded pattern to match.
+        """
+        shape = classify_glob(pattern)
+        if shape == "literal":
+            position = bisect_left(self._names, pattern)
+            if position < len(self._names) and self._names[position] == pattern:
+                return 1 << position
+            return 0
+        if shape == "prefix":
+            prefix = pattern[:-1]
+            start = bisect_left(self._names, prefix)
+            end = bisect_left(self._names, prefix + _PREFIX_END, start)
+            return ((1 << (end - start)) - 1) << start
+
+        service, separator, _ = pattern.partition(":")
+        if separator and not any(wildcard in service for wildcard in "*?"):
+            start, end = self._services.get(service, (0, 0))
+        else:
+            start, end = 0, len(self._names)
+        matcher = compile_glob(pattern)
+        bits = 0
+        for position in range(start, end):
+            if matcher(self._names[position]):
+                bits |= 1 << position
+        return bits
+
+
+_catalog: Optional[ActionCatalog] = None
+
+
+def enable_action_catalog(catalog: ActionCatalog) -> None:
+    """Start comparing EffectiveActions using ``catalog``.
+
+    Parameters:
+        catalog: The catalog to use.
+    """
+    global _catalog
+    _catalog = catalog
+
+
+def disable_action_catalog() -> None:
+    """Stop comparing EffectiveActions using a catalog."""
+    global _catalog
+    _catalog = None
+
+
+def active_action_catalog() -> Optional[ActionCatalog]:
+    """Return the catalog EffectiveActions are currently compared with, if any."""
+    return _catalog
+
+
+@contextmanager
+def action_catalog(catalog: ActionCatalog) -> Iterator[ActionCatalog]:
+    """Compare EffectiveActions using ``catalog`` for the duration of the context, restoring the previous catalog after.
+
+    Parameters:
+        catalog: The catalog to use.
+    """
+    previous = _catalog
+    enable_action_catalog(catalog)
+    try:
+        yield catalog
+    finally:
+        if previous is None:
+            disable_action_catalog()
+        else:
+            enable_action_catalog(previous)
@@ -0,0 +1,83 @@
+"""Match many concrete actions against the EffectiveActions of a list of PolicyShards at once.
+
+Checking ``Action(name) in shard.effective_action`` for every action and every shard creates an EffectiveAction and
+compares patterns for each pair. :class:`ShardActionMatcher` compiles the inclusions and exclusions of all the shards
+into two :class:`~policyglass.shard_index.ActionTrie` automatons, so each action is matched against every shard by
+walking its own characters through each trie once. Repeated actions, which are common in audit logs, are only
+matched once per call.
+"""
+from typing import Dict, Iterable, List, Set, Tuple, cast
+
+from .action import Action
+from .policy_shard import PolicyShard
+from .shard_index import ActionTrie
+
+
+class ShardActionMatcher:
+    """Finds the PolicyShards whose EffectiveAction contains each of many actions.
+
+    Only the action dimension is considered. To find the actions a policy allows, match against the shards returned
+    by :func:`~policyglass.policy_shard.policy_shards_effect`.
+
+    Example:
+        Find which actions from a log a policy allows.
+
+            >>> from policyglass import Policy, policy_shards_effect
+            >>> from policyglass.action_matcher import ShardActionMatcher
+            >>> policy = Policy(**{"Statement": [
+            ...     {"Effect": "Allow", "Action": "s3:*", "Resource": "*"},
+            ...     {"Effect": "Deny", "Action": "s3:Delete*", "Resource": "*"},
+            ... ]})
+            >>> matcher = ShardActionMatcher(policy_shards_effect(policy.policy_shards))
+            >>> matcher.mask(["s3:GetObject", "s3:DeleteObject", "ec2:RunInstances", "S3:PutObject"])
+            [True, False, False, True]
+    """
+
+    def __init__(self, shards: Iterable[PolicyShard]) -> None:
+        """Compile the EffectiveActions of ``shards``.
+
+        Parameters:
+            shards: The shards to match actions against.
+        """
+        self.shards: List[PolicyShard] = list(shards)
+        self._inclusions = ActionTrie()
+        self._exclusions = ActionTrie()
+        for position, shard in enumerate(self.shards):
+            self._inclusions.add(shard.effective_action.inclusion, position)
+            for exclusion in shard.effective_action.exclusions:
+                self._exclusions.add(exclusion, position)
+
+    def matching_shards(self, action: str) -> Tuple[int, ...]:
+        """Return the positions of the shards whose EffectiveAction contains ``action``, in ascending order.
+
+        Parameters:
+            action: The action to match, e.g. ``s3:GetObject``.
+        """
+        probe = Action(action)
+        included = cast(Set[int], self._inclusions.containing(probe))
+        if included:
+            included -= self._exclusions.containing(probe)
+        return tuple(sorted(included))
+
+    def indices(self, actions: Iterable[str]) -> List[Tuple[int, ...]]:
+        """Return :meth:`matching_shards` for each of ``actions``.
+
+        Parameters:
+            actions: The actions to match. Any iterable of strings, including a NumPy array of strings.
+        """
+        matches: Dict[str, Tuple[int, ...]] = {}
+        result = []
+        for action in actions:
+            try:
+                result.append(matches[action])
+            except KeyError:
+                result.append(matches.setdefault(action, self.matching_shards(action)))
+        return result
+
+    def mask(self, actions: Iterable[str]) -> List[bool]:
+        """Return whether any shard's EffectiveAction contains each of ``actions``.
+
+        Parameters:
+            actions: The actions to match. Any iterable of strings, including a NumPy array of strings.
+        """
+        return [bool(positions) for positions in self.indices(actions)]
@@ -1,9 +1,8 @@
 """Statement Condition classes."""
 
-
-from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
-
-from pydantic import BaseModel
+import json
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from weakref import WeakValueDictionary
 
 from .models import CaseInsensitiveString
 
@@ -85,19 +84,52 @@ class ConditionValue(str):
     """Condition values may or may not be case sensitive depending on the operator."""
 
 
-class Condition(BaseModel):
-    """A representation of part of a statement condition in order to facilitate comparison."""
+class Condition:
+    """A representation of part of a statement condition in order to facilitate comparison.
+
+    Conditions are immutable. Their values are stored in a canonical (sorted, deduplicated) order so that
+    conditions that differ only in the order of their values are equal and hash the same.
+    """
+
+    __slots__ = ("key", "operator", "_values", "_hash", "_exact", "_reverse")
 
     key: ConditionKey
     operator: ConditionOperator
-    values: List[ConditionValue]
+    _values: Tuple[ConditionValue, ...]
+    _hash: int
+    #: The key, operator and values as case sensitive strings.
+    _exact: Tuple[str, str, Tuple[ConditionValue, ...]]
+    _reverse: Optional["Condition"]
 
     def __init__(self, key: ConditionKey, operator: ConditionOperator, values: List[ConditionValue]) -> None:
-        super().__init__(
-            key=ConditionKey(key),
-            operator=ConditionOperator(operator),
-            values=[ConditionValue(value) for value in values],
-        )
+        if not isinstance(key, str) or not isinstance(operator, str) or isinstance(values, str):
+            raise ValueError(f"Invalid condition {key!r} {operator!r} {values!r}")
+        condition_key = key if type(key) is ConditionKey else ConditionKey(key)
+        condition_operator = operator if type(operator) is ConditionOperator else ConditionOperator(operator)
+        condition_values = tuple(sorted({ConditionValue(value) for value in values}))
+        object.__setattr__(self, "key", condition_key)
+        object.__setattr__(self, "operator", condition_operator)
+        object.__setattr__(self, "_values", condition_values)
+        object.__setattr__(self, "_hash", hash((condition_key, condition_operator, condition_values)))
+        object.__setattr__(self, "_exact", (str(condition_key), str(condition_operator), condition_values))
+        object.__setattr__(self, "_reverse", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Prevent modification of this object.
+
+        Parameters:
+            name: The name of the attribute.
+            value: The value of the attribute.
+
+        Raises:
+            AttributeError: Conditions are immutable.
+        """
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    @property
+    def values(self) -> List[ConditionValue]:
+        """Return the values of this condition in their canonical order."""
+        return list(self._values)
 
     @property
     def reverse(self) -> "Condition":
@@ -106,9 +138,15 @@ class Condition(BaseModel):
         Raises:
             ValueError: If the operator is a type that cannot be reversed.
         """
-        if self.operator in OPERATOR_REVERSAL_INDEX:
-            return self.__class__(key=self.key, operator=OPERATOR_REVERSAL_INDEX[self.operator], values=self.values)
-        raise ValueError(f"Cannot reverse conditions with operator {self.operator}")
+        if self._reverse is None:
+            if self.operator not in OPERATOR_REVERSAL_INDEX:
+                raise ValueError(f"Cannot reverse conditions with operator {self.operator}")
+            reverse = self.__class__(
+                key=self.key, operator=OPERATOR_REVERSAL_INDEX[self.operator], values=list(self._values)
+            )
+            object.__setattr__(reverse, "_reverse", self)
+            object.__setattr__(self, "_reverse", reverse)
+        return self._reverse  # type: ignore[return-value]
 
     @classmethod
     def factory(cls, condition_collection: "RawConditionCollection") -> "FrozenSet[Condition]":
@@ -124,6 +162,49 @@ class Condition(BaseModel):
                 )
         return frozenset(result)
 
+    def dict(self, *args, **kwargs) -> Dict[str, Any]:
+        """Return a dictionary representation of this object.
+
+        Parameters:
+            *args: Accepted for compatibility with Pydantic's dict method.
+            **kwargs: Accepted for compatibility with Pydantic's dict method.
+        """
+        return {"key": self.key, "operator": self.operator, "values": list(self._values)}
+
+    def json(self, *args, **kwargs) -> str:
+        """Return a JSON representation of this object.
+
+        Parameters:
+            *args: Accepted for compatibility with Pydantic's json method.
+            **kwargs: Keyword arguments passed on to :func:`json.dumps`.
+        """
+        return json.dumps(self.dict(), **kwargs)
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable]:
+        """Allow Pydantic models to have Condition fields."""
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: object) -> "Condition":
+        """Return a Condition from a Condition or a dictionary of its fields.
+
+        Parameters:
+            value: The value to validate.
+
+        Raises:
+            ValueError: If the value cannot be converted to a Condition.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        raise ValueError(f"Cannot convert {value.__class__.__name__} to {cls.__name__}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle using the fields so the cached hash is recomputed when unpickled."""
+        return (self.__class__, (self.key, self.operator, list(self._values)))
+
     def __eq__(self, other: object) -> bool:
         """Determine whether this object and another object are equal.
 
@@ -135,34 +216,68 @@ class Condition(BaseModel):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
-        return self.key == other.key and self.operator == other.operator and self.values == other.values
+        if self is other:
+            return True
+        return (
+            self._hash == other._hash
+            and self.key == other.key
+            and self.operator == other.operator
+            and self._values == other._values
+        )
 
     def __repr__(self) -> str:
         """Return an instantiable representation of the object."""
         return (
-            f"{self.__class__.__name__}(" f"key='{self.key}', " f"operator='{self.operator}', " f"values={self.values})"
+            f"{self.__class__.__name__}("
+            f"key='{self.key}', "
+            f"operator='{self.operator}', "
+            f"values={list(self._values)})"
         )
 
     def __hash__(self) -> int:
         """Return a hash representation of this object."""
-        return hash((self.key, self.operator, tuple(self.values)))
+        return self._hash
 
     def __str__(self) -> str:
         """Return a string representation of this object."""
-        return f"{self.key} {self.operator} {self.values}"
+        return f"{self.key} {self.operator} {list(self._values)}"
+
+
+class EffectiveCondition:
+    """A pair of sets for inclusions and exclusion conditions.
 
+    EffectiveConditions are immutable and hash-consed, creating an EffectiveCondition that is identical to one
+    that already exists returns the existing object. Each one caches its hash, its reverse and the results of
+    recent unions and intersections.
+    """
 
-class EffectiveCondition(BaseModel):
-    """A pair of sets for inclusions and exclusion conditions."""
+    __slots__ = (
+        "inclusions",
+        "exclusions",
+        "_hash",
+        "_exact",
+        "_reverse",
+        "_unions",
+        "_intersections",
+        "__weakref__",
+    )
 
     #: Conditions which must be met
     inclusions: FrozenSet[Condition]
     #: Conditions which must NOT be met
     exclusions: FrozenSet[Condition]
-
-    def __init__(
-        self, inclusions: Optional[FrozenSet[Condition]] = None, exclusions: Optional[FrozenSet[Condition]] = None
-    ) -> None:
+    _hash: int
+    #: The inclusions and exclusions as case sensitive values.
+    _exact: Tuple[FrozenSet, FrozenSet]
+    _reverse: Optional["EffectiveCondition"]
+    _unions: Dict["EffectiveCondition", Tuple["EffectiveCondition", "EffectiveCondition"]]
+    _intersections: Dict["EffectiveCondition", Tuple["EffectiveCondition", "EffectiveCondition"]]
+
+    _instances: "WeakValueDictionary[Tuple[FrozenSet, FrozenSet], EffectiveCondition]" = WeakValueDictionary()
+
+    def __new__(
+        cls, inclusions: Optional[FrozenSet[Condition]] = None, exclusions: Optional[FrozenSet[Condition]] = None
+    ) -> "EffectiveCondition":
         """Convert ``exclusions`` to ``inclusions`` if possible.
 
         The only type of Condition that really exists in AWS policies is the ``inclusions``. The ``exclusions`` are
@@ -173,15 +288,49 @@ class EffectiveCondition(BaseModel):
             inclusions: The conditions that must be met.
             exclusions: The conditions that must NOT be met.
         """
-        normalised_inclusions = set(inclusions or {})
-        normalised_exclusions = set()
+        normalised_inclusions = frozenset(inclusions or ())
+        normalised_exclusions = frozenset(exclusions or ())
+        reversible = [exclusion for exclusion in normalised_exclusions if exclusion.operator in OPERATOR_REVERSAL_INDEX]
+        if reversible:
+            normalised_inclusions = normalised_inclusions.union(exclusion.reverse for exclusion in reversible)
+            normalised_exclusions = normalised_exclusions.difference(reversible)
+        return cls._from_normalised(normalised_inclusions, normalised_exclusions)
+
+    @classmethod
+    def _from_normalised(
+        cls, inclusions: FrozenSet[Condition], exclusions: FrozenSet[Condition]
+    ) -> "EffectiveCondition":
+        """Return the EffectiveCondition for inclusions and exclusions that are already normalised.
+
+        Parameters:
+            inclusions: The conditions that must be met.
+            exclusions: The conditions that must NOT be met, none of which can be reversed.
+        """
+        key = (_exact_conditions(inclusions), _exact_conditions(exclusions))
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = object.__new__(cls)
+            object.__setattr__(instance, "inclusions", inclusions)
+            object.__setattr__(instance, "exclusions", exclusions)
+            object.__setattr__(instance, "_hash", hash((inclusions, exclusions)))
+            object.__setattr__(instance, "_exact", key)
+            object.__setattr__(instance, "_reverse", None)
+            object.__setattr__(instance, "_unions", {})
+            object.__setattr__(instance, "_intersections", {})
+            cls._instances[key] = instance
+        return instance
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Prevent modification of this object.
+
+        Parameters:
+            name: The name of the attribute.
+            value: The value of the attribute.
 
-        for exclusion in exclusions or {}:
-            try:
-                normalised_inclusions.add(exclusion.reverse)
-            except ValueError:
-                normalised_exclusions.add(exclusion)
-        super().__init__(inclusions=frozenset(normalised_inclusions), exclusions=frozenset(normalised_exclusions))
+        Raises:
+            AttributeError: EffectiveConditions are immutable.
+        """
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
 
     def intersection(self, other: object) -> "EffectiveCondition":
         """Calculate the intersection between this object and another object of the same type.
@@ -194,11 +343,14 @@ class EffectiveCondition(BaseModel):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot intersect {self.__class__.__name__} with {other.__class__.__name__}")
-
-        return self.__class__(
-            inclusions=self.inclusions.intersection(other.inclusions),
-            exclusions=self.exclusions.intersection(other.exclusions),
+        cached = self._intersections.get(other)
+        if cached is not None and cached[0] is other:
+            return cached[1]
+        result = self._from_normalised(
+            self.inclusions.intersection(other.inclusions), self.exclusions.intersection(other.exclusions)
         )
+        _cache_result(self._intersections, other, result)
+        return result
 
     def union(self, other: object) -> "EffectiveCondition":
         """Combine this object with another object of the same type.
@@ -211,26 +363,33 @@ class EffectiveCondition(BaseModel):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot union {self.__class__.__name__} with {other.__class__.__name__}")
-
-        return self.__class__(self.inclusions.union(other.inclusions), self.exclusions.union(other.exclusions))
+        cached = self._unions.get(other)
+        if cached is not None and cached[0] is other:
+            return cached[1]
+        result = self._from_normalised(self.inclusions.union(other.inclusions), self.exclusions.union(other.exclusions))
+        _cache_result(self._unions, other, result)
+        return result
 
     @property
     def reverse(self) -> "EffectiveCondition":
         """Reverse the effect of this EffectiveCondition."""
-        return self.__class__(
-            inclusions=self.exclusions,
-            exclusions=self.inclusions,
-        )
+        if self._reverse is None:
+            object.__setattr__(
+                self,
+                "_reverse",
+                self.__class__(
+                    inclusions=self.exclusions,
+                    exclusions=self.inclusions,
+                ),
+            )
+        return self._reverse  # type: ignore[return-value]
 
     def dict(self, *args, **kwargs) -> Dict[str, Any]:
         """Convert instance to dict representation of it.
 
         Parameters:
-            *args: Arguments to Pydantic dict method.
-            **kwargs: Arguments to Pydantic dict method.
-
-        Overridden from BaseModel so that when converting conditions to dict they don't suffer from being unhashable
-        when placed in a set.
+            *args: Accepted for compatibility with Pydantic's dict method.
+            **kwargs: Accepted for compatibility with Pydantic's dict method.
         """
         result = {}
         for key, value in self:
@@ -239,9 +398,71 @@ class EffectiveCondition(BaseModel):
 
         return result
 
-    def _iter(self, *args, **kwargs) -> Iterator[Tuple[str, Any]]:  # type: ignore[override]
-        for key, value in self.dict(*args, **kwargs).items():
-            yield key, value
+    def json(self, *args, **kwargs) -> str:
+        """Return a JSON representation of this object.
+
+        Parameters:
+            *args: Accepted for compatibility with Pydantic's json method.
+            **kwargs: Keyword arguments passed on to :func:`json.dumps`.
+        """
+        fields = self.dict(exclude_defaults=kwargs.pop("exclude_defaults", False))
+        return json.dumps({key: [condition.dict() for condition in value] for key, value in fields.items()}, **kwargs)
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable]:
+        """Allow Pydantic models to have EffectiveCondition fields."""
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: object) -> "EffectiveCondition":
+        """Return an EffectiveCondition from an EffectiveCondition or a dictionary of its fields.
+
+        Parameters:
+            value: The value to validate.
+
+        Raises:
+            ValueError: If the value cannot be converted to an EffectiveCondition.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        raise ValueError(f"Cannot convert {value.__class__.__name__} to {cls.__name__}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle using the fields so the cached hash is recomputed when unpickled."""
+        return (self.__class__, (self.inclusions, self.exclusions))
+
+    def __iter__(self) -> Iterator[Tuple[str, FrozenSet[Condition]]]:
+        """Iterate over the field names and values of this object."""
+        yield "inclusions", self.inclusions
+        yield "exclusions", self.exclusions
+
+    def __eq__(self, other: object) -> bool:
+        """Determine whether this object and another object are equal.
+
+        Parameters:
+            other: The object to compare this one to.
+
+        Raises:
+            ValueError: When the object we are compared with is not of the same type.
+        """
+        if not isinstance(other, self.__class__):
+            raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
+        if self is other:
+            return True
+        return (
+            self._hash == other._hash and self.inclusions == other.inclusions and self.exclusions == other.exclusions
+        )
+
+    def __hash__(self) -> int:
+        """Return a hash representation of this object."""
+        return self._hash
+
+    @property
+    def memo_key(self) -> Tuple[FrozenSet, FrozenSet]:
+        """Return a key which, unlike equality, distinguishes conditions whose keys or operators differ in case."""
+        return self._exact
 
     def __bool__(self) -> bool:
         """Return True if this object contains any values."""
@@ -256,6 +477,41 @@ class EffectiveCondition(BaseModel):
         return repr(self)
 
 
+#: The number of union and intersection results each EffectiveCondition keeps.
+EFFECTIVE_CONDITION_CACHE_SIZE = 32
+
+
+def _exact_conditions(conditions: FrozenSet[Condition]) -> FrozenSet:
+    """Return a case sensitive representation of conditions for hash-consing.
+
+    Conditions compare their keys and operators case insensitively, but identical EffectiveConditions must also
+    preserve the case they were created with.
+
+    Parameters:
+        conditions: The conditions to represent.
+    """
+    if not conditions:
+        return conditions
+    return frozenset(condition._exact for condition in conditions)
+
+
+def _cache_result(
+    cache: Dict[EffectiveCondition, Tuple[EffectiveCondition, EffectiveCondition]],
+    other: EffectiveCondition,
+    result: EffectiveCondition,
+) -> None:
+    """Cache the result of an operation with ``other``, clearing the cache when it is full.
+
+    Parameters:
+        cache: The cache to store the result in.
+        other: The other operand, stored alongside the result so that lookups can check it is the same object.
+        result: The result of the operation.
+    """
+    if len(cache) >= EFFECTIVE_CONDITION_CACHE_SIZE:
+        cache.clear()
+    cache[other] = (other, result)
+
+
 class RawConditionCollection(Dict[ConditionKey, Dict[ConditionOperator, List[ConditionValue]]]):
     """A representation of a statement condition."""
 
@@ -0,0 +1,216 @@
+"""Answer whether a policy allows a single action on a single resource for a single principal."""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union, cast
+
+from .action_matcher import ShardActionMatcher
+from .policy import Policy
+from .policy_shard import PolicyShard, policy_shards_effect
+from .principal import Principal, PrincipalType, PrincipalValue
+from .resource import Resource
+from .shard_index import ResourceIndex
+
+
+class Decision(NamedTuple):
+    """The outcome of a query against a :class:`CompiledPolicy`."""
+
+    #: Whether a shard without conditions allows the request.
+    allowed: bool
+    #: Whether the request is only allowed by shards with conditions, which the query cannot resolve.
+    conditional: bool
+    #: The shards which allow the request, with or without conditions.
+    shards: List[PolicyShard]
+
+
+class BatchDecisions(NamedTuple):
+    """The outcomes of a batch of queries against a :class:`CompiledPolicy`, as one column per field of Decision."""
+
+    #: :attr:`Decision.allowed` for each request.
+    allowed: List[bool]
+    #: :attr:`Decision.conditional` for each request.
+    conditional: List[bool]
+    #: :attr:`Decision.shards` for each request.
+    shards: List[List[PolicyShard]]
+
+
+def _as_principal(principal: Union[str, Principal]) -> Principal:
+    """Return ``principal`` as a Principal, treating a string as an ``AWS`` principal.
+
+    Parameters:
+        principal: The principal of a request.
+    """
+    if isinstance(principal, Principal):
+        return principal
+    return Principal(PrincipalType("AWS"), PrincipalValue(principal))
+
+
+class CompiledPolicy:
+    """Indexes the effective shards of a policy to answer point queries without comparing every shard.
+
+    The action of a query is matched with a :class:`~policyglass.action_matcher.ShardActionMatcher`, and its resource
+    with a :class:`~policyglass.shard_index.ResourceIndex` of the resource inclusions and another of the exclusions.
+    Only the shards matched by both have their principal checked.
+
+    Example:
+        Check whether a policy allows a request.
+
+            >>> from policyglass import Policy
+            >>> from policyglass.decision import CompiledPolicy
+            >>> policy = Policy(**{"Statement": [
+            ...     {"Effect": "Allow", "Action": "s3:*", "Resource": "arn:aws:s3:::bucket/*"},
+            ...     {"Effect": "Deny", "Action": "s3:Delete*", "Resource": "*",
+            ...         "Condition": {"Bool": {"aws:MultiFactorAuthPresent": "false"}}},
+            ... ]})
+            >>> compiled = CompiledPolicy.from_policy(policy)
+            >>> compiled.is_allowed("s3:GetObject", "arn:aws:s3:::bucket/key")
+            True
+            >>> decision = compiled.decide("s3:DeleteObject", "arn:aws:s3:::bucket/key")
+            >>> decision.allowed, decision.conditional
+            (False, True)
+    """
+
+    def __init__(self, effect_shards: Iterable[PolicyShard]) -> None:
+        """Index ``effect_shards``.
+
+        Parameters:
+            effect_shards: The output of :func:`~policyglass.policy_shard.policy_shards_effect`.
+
+        Raises:
+            ValueError: If any of the shards is a Deny, as denies must already have been subtracted.
+        """
+        self.shards: List[PolicyShard] = list(effect_shards)
+        if any(shard.effect != "Allow" for shard in self.shards):
+            raise ValueError("Cannot compile Deny shards, pass the output of policy_shards_effect instead.")
+        self._actions = ShardActionMatcher(self.shards)
+        self._resources = ResourceIndex()
+        self._resource_exclusions = ResourceIndex()
+        for position, shard in enumerate(self.shards):
+            self._resources.add(shard.effective_resource.inclusion, position)
+            for exclusion in shard.effective_resource.exclusions:
+                self._resource_exclusions.add(exclusion, position)
+
+    @classmethod
+    def from_policy(cls, policy: Policy) -> "CompiledPolicy":
+        """Compile the effect of ``policy``.
+
+        Parameters:
+            policy: The policy to compile.
+        """
+        return cls(policy_shards_effect(policy.policy_shards))
+
+    def decide(
+        self, action: str, resource: Union[str, Resource] = "*", principal: Optional[Union[str, Principal]] = None
+    ) -> Decision:
+        """Return the shards which allow ``principal`` to perform ``action`` on ``resource``.
+
+        Parameters:
+            action: The action requested, e.g. ``s3:GetObject``.
+            resource: The ARN of the resource requested.
+            principal: The principal making the request, a string is treated as an ``AWS`` principal.
+                Defaults to None, which skips the principal check so that shards allowing any principal match.
+                This is not the same as ``Principal("AWS", "*")``, which is only allowed by shards that allow everyone.
+        """
+        positions = self._actions.matching_shards(action)
+        if positions:
+            resource_positions = self._resource_positions(resource)
+            positions = tuple(position for position in positions if position in resource_positions)
+        if positions and principal is not None:
+            principal = _as_principal(principal)
+            positions = tuple(
+                position for position in positions if principal in self.shards[position].effective_principal
+            )
+        return self._decision(positions)
+
+    def decide_batch(
+        self,
+        actions: Iterable[str],
+        resources: Optional[Iterable[Union[str, Resource]]] = None,
+        principals: Optional[Iterable[Optional[Union[str, Principal]]]] = None,
+    ) -> BatchDecisions:
+        """Decide a batch of requests given as columns of actions, resources and principals.
+
+        Work is shared between requests rather than repeated for each one. Identical requests are decided once,
+        each distinct action and resource is looked up in the indexes once, and each distinct principal is only
+        checked once against each shard.
+
+        Parameters:
+            actions: The action of each request. Any iterable of strings, including a NumPy array of strings.
+            resources: The resource of each request, defaults to ``*`` for every request.
+            principals: The principal of each request, defaults to None for every request. A principal of None skips
+                the principal check as in :meth:`decide`.
+
+        Raises:
+            ValueError: If the columns are not the same length.
+        """
+        action_column = list(actions)
+        resource_column = list(resources) if resources is not None else ["*"] * len(action_column)
+        principal_column = list(principals) if principals is not None else [None] * len(action_column)
+        if not len(action_column) == len(resource_column) == len(principal_column):
+            raise ValueError("Cannot decide a batch whose columns are not the same length.")
+
+        action_positions: Dict[str, Tuple[int, ...]] = {}
+        resource_positions: Dict[Union[str, Resource], Set[int]] = {}
+        principal_matches: Dict[Tuple[Union[str, Principal], int], bool] = {}
+        decisions: Dict[Tuple, Decision] = {}
+        result = BatchDecisions(allowed=[], conditional=[], shards=[])
+        for request in zip(action_column, resource_column, principal_column):
+            decision = decisions.get(request)
+            if decision is None:
+                action, resource, principal = request
+                positions = action_positions.get(action)
+                if positions is None:
+                    positions = action_positions[action] = self._actions.matching_shards(action)
+                if positions:
+                    matched_resources = resource_positions.get(resource)
+                    if matched_resources is None:
+                        matched_resources = resource_positions[resource] = self._resource_positions(resource)
+                    positions = tuple(position for position in positions if position in matched_resources)
+                if principal is not None:
+                    matched = []
+                    for position in positions:
+                        key = (principal, position)
+                        if key not in principal_matches:
+                            principal_matches[key] = (
+                                _as_principal(principal) in self.shards[position].effective_principal
+                            )
+                        if principal_matches[key]:
+                            matched.append(position)
+                    positions = tuple(matched)
+                decision = decisions[request] = self._decision(positions)
+            result.allowed.append(decision.allowed)
+            result.conditional.append(decision.conditional)
+            result.shards.append(decision.shards)
+        return result
+
+    def _resource_positions(self, resource: Union[str, Resource]) -> Set[int]:
+        """Return the positions of the shards whose EffectiveResource contains ``resource``.
+
+        Parameters:
+            resource: The resource requested.
+        """
+        if not isinstance(resource, Resource):
+            resource = Resource(resource)
+        positions = cast(Set[int], self._resources.containing(resource))
+        positions -= self._resource_exclusions.containing(resource)
+        return positions
+
+    def _decision(self, positions: Tuple[int, ...]) -> Decision:
+        """Return the Decision for a request allowed by the shards at ``positions``.
+
+        Parameters:
+            positions: The positions of the shards which allow the request.
+        """
+        shards = [self.shards[position] for position in positions]
+        allowed = any(not shard.effective_condition for shard in shards)
+        return Decision(allowed=allowed, conditional=bool(shards) and not allowed, shards=shards)
+
+    def is_allowed(
+        self, action: str, resource: Union[str, Resource] = "*", principal: Optional[Union[str, Principal]] = None
+    ) -> bool:
+        """Whether ``principal`` may perform ``action`` on ``resource`` without relying on any conditions.
+
+        Parameters:
+            action: The action requested, e.g. ``s3:GetObject``.
+            resource: The ARN of the resource requested.
+            principal: The principal making the request, a string is treated as an ``AWS`` principal.
+                Defaults to None, which skips the principal check as in :meth:`decide`.
+        """
+        return self.decide(action, resource, principal).allowed
@@ -1,6 +1,8 @@
 """Parent class for EffectiveAction, EffectiveResource, EffectivePrincipal."""
-from typing import Any, Callable, Dict, FrozenSet, Generic, Iterator, List, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, FrozenSet, Generic, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
+from .memo import memoised
+from .models import CaseInsensitiveString
 from .protocols import ARPProtocol
 
 T = TypeVar("T", bound=ARPProtocol)
@@ -11,6 +13,8 @@ class EffectiveARP(Generic[T]):
 
     The allowed actions is the difference (subtraction) of the excluded ARPs
     from the included ARP.
+
+    EffectiveARPs are immutable so that their hash can be cached.
     """
 
     #: Inclusion must be a superset of any exclusions
@@ -22,9 +26,12 @@ class EffectiveARP(Generic[T]):
     #: The type of ARP we're subclassed for.
     _arp_type: Type[T]
 
+    _hash: Optional[int] = None
+    _memo_key: Optional[Tuple[object, FrozenSet[object]]] = None
+
     def __init__(self, inclusion: T, exclusions: Optional[FrozenSet[T]] = None) -> None:
-        self.inclusion = inclusion
-        self.exclusions = exclusions or frozenset()
+        object.__setattr__(self, "inclusion", inclusion)
+        object.__setattr__(self, "exclusions", exclusions or frozenset())
         if not all([isinstance(arp, self._arp_type) for arp in [self.inclusion, *self.exclusions]]):
             raise ValueError(f"All inclusions and exclusions must be type {self._arp_type.__name__}")
         if not (all(exclusion < self.inclusion for exclusion in self.exclusions)):
@@ -48,6 +55,7 @@ class EffectiveARP(Generic[T]):
             return [self]
         return [self, other]
 
+    @memoised
     def difference(self, other: object) -> List["EffectiveARP[T]"]:
         """Calculate the difference between this and another object of the same type.
 
@@ -86,6 +94,7 @@ class EffectiveARP(Generic[T]):
         new_others = [self.__class__.factory(other_exclusion) for other_exclusion in other.exclusions]
         return [arp for arp in [new_self, *new_others] if arp is not None]
 
+    @memoised
     def intersection(self, other: object) -> Optional["EffectiveARP[T]"]:
         """Calculate the intersection between this object and another object of the same type.
 
@@ -130,6 +139,7 @@ class EffectiveARP(Generic[T]):
 
         return other_with_self_exclusions_added
 
+    @memoised
     def issubset(self, other: object) -> bool:
         """Whether this object contains all the elements of another object (i.e. is a subset of the other object).
 
@@ -210,8 +220,50 @@ class EffectiveARP(Generic[T]):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
+        if self is other:
+            return True
         return self.inclusion == other.inclusion and self.exclusions == other.exclusions
 
+    def __hash__(self) -> int:
+        """Return a hash of the inclusion and exclusions of this object."""
+        cached_hash = self._hash
+        if cached_hash is None:
+            cached_hash = hash(self.canonical_key)
+            object.__setattr__(self, "_hash", cached_hash)
+        return cached_hash
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Prevent modification of this object.
+
+        Parameters:
+            name: The name of the attribute.
+            value: The value of the attribute.
+
+        Raises:
+            AttributeError: EffectiveARPs are immutable.
+        """
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state to pickle, without the cached hash as string hashes differ between processes."""
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
+
+    @property
+    def canonical_key(self) -> Tuple[T, FrozenSet[T]]:
+        """Return a key which is equal for equal objects regardless of the order the exclusions were given in."""
+        return (self.inclusion, self.exclusions)
+
+    @property
+    def memo_key(self) -> Tuple[object, FrozenSet[object]]:
+        """Return a key which, unlike :attr:`canonical_key`, distinguishes ARPs that differ only in case."""
+        memo_key = self._memo_key
+        if memo_key is None:
+            memo_key = (_exact_arp(self.inclusion), frozenset(_exact_arp(exclusion) for exclusion in self.exclusions))
+            object.__setattr__(self, "_memo_key", memo_key)
+        return memo_key
+
     def __lt__(self, other: object) -> bool:
         """Whether this object is a proper subset of another object.
 
@@ -262,3 +314,14 @@ class EffectiveARP(Generic[T]):
         We just need Pydantic to accept this as a valid type to populate in PolicyShard.
         """
         yield lambda x: x
+
+
+def _exact_arp(arp: ARPProtocol) -> object:
+    """Return ``arp`` as a value which compares case sensitively.
+
+    Parameters:
+        arp: The ARP to represent.
+    """
+    if isinstance(arp, CaseInsensitiveString):
+        return str(arp)
+    return arp
@@ -0,0 +1,177 @@
+"""Incrementally maintained effect of a list of statements."""
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .policy import Policy
+from .policy_shard import PolicyShard, _subtract_deny_shards, dedupe_policy_shards
+from .shard_index import PolicyShardIndex
+from .statement import Statement
+
+
+class _AllowShardResult(NamedTuple):
+    """What remains of an allow shard after the deny shards are subtracted from it."""
+
+    #: The allow shard.
+    shard: PolicyShard
+    #: The shards that remain of the allow shard.
+    result: List[PolicyShard]
+    #: Every candidate derived from the allow shard while subtracting the deny shards.
+    trace: List[PolicyShard]
+
+
+class EffectEngine:
+    """Maintains the effect of a list of statements as statements are added, removed and replaced.
+
+    The result of subtracting the deny shards from each allow shard is kept along with every intermediate candidate
+    it went through. When deny statements change, only allow shards with a candidate that could intersect one of the
+    changed deny shards are recalculated. Any other allow shard would skip the changed deny shards entirely, so its
+    result cannot change. Changing an allow statement only calculates the shards of that statement.
+
+    The combined result is deduplicated with :func:`~policyglass.policy_shard.dedupe_policy_shards` when
+    :attr:`effect` is next accessed, so :attr:`effect` always equals
+    :func:`~policyglass.policy_shard.policy_shards_effect` of the current statements' shards.
+
+    Example:
+        Update the effect of a policy as its statements change.
+
+            >>> from policyglass import Statement, explain_policy_shards
+            >>> from policyglass.engine import EffectEngine
+            >>> engine = EffectEngine([Statement(Effect="Allow", Action="s3:*", Resource="*")])
+            >>> engine.add_statement(Statement(Effect="Deny", Action="s3:Get*", Resource="*"))
+            >>> explain_policy_shards(engine.effect)
+            ['Allow action s3:* (except for s3:Get*) on resource * with principal AWS *.']
+            >>> engine.replace_statement(1, Statement(Effect="Deny", Action="s3:Put*", Resource="*"))
+            >>> explain_policy_shards(engine.effect)
+            ['Allow action s3:* (except for s3:Put*) on resource * with principal AWS *.']
+    """
+
+    def __init__(self, statements: Iterable[Statement] = ()) -> None:
+        """Initialise the engine with ``statements``.
+
+        Parameters:
+            statements: The statements to calculate the effect of.
+        """
+        self._statements: List[Statement] = list(statements)
+        self._shards: List[List[PolicyShard]] = [statement.policy_shards for statement in self._statements]
+        self._results: List[List[Optional[_AllowShardResult]]] = [[None] * len(shards) for shards in self._shards]
+        self._effect: Optional[List[PolicyShard]] = None
+        self._recalculate(
+            [
+                (position, shard_position)
+                for position, shards in enumerate(self._shards)
+                for shard_position, shard in enumerate(shards)
+                if shard.effect == "Allow"
+            ]
+        )
+
+    @classmethod
+    def from_policy(cls, policy: Policy) -> "EffectEngine":
+        """Return an engine for the statements of ``policy``.
+
+        Parameters:
+            policy: The policy to calculate the effect of.
+        """
+        return cls(policy.statement)
+
+    @property
+    def statements(self) -> List[Statement]:
+        """Return the current statements."""
+        return list(self._statements)
+
+    @property
+    def allow_shards(self) -> List[PolicyShard]:
+        """Return the allow shards of the current statements."""
+        return [shard for shards in self._shards for shard in shards if shard.effect == "Allow"]
+
+    @property
+    def deny_shards(self) -> List[PolicyShard]:
+        """Return the deny shards of the current statements."""
+        return [shard for shards in self._shards for shard in shards if shard.effect == "Deny"]
+
+    @property
+    def effect(self) -> List[PolicyShard]:
+        """Return the effect of the current statements."""
+        if self._effect is None:
+            self._effect = dedupe_policy_shards(
+                [shard for results in self._results for result in results if result for shard in result.result]
+            )
+        return list(self._effect)
+
+    def add_statement(self, statement: Statement, index: Optional[int] = None) -> None:
+        """Add a statement, at the end or before ``index``.
+
+        Parameters:
+            statement: The statement to add.
+            index: The position to insert the statement at, as with :meth:`list.insert`.
+        """
+        if index is None:
+            index = len(self._statements)
+        elif index < 0:
+            index = max(0, index + len(self._statements))
+        self._replace(min(index, len(self._statements)), 0, [statement])
+
+    def remove_statement(self, index: int) -> Statement:
+        """Remove and return the statement at ``index``.
+
+        Parameters:
+            index: The position of the statement to remove.
+        """
+        statement = self._statements[index]
+        self._replace(index % len(self._statements), 1, [])
+        return statement
+
+    def replace_statement(self, index: int, statement: Statement) -> None:
+        """Replace the statement at ``index`` with ``statement``.
+
+        Parameters:
+            index: The position of the statement to replace.
+            statement: The statement to replace it with.
+
+        Raises:
+            IndexError: If there is no statement at ``index``.
+        """
+        if not -len(self._statements) <= index < len(self._statements):
+            raise IndexError("statement index out of range")
+        self._replace(index % len(self._statements), 1, [statement])
+
+    def _replace(self, index: int, count: int, statements: Sequence[Statement]) -> None:
+        """Replace ``count`` statements at ``index`` with ``statements`` and recalculate the affected allow shards.
+
+        Parameters:
+            index: The position of the first statement to replace.
+            count: The number of statements to replace.
+            statements: The statements to insert in their place.
+        """
+        end = index + count
+        new_shards = [statement.policy_shards for statement in statements]
+        changed_shards = [shard for shards in self._shards[index:end] for shard in shards]
+        changed_shards.extend(shard for shards in new_shards for shard in shards)
+
+        self._statements[index:end] = statements
+        self._shards[index:end] = new_shards
+        self._results[index:end] = [[None] * len(shards) for shards in new_shards]
+        self._effect = None
+
+        changed_denies = PolicyShardIndex(shard for shard in changed_shards if shard.effect == "Deny")
+        stale = []
+        for position, results in enumerate(self._results):
+            for shard_position, result in enumerate(results):
+                if self._shards[position][shard_position].effect != "Allow":
+                    continue
+                if result is None or (
+                    len(changed_denies)
+                    and any(changed_denies.comparable_positions(candidate) for candidate in result.trace)
+                ):
+                    stale.append((position, shard_position))
+        self._recalculate(stale)
+
+    def _recalculate(self, stale: List[Tuple[int, int]]) -> None:
+        """Recalculate the results of the allow shards at each (statement position, shard position) in ``stale``.
+
+        Parameters:
+            stale: The positions of the allow shards to recalculate.
+        """
+        allow_shards = [self._shards[position][shard_position] for position, shard_position in stale]
+        traces: List[List[PolicyShard]] = []
+        results = _subtract_deny_shards(allow_shards, self.deny_shards, traces)
+        for (position, shard_position), shard, result, trace in zip(stale, allow_shards, results, traces):
+            self._results[position][shard_position] = _AllowShardResult(shard, result, trace)
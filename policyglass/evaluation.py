@@ -0,0 +1,283 @@
+"""Combine the effects of the identity, resource, SCP and permissions boundary policies that apply to a principal.
+
+The effect of each policy is cached by a hash of its content in an :class:`EffectCache`, so a policy shared by many
+principals, such as a Service Control Policy, is only sharded and deduplicated once. The combined effect of a set of
+guardrail policies (SCPs and a permissions boundary) is cached in the same way.
+
+This is a simplified model of IAM policy evaluation:
+
+* Access is granted by the identity policies and resource policies.
+* An explicit deny in any identity or resource policy removes access granted by any of them.
+* Access must also be allowed by every SCP and by the permissions boundary if there is one.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+from .memo import memo_scope
+from .policy import Policy
+from .policy_shard import (
+    PolicyShard,
+    _copy_policy_shards,
+    _subtract_deny_shards,
+    dedupe_policy_shards,
+    policy_shards_effect,
+)
+from .shard_index import PolicyShardIndex
+
+#: The default maximum number of entries kept by an EffectCache.
+EFFECT_CACHE_SIZE = 1024
+
+
+def policy_content_hash(policy: Policy) -> str:
+    """Return a SHA-256 hash of the JSON of ``policy``.
+
+    Parameters:
+        policy: The policy to hash.
+    """
+    return hashlib.sha256(policy.policy_json().encode("utf-8")).hexdigest()
+
+
+@memo_scope()
+def intersect_policy_shards(shards: Sequence[PolicyShard], other_shards: Sequence[PolicyShard]) -> List[PolicyShard]:
+    """Return the Allow shards allowed by both ``shards`` and ``other_shards``.
+
+    Each pair of shards whose EffectiveARPs intersect gives a shard of the intersections, which only applies if the
+    conditions of both shards are met.
+
+    Parameters:
+        shards: Allow shards, e.g. the effect of an identity policy.
+        other_shards: Allow shards to restrict them to, e.g. the effect of an SCP.
+
+    Raises:
+        ValueError: If any of the shards is a Deny.
+
+    Example:
+        Restrict the effect of a policy to the effect of an SCP.
+
+            >>> from policyglass import Policy, explain_policy_shards, policy_shards_effect
+            >>> from policyglass.evaluation import intersect_policy_shards
+            >>> identity = Policy(**{"Statement": [{"Effect": "Allow", "Action": ["s3:*", "ec2:*"], "Resource": "*"}]})
+            >>> scp = Policy(**{"Statement": [
+            ...     {"Effect": "Allow", "Action": "*", "Resource": "*"},
+            ...     {"Effect": "Deny", "Action": "ec2:*", "Resource": "*"},
+            ... ]})
+            >>> explain_policy_shards(
+            ...     intersect_policy_shards(
+            ...         policy_shards_effect(identity.policy_shards), policy_shards_effect(scp.policy_shards)
+            ...     )
+            ... )
+            ['Allow action s3:* on resource * with principal AWS *.']
+    """
+    if any(shard.effect != "Allow" for shards_list in (shards, other_shards) for shard in shards_list):
+        raise ValueError("Cannot intersect Deny shards, pass the output of policy_shards_effect instead.")
+    other_index = PolicyShardIndex(other_shards)
+    result = []
+    for shard in shards:
+        for other in other_index.comparable_candidates(shard):
+            effective_action = shard.effective_action.intersection(other.effective_action)
+            if not effective_action:
+                continue
+            effective_resource = shard.effective_resource.intersection(other.effective_resource)
+            if not effective_resource:
+                continue
+            effective_principal = shard.effective_principal.intersection(other.effective_principal)
+            if not effective_principal:
+                continue
+            result.append(
+                PolicyShard._construct(
+                    effect="Allow",
+                    effective_action=effective_action,
+                    effective_resource=effective_resource,
+                    effective_principal=effective_principal,
+                    effective_condition=shard.effective_condition.union(other.effective_condition),
+                )
+            )
+    return dedupe_policy_shards(result)
+
+
+class EffectCache:
+    """A least recently used cache of policy effects, keyed by :func:`policy_content_hash`.
+
+    Share one cache between the :class:`EvaluationContext` of every principal so that common policies are only
+    evaluated once.
+    """
+
+    def __init__(self, maxsize: Optional[int] = EFFECT_CACHE_SIZE) -> None:
+        """Initialise an empty cache.
+
+        Parameters:
+            maxsize: The maximum number of entries to keep, or None for no limit.
+        """
+        self.maxsize = maxsize
+        #: The number of lookups which found an entry.
+        self.hits = 0
+        #: The number of lookups which had to calculate an entry.
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Tuple[PolicyShard, ...]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return len(self._entries)
+
+    def effect(self, policy: Policy) -> Tuple[PolicyShard, ...]:
+        """Return the :func:`~policyglass.policy_shard.policy_shards_effect` of ``policy``.
+
+        Parameters:
+            policy: The policy to get the effect of.
+        """
+        return self._get(
+            ("effect", policy_content_hash(policy)), lambda: tuple(policy_shards_effect(policy.policy_shards))
+        )
+
+    def deny_shards(self, policy: Policy) -> Tuple[PolicyShard, ...]:
+        """Return the Deny shards of ``policy``.
+
+        Parameters:
+            policy: The policy to get the Deny shards of.
+        """
+        return self._get(
+            ("deny", policy_content_hash(policy)),
+            lambda: tuple(shard for shard in policy.policy_shards if shard.effect == "Deny"),
+        )
+
+    def intersection(self, policies: Sequence[Policy]) -> Tuple[PolicyShard, ...]:
+        """Return the shards allowed by the effects of all of ``policies``, in the order given.
+
+        Parameters:
+            policies: The policies to intersect, there must be at least one.
+        """
+        if len(policies) == 1:
+            return self.effect(policies[0])
+        hashes = tuple(policy_content_hash(policy) for policy in policies)
+
+        def calculate() -> Tuple[PolicyShard, ...]:
+            return tuple(intersect_policy_shards(self.intersection(policies[:-1]), self.effect(policies[-1])))
+
+        return self._get(("intersection", hashes), calculate)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def _get(self, key: Tuple, calculate: Callable[[], Tuple[PolicyShard, ...]]) -> Tuple[PolicyShard, ...]:
+        """Return the entry for ``key``, calculating and storing it if it is missing.
+
+        Parameters:
+            key: The key of the entry.
+            calculate: Returns the value of the entry if it is missing.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[key] = calculate()
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+
+#: The cache used by EvaluationContexts which are not given one.
+default_effect_cache = EffectCache()
+
+
+class EvaluationContext:
+    """The policies that apply to a principal, and their combined effect.
+
+    Example:
+        Combine an identity policy with an SCP.
+
+            >>> from policyglass import Policy, explain_policy_shards
+            >>> from policyglass.evaluation import EffectCache, EvaluationContext
+            >>> identity = Policy(**{"Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": "*"}]})
+            >>> scp = Policy(**{"Statement": [
+            ...     {"Effect": "Allow", "Action": "*", "Resource": "*"},
+            ...     {"Effect": "Deny", "Action": "s3:Delete*", "Resource": "*"},
+            ... ]})
+            >>> context = EvaluationContext(
+            ...     identity_policies=[identity], service_control_policies=[scp], cache=EffectCache()
+            ... )
+            >>> explain_policy_shards(context.effect)
+            ['Allow action s3:* (except for s3:Delete*) on resource * with principal AWS *.']
+    """
+
+    def __init__(
+        self,
+        identity_policies: Iterable[Policy] = (),
+        resource_policies: Iterable[Policy] = (),
+        service_control_policies: Iterable[Policy] = (),
+        permissions_boundary: Optional[Policy] = None,
+        cache: Optional[EffectCache] = None,
+    ) -> None:
+        """Initialise the context.
+
+        Parameters:
+            identity_policies: The policies attached to the principal.
+            resource_policies: The policies attached to the resources the principal accesses.
+            service_control_policies: The SCPs which apply to the principal's account, from the root down. Combine the
+                SCPs attached at the same level into one policy, as only one of them needs to allow a request.
+            permissions_boundary: The permissions boundary of the principal, if it has one.
+            cache: The cache of policy effects, defaults to :data:`default_effect_cache`.
+        """
+        self.identity_policies: List[Policy] = list(identity_policies)
+        self.resource_policies: List[Policy] = list(resource_policies)
+        self.service_control_policies: List[Policy] = list(service_control_policies)
+        self.permissions_boundary = permissions_boundary
+        self.cache = cache if cache is not None else default_effect_cache
+        self._effect: Optional[Tuple[Tuple, List[PolicyShard]]] = None
+
+    @property
+    def guardrail_policies(self) -> List[Policy]:
+        """Return the SCPs followed by the permissions boundary, which all must allow a request."""
+        policies = list(self.service_control_policies)
+        if self.permissions_boundary is not None:
+            policies.append(self.permissions_boundary)
+        return policies
+
+    @property
+    def effect(self) -> List[PolicyShard]:
+        """Return the Allow shards of the access granted by the context's policies.
+
+        The effect is recalculated if the policies, or their content, have changed since it was last returned.
+        """
+        key = self._content_key()
+        if self._effect is None or self._effect[0] != key:
+            self._effect = (key, self._calculate_effect())
+        return _copy_policy_shards(self._effect[1])
+
+    def _content_key(self) -> Tuple:
+        """Return the :func:`policy_content_hash` of each of the context's policies, grouped by their kind."""
+        return (
+            tuple(policy_content_hash(policy) for policy in self.identity_policies),
+            tuple(policy_content_hash(policy) for policy in self.resource_policies),
+            tuple(policy_content_hash(policy) for policy in self.service_control_policies),
+            policy_content_hash(self.permissions_boundary) if self.permissions_boundary is not None else None,
+        )
+
+    def _calculate_effect(self) -> List[PolicyShard]:
+        """Calculate the Allow shards of the access granted by the context's policies."""
+        granting_policies = self.identity_policies + self.resource_policies
+        deny_shards = [self.cache.deny_shards(policy) for policy in granting_policies]
+        grants: List[PolicyShard] = []
+        for position, policy in enumerate(granting_policies):
+            effect = list(self.cache.effect(policy))
+            # A policy's effect already excludes its own denies, so only the other policies' denies are applied.
+            other_denies = [
+                shard
+                for other_position, shards in enumerate(deny_shards)
+                if other_position != position
+                for shard in shards
+            ]
+            if other_denies:
+                effect = [shard for shards in _subtract_deny_shards(effect, other_denies) for shard in shards]
+            grants.extend(effect)
+        if len(granting_policies) > 1:
+            grants = dedupe_policy_shards(grants)
+
+        guardrail_policies = self.guardrail_policies
+        if guardrail_policies and grants:
+            grants = intersect_policy_shards(grants, self.cache.intersection(guardrail_policies))
+        return grants
@@ -0,0 +1,97 @@
+"""Compiled wildcard matching for IAM patterns.
+
+IAM only understands two wildcards, ``*`` (any sequence of characters) and ``?`` (any single character).
+Unlike :mod:`fnmatch` there are no ``[...]`` character classes, every other character matches itself.
+"""
+import re
+from functools import lru_cache
+from typing import Callable
+
+#: The maximum number of compiled patterns kept in the cache.
+GLOB_CACHE_SIZE = 8192
+
+#: A compiled pattern, called with a string to determine whether it matches.
+GlobMatcher = Callable[[str], bool]
+
+
+def classify_glob(pattern: str) -> str:
+    """Return the shape of an IAM pattern.
+
+    One of:
+
+    * ``literal`` - No wildcards, e.g. ``s3:GetObject``.
+    * ``prefix`` - A single trailing ``*``, e.g. ``s3:Get*`` (or just ``*``).
+    * ``suffix`` - A single leading ``*``, e.g. ``*Object``.
+    * ``general`` - Anything else, e.g. ``s3:*Object*`` or ``s3:Get?bject``.
+
+    Parameters:
+        pattern: The pattern to classify.
+    """
+    if "?" not in pattern:
+        star_count = pattern.count("*")
+        if star_count == 0:
+            return "literal"
+        if star_count == 1 and pattern.endswith("*"):
+            return "prefix"
+        if star_count == 1 and pattern.startswith("*"):
+            return "suffix"
+    return "general"
+
+
+def _match_anything(name: str) -> bool:
+    return True
+
+
+@lru_cache(maxsize=GLOB_CACHE_SIZE)
+def compile_glob(pattern: str) -> GlobMatcher:
+    """Return a function which determines whether a string matches ``pattern``.
+
+    The pattern is classified once and the cheapest routine for its shape is returned, only ``general`` patterns
+    are compiled into a regular expression. Compiled patterns are kept in a bounded LRU cache keyed by the pattern.
+
+    Matching is case sensitive, callers are expected to case fold both sides if they need to.
+
+    Parameters:
+        pattern: The pattern to compile. This should be a plain ``str`` so that the cache key is case sensitive.
+    """
+    shape = classify_glob(pattern)
+    if shape == "literal":
+        return pattern.__eq__
+    if shape == "prefix":
+        prefix = pattern[:-1]
+        if not prefix:
+            return _match_anything
+
+        def match_prefix(name: str) -> bool:
+            return name.startswith(prefix)
+
+        return match_prefix
+    if shape == "suffix":
+        suffix = pattern[1:]
+
+        def match_suffix(name: str) -> bool:
+            return name.endswith(suffix)
+
+        return match_suffix
+
+    regex = re.compile(
+        "".join(".*" if char == "*" else "." if char == "?" else re.escape(char) for char in pattern), re.DOTALL
+    )
+
+    def match_general(name: str) -> bool:
+        return regex.fullmatch(name) is not None
+
+    return match_general
+
+
+def match_glob(name: str, pattern: str) -> bool:
+    """Determine whether ``name`` matches the IAM ``pattern``.
+
+    Wildcards in ``name`` are treated as literal characters, which means a pattern is matched by any pattern that
+    is narrower than or equal to it (e.g. ``s3:Get*`` matches ``s3:*``).
+
+    Parameters:
+        name: The string to test.
+        pattern: The pattern to test it against.
+    """
+    return compile_glob(pattern)(name)
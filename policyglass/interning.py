@@ -0,0 +1,86 @@
+"""Opt-in interning of Action, Resource, PrincipalValue and Condition strings.
+
+Large policy corpora create the same ARP strings many thousands of times. While interning is enabled, creating
+one of these strings returns the existing object for an equal value of the same type (if one is still alive)
+rather than a new one. Values are held by weak reference so values nothing else uses are freed as normal.
+
+Example:
+    Intern actions while loading a batch of policies.
+
+        >>> from policyglass import Action
+        >>> from policyglass.interning import interning
+        >>> with interning():
+        ...     Action("s3:GetObject") is Action("s3:GetObject")
+        True
+"""
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple
+from weakref import WeakValueDictionary
+
+_registry: Optional["WeakValueDictionary[Tuple[type, str], Any]"] = None
+
+
+def enable_interning() -> None:
+    """Start interning ARP values."""
+    global _registry
+    if _registry is None:
+        _registry = WeakValueDictionary()
+
+
+def disable_interning() -> None:
+    """Stop interning ARP values and drop the registry.
+
+    Values that were already interned are unaffected, but new values will no longer resolve to them.
+    """
+    global _registry
+    _registry = None
+
+
+def interning_enabled() -> bool:
+    """Return True if ARP values are currently being interned."""
+    return _registry is not None
+
+
+def interned_count() -> int:
+    """Return the number of live interned values."""
+    return len(_registry) if _registry is not None else 0
+
+
+@contextmanager
+def interning() -> Iterator[None]:
+    """Intern ARP values for the duration of the context, restoring the previous state afterwards."""
+    was_enabled = interning_enabled()
+    enable_interning()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable_interning()
+
+
+class InternableString(str):
+    """A string whose instances are interned while :func:`interning` is enabled."""
+
+    def __new__(cls, value: object = "") -> "InternableString":
+        """Return the canonical instance for ``value`` if interning is enabled, otherwise a new instance.
+
+        Parameters:
+            value: The value of the string.
+        """
+        registry = _registry
+        if registry is None:
+            return cls._create(value)
+        key = (cls, str(value))
+        instance = registry.get(key)
+        if instance is None:
+            instance = registry[key] = cls._create(value)
+        return instance
+
+    @classmethod
+    def _create(cls, value: object) -> "InternableString":
+        """Create a new instance, subclasses may override this to precompute derived values once.
+
+        Parameters:
+            value: The value of the string.
+        """
+        return str.__new__(cls, value)
@@ -0,0 +1,65 @@
+"""Scoped memoisation of PolicyShard and EffectiveARP comparisons.
+
+Deduplicating PolicyShards compares the same pairs of shards many times. While a :func:`memo_scope` is active the
+results of ``issubset``, ``intersection`` and ``difference`` on PolicyShards and EffectiveARPs are remembered,
+keyed by the ``memo_key`` of both operands. The table is discarded when the outermost scope exits.
+
+Actions and condition keys compare case insensitively, but results keep the case of their operands. A ``memo_key``
+is case sensitive so that a memoised result is only reused for operands with the same case.
+"""
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_state = threading.local()
+
+
+@contextmanager
+def memo_scope() -> Iterator[Dict]:
+    """Memoise comparisons for the duration of the context.
+
+    Nested scopes share the table of the outermost scope, which is cleared when it exits.
+    """
+    table = getattr(_state, "table", None)
+    if table is not None:
+        yield table
+        return
+    table = _state.table = {}
+    try:
+        yield table
+    finally:
+        _state.table = None
+
+
+def memoised(method: F) -> F:
+    """Memoise a comparison method for the duration of the active :func:`memo_scope`.
+
+    The method is called as normal when there is no active scope or ``other`` has no ``memo_key``.
+
+    Parameters:
+        method: The method to memoise, which must take ``other`` as its first argument.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: object, other: object, *args, **kwargs) -> object:
+        table = getattr(_state, "table", None)
+        if table is None:
+            return method(self, other, *args, **kwargs)
+        other_key = getattr(other, "memo_key", None)
+        if other_key is None:
+            return method(self, other, *args, **kwargs)
+        self_key = getattr(self, "memo_key")
+        key = (name, type(self), self_key, type(other), other_key, args, tuple(sorted(kwargs.items())))
+        try:
+            result = table[key]
+        except KeyError:
+            result = table[key] = method(self, other, *args, **kwargs)
+        if isinstance(result, list):
+            return list(result)
+        return result
+
+    return cast(F, wrapper)
@@ -1,8 +1,31 @@
 """Generic Models."""
+from typing import Any, Tuple
 
+from .interning import InternableString
 
-class CaseInsensitiveString(str):
-    """A case insensitive string to aid comparison."""
+
+class CaseInsensitiveString(InternableString):
+    """A case insensitive string to aid comparison.
+
+    The case folded value and its hash are computed once when the string is created.
+    """
+
+    #: The lower case form of this string used for hashing and comparison.
+    _folded: str
+    _hash: int
+
+    @classmethod
+    def _create(cls, value: object) -> "CaseInsensitiveString":
+        """Create a new instance with its case folded value and hash precomputed.
+
+        Parameters:
+            value: The value of the string.
+        """
+        instance = str.__new__(cls, value)
+        folded = instance.lower()
+        instance._folded = folded
+        instance._hash = hash(folded)
+        return instance
 
     def __eq__(self, other: object) -> bool:
         """Determine whether this object and another object are equal.
@@ -13,13 +36,21 @@ class CaseInsensitiveString(str):
         Raises:
             ValueError: When the object we are compared with is not of the same type.
         """
-        if not isinstance(other, (self.__class__, str)):
+        if self is other:
+            return True
+        if isinstance(other, CaseInsensitiveString):
+            return self._folded == other._folded
+        if not isinstance(other, str):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
-        return self.lower() == other.lower()
+        return self._folded == other.lower()
 
     def __hash__(self) -> int:
         """Compute the hash for this object."""
-        return hash(self.lower())
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle as the plain string so the folded value and hash are recomputed when unpickled."""
+        return (self.__class__, (str(self),))
 
     def __repr__(self) -> str:
         """Return an instantiable representation of this object."""
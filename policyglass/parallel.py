@@ -0,0 +1,55 @@
+"""Persistent process pools for spreading PolicyShard calculations across CPUs.
+
+Starting a process pool is expensive, so pools are created on first use and reused by later calls with the same
+number of workers until :func:`shutdown_worker_pools` is called.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def worker_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the persistent process pool with ``workers`` processes, creating it if necessary.
+
+    Parameters:
+        workers: The number of worker processes.
+
+    Raises:
+        ValueError: If ``workers`` is less than 1.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, not {workers}")
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return pool
+
+
+def shutdown_worker_pools() -> None:
+    """Shut down every persistent process pool, waiting for running tasks to finish."""
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown()
+
+
+def split_evenly(items: Sequence[T], count: int) -> List[Sequence[T]]:
+    """Split ``items`` into at most ``count`` contiguous, non-empty chunks whose lengths differ by at most one.
+
+    Concatenating the chunks gives back ``items`` in their original order.
+
+    Parameters:
+        items: The items to split.
+        count: The maximum number of chunks.
+    """
+    count = max(1, min(count, len(items)))
+    size, remainder = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for index in range(count):
+        end = start + size + (1 if index < remainder else 0)
+        chunks.append(items[start:end])
+        start = end
+    return [chunk for chunk in chunks if chunk]
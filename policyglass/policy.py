@@ -1,9 +1,9 @@
 """Core Policy class."""
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
-from .policy_shard import PolicyShard
+from .policy_shard import PolicyShard, _copy_policy_shards
 from .statement import Statement
 from .utils import to_pascal
 
@@ -40,6 +40,10 @@ class Policy(BaseModel):
     version: Optional[str]
     statement: List[Statement]
 
+    _policy_shards: Optional[Tuple[Tuple[Tuple[PolicyShard, ...], ...], Tuple[PolicyShard, ...]]] = PrivateAttr(
+        default=None
+    )
+
     class Config:
         """Configure the pydantic BaseModel."""
 
@@ -47,11 +51,35 @@ class Policy(BaseModel):
 
     @property
     def policy_shards(self) -> List[PolicyShard]:
-        """Shatter this policy into a number :class:`policyglass.policy_shard` objects."""
-        result = []
+        """Shatter this policy into a number :class:`policyglass.policy_shard` objects.
+
+        The shards are cached along with the cached shards of each statement (see
+        :attr:`policyglass.statement.Statement.policy_shards`) and recalculated when they change. Copies of the cached
+        shards are returned, so changing them does not affect the cache.
+        """
+        statement_shards = tuple(statement._cached_policy_shards() for statement in self.statement)
+        cached = self._policy_shards
+        if (
+            cached is None
+            or len(statement_shards) != len(cached[0])
+            or not all(shards is cached_shards for shards, cached_shards in zip(statement_shards, cached[0]))
+        ):
+            cached = self._policy_shards = (
+                statement_shards,
+                tuple(shard for shards in statement_shards for shard in shards),
+            )
+        return _copy_policy_shards(cached[1])
+
+    def iter_policy_shards(self) -> Iterator[PolicyShard]:
+        """Yield the shards of :attr:`policy_shards` one statement at a time without building the list."""
+        for statement in self.statement:
+            yield from statement.iter_policy_shards()
+
+    def clear_policy_shards_cache(self) -> None:
+        """Drop the cached shards of this policy and its statements."""
+        self._policy_shards = None
         for statement in self.statement:
-            result.extend(statement.policy_shards)
-        return result
+            statement.clear_policy_shards_cache()
 
     def policy_json(self) -> str:
         """Return a valid policy JSON from this policy."""
@@ -1,102 +1,330 @@
 """PolicyShards are a simplified representation of policies."""
 
 import json
-from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, Optional, Tuple
+import os
+import warnings
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Executor
+from itertools import repeat
+from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel
 
 from .action import Action, EffectiveAction
-from .condition import EffectiveCondition
+from .condition import Condition, EffectiveCondition
 from .effective_arp import EffectiveARP
+from .memo import memo_scope, memoised
+from .parallel import split_evenly, worker_pool
 from .principal import EffectivePrincipal, Principal
 from .resource import EffectiveResource, Resource
+from .shard_index import PolicyShardIndex
 
 
-def dedupe_policy_shard_subsets(shards: Iterable["PolicyShard"], check_reverse: bool = True) -> List["PolicyShard"]:
-    """Dedupe policy shards that are subsets of each other.
+#: The names of the fields on a PolicyShard.
+POLICY_SHARD_FIELDS = frozenset(
+    {"effect", "effective_action", "effective_resource", "effective_principal", "effective_condition"}
+)
+
+
+def dedupe_identical_policy_shards(shards: Iterable["PolicyShard"]) -> List["PolicyShard"]:
+    """Remove PolicyShards that are identical to an earlier PolicyShard, preserving order.
+
+    This takes linear time, so it is used to avoid pairwise comparisons in the other dedupe functions.
 
     Parameters:
         shards: The shards to deduplicate.
-        check_reverse: Whether you want to check these shards in reverse as well (only disabled when alling itself).
     """
-    deduped_shards: List[PolicyShard] = []
-    removed_shards: List[PolicyShard] = []
-    sorted_shards = shards
+    unique_shards: Dict[Tuple, PolicyShard] = {}
+    for shard in shards:
+        unique_shards.setdefault(shard.canonical_key, shard)
+    return list(unique_shards.values())
+
+
+class DedupeStats:
+    """The work done by a dedupe run.
+
+    Every shard taken from the worklist is either an input shard or part of a shard which was split, so
+    ``examined`` is at most the number of input shards plus ``requeued``.
+
+    Example:
+        Inspect how much work a dedupe did.
+
+            >>> from policyglass import Policy
+            >>> from policyglass.policy_shard import DedupeStats, dedupe_policy_shards
+            >>> policy = Policy(**{"Statement": [{"Effect": "Allow", "Action": ["s3:Get*", "s3:*"]}]})
+            >>> stats = DedupeStats()
+            >>> len(dedupe_policy_shards(policy.policy_shards, stats=stats))
+            1
+            >>> stats
+            DedupeStats(examined=2, requeued=0, removed=1)
+    """
+
+    def __init__(self) -> None:
+        #: The number of shards taken from the worklist.
+        self.examined = 0
+        #: The number of parts of split shards added back to the worklist.
+        self.requeued = 0
+        #: The number of kept shards removed because a later shard contained or split them.
+        self.removed = 0
+
+    def __repr__(self) -> str:
+        """Return an instantiable representation of this object."""
+        return f"{self.__class__.__name__}(examined={self.examined}, requeued={self.requeued}, removed={self.removed})"
 
-    # Sorting by effective resource means that PolicyShards with larger resources will have any subsets
-    # folded into them first, improving readability. We only do this whenn check_reverse is true otherwise
-    # we won't respect the reverse order.
-    if check_reverse:
-        sorted_shards = sorted(shards, key=lambda x: x.effective_resource, reverse=True)
 
-    for undeduped_shard in sorted_shards:
-        if any(undeduped_shard.issubset(deduped_shard) for deduped_shard in deduped_shards):
-            removed_shards.append(undeduped_shard)
+def _overlaps(shard: "PolicyShard", other: "PolicyShard") -> bool:
+    """Whether two shards of the same effect intersect.
+
+    The intersection of effective ARPs only checks the exclusions of the one it is called on, so both directions are
+    checked.
+
+    Parameters:
+        shard: The first shard.
+        other: The second shard.
+    """
+    return bool(shard.intersection(other) and other.intersection(shard))
+
+
+def _uncovered_differences(shard: "PolicyShard", other: "PolicyShard") -> List["PolicyShard"]:
+    """Return the parts of ``shard`` outside ``other`` if ``other`` covers the rest of it with no more conditions.
+
+    The difference of Shard A (``shard``) and Shard B (``other``) will not be identical to shard A if shard B's ARPs
+    intersect shard A's. If shard B applies whenever shard A does, shard B covers the intersection, so the difference
+    should replace shard A. The difference of two shards with different conditions includes shard A itself, for
+    when shard B's conditions are not met, which shard B's conditions being no more restrictive rules out.
+
+    Parts of the difference outside shard A are ignored. Nothing is returned if any other part is not known to be
+    within shard A, or still overlaps shard B, as shard A would then not be fully replaced.
+
+    Parameters:
+        shard: The shard which may be split.
+        other: The shard which may cover part of ``shard``.
+    """
+    if (
+        shard.effect != other.effect
+        or not _effective_condition_issubset(shard.effective_condition, other.effective_condition)
+        or not _overlaps(shard, other)
+    ):
+        return []
+    parts = []
+    for difference in shard.difference(other, dedupe_result=False):
+        if difference == shard or not _overlaps(difference, shard):
             continue
+        if not difference < shard or _overlaps(difference, other):
+            return []
+        parts.append(difference)
+    return parts
 
-        deduped_shards.append(undeduped_shard)
 
-    if check_reverse:
-        deduped_shards = dedupe_policy_shard_subsets(reversed(deduped_shards), False)
-    if removed_shards:
-        deduped_shards = dedupe_policy_shard_subsets(deduped_shards)
-    return deduped_shards
+def _dedupe_worklist(
+    shards: Iterable["PolicyShard"], split: bool, stats: Optional[DedupeStats]
+) -> List["PolicyShard"]:
+    """Keep the shards which are not contained by another shard, comparing each shard only with the kept shards.
 
+    Shards are taken from a worklist in order and compared with the kept shards they could be comparable with. A shard
+    is dropped if a kept shard contains it, and kept shards it contains are removed once it is kept. If ``split`` is
+    true, a shard which a kept shard covers part of (see :func:`_uncovered_differences`) is replaced on the worklist by
+    its uncovered parts, and when a shard is kept the same is done to the kept shards it covers part of.
 
-def dedupe_policy_shards(shards: Iterable["PolicyShard"], check_reverse: bool = True) -> List["PolicyShard"]:
-    """Dedupe policy shards that are subsets of each other and remove intersections.
+    Only the kept shards affected by a change are re-examined. Every pair of kept shards has been compared in both
+    directions, so unlike repeated forward and reverse passes over the whole list, no further passes are needed.
 
     Parameters:
         shards: The shards to deduplicate.
-        check_reverse: Whether you want to check these shards in reverse as well (only disabled when calling itself).
+        split: Whether to split shards which are partly covered by another shard whose conditions are no stricter.
+        stats: Counts the work done, if provided.
     """
-    deduped_shards: List[PolicyShard] = []
-    difference_shards: List[PolicyShard] = []
-    removed_shards: List[PolicyShard] = []
-    for undeduped_shard in shards:
-        difference_buffer = []
-        removed_buffer = []
-
-        for deduped_shard in deduped_shards:
-            if undeduped_shard.issubset(deduped_shard):
-                removed_buffer.append(undeduped_shard)
-                break
-            if deduped_shard.issubset(undeduped_shard):
+    stats = stats or DedupeStats()
+    worklist = deque(shards)
+    index = PolicyShardIndex()
+    kept: Dict[int, PolicyShard] = {}
+    kept_keys: Dict[Tuple, int] = {}
+
+    def remove(position: int) -> None:
+        del kept_keys[kept.pop(position).canonical_key]
+        index.remove(position)
+        stats.removed += 1
+
+    def requeue(parts: List[PolicyShard]) -> None:
+        worklist.extend(parts)
+        stats.requeued += len(parts)
+
+    while worklist:
+        shard = worklist.popleft()
+        stats.examined += 1
+        if shard.canonical_key in kept_keys:
+            continue
+        contained_positions = []
+        partly_covered: List[Tuple[int, List[PolicyShard]]] = []
+        differences: List[PolicyShard] = []
+        for position in index.comparable_positions(shard):
+            kept_shard = kept[position]
+            if shard.issubset(kept_shard):
                 break
+            if kept_shard.issubset(shard):
+                contained_positions.append(position)
+            elif split and not differences:
+                # Only one kept shard is subtracted at a time, the parts are compared with the others when they are
+                # taken from the worklist. Subtracting them all at once would requeue many overlapping parts.
+                differences = _uncovered_differences(shard, kept_shard)
+                if not differences:
+                    kept_differences = _uncovered_differences(kept_shard, shard)
+                    if kept_differences:
+                        partly_covered.append((position, kept_differences))
+        else:
+            if differences:
+                requeue(differences)
+                continue
+            for position in contained_positions:
+                remove(position)
+            for position, kept_differences in partly_covered:
+                remove(position)
+                requeue(kept_differences)
+            position = len(index.shards)
+            index.add(shard)
+            kept[position] = shard
+            kept_keys[shard.canonical_key] = position
+    return list(reversed(kept.values()))
 
-            # The difference of Shard A (undeduped_shard) and Shard B (deduped_shard) will not be identical to
-            # shard A if shard B's ARPs are a superset of Shard A's except for a condition.
-            # If this difference is smaller than Shard A and not also a subset of shard B (by virtue of having
-            # differing conditions) then this difference should be added to the dedupe list *instead* of
-            # shard A because shard B covers the intersection with fewer conditions.
 
-            if undeduped_shard.effect != deduped_shard.effect or not deduped_shard.intersection(undeduped_shard):
-                continue
-            differences = undeduped_shard.difference(deduped_shard, dedupe_result=False)
-            if differences and differences != [undeduped_shard]:
-                for difference in differences:
-                    if difference < undeduped_shard and not difference.intersection(deduped_shard):
-                        difference_buffer.append(difference)
-
-        if removed_buffer:
-            removed_shards.extend(removed_buffer)
-            continue
-        if difference_buffer:
-            difference_shards.extend(difference_buffer)
-            continue
-        deduped_shards.append(undeduped_shard)
+def _canonical_sort_key(shard: "PolicyShard") -> Tuple:
+    """Return a key which orders shards with fewer conditions and exclusions first, and does not use set order.
+
+    Parameters:
+        shard: The shard to return the key of.
+    """
+    arps = (shard.effective_action, shard.effective_resource, shard.effective_principal)
+    effective_condition = shard.effective_condition
+    return (
+        len(effective_condition.inclusions) + len(effective_condition.exclusions),
+        sum(len(arp.exclusions) for arp in arps),
+        shard.effect,
+        [(str(arp.inclusion), sorted(str(exclusion) for exclusion in arp.exclusions)) for arp in arps],
+        sorted(str(condition) for condition in effective_condition.inclusions),
+        sorted(str(condition) for condition in effective_condition.exclusions),
+    )
+
+
+def _copy_policy_shards(shards: Iterable["PolicyShard"]) -> List["PolicyShard"]:
+    """Return a copy of each shard, so changes to the copies do not affect shards that have been cached.
+
+    The copies share the EffectiveARPs and EffectiveCondition of the originals, as they are immutable.
+
+    Parameters:
+        shards: The shards to copy.
+    """
+    return [PolicyShard._construct(**shard.__dict__) for shard in shards]
+
+
+def _order_by_effective_resource(shards: Iterable["PolicyShard"]) -> List["PolicyShard"]:
+    return sorted(shards, key=lambda x: x.effective_resource, reverse=True)
 
-    deduped_shards = deduped_shards + difference_shards
+
+@memo_scope()
+def dedupe_policy_shard_subsets(
+    shards: Iterable["PolicyShard"], check_reverse: bool = True, stats: Optional[DedupeStats] = None
+) -> List["PolicyShard"]:
+    """Dedupe policy shards that are subsets of each other.
+
+    Parameters:
+        shards: The shards to deduplicate.
+        check_reverse: Whether to order the shards by their EffectiveResource first, rather than keep their order.
+        stats: Counts the work done, if provided.
+    """
+    # Sorting by effective resource means that PolicyShards with larger resources will have any subsets
+    # folded into them first, improving readability.
     if check_reverse:
-        deduped_shards = dedupe_policy_shards(reversed(deduped_shards), False)
-    if removed_shards or difference_shards:
-        deduped_shards = dedupe_policy_shards(deduped_shards)
-    return deduped_shards
+        shards = _order_by_effective_resource(shards)
+    return _dedupe_worklist(shards, False, stats)
+
+
+@memo_scope()
+def dedupe_policy_shards(
+    shards: Iterable["PolicyShard"], *, check_reverse: Optional[bool] = None, stats: Optional[DedupeStats] = None
+) -> List["PolicyShard"]:
+    """Dedupe policy shards that are subsets of each other and remove intersections.
+
+    Parameters:
+        shards: The shards to deduplicate.
+        check_reverse: Deprecated and ignored, passing it emits a DeprecationWarning. Every pair of shards is
+            compared in both directions.
+        stats: Counts the work done, if provided.
+    """
+    if check_reverse is not None:
+        warnings.warn(
+            "The check_reverse argument of dedupe_policy_shards is deprecated and will be removed in v1. "
+            "Every pair of shards is compared in both directions",
+            DeprecationWarning,
+        )
+    return _dedupe_worklist(shards, True, stats)
 
 
-def policy_shards_effect(shards: List["PolicyShard"]) -> List["PolicyShard"]:
+@memo_scope()
+def _subtract_deny_shards(
+    allow_shards: Sequence["PolicyShard"],
+    deny_shards: List["PolicyShard"],
+    traces: Optional[List[List["PolicyShard"]]] = None,
+) -> List[List["PolicyShard"]]:
+    """Subtract every deny shard from each allow shard in turn, returning what remains of each allow shard.
+
+    Parameters:
+        allow_shards: The allow shards to subtract the deny shards from.
+        deny_shards: The deny shards to subtract.
+        traces: If provided, every candidate derived from each allow shard (including the allow shard itself) is
+            appended to it as a list per allow shard.
+    """
+    # A deny whose action, resource or principal is not comparable with a candidate's cannot intersect it, so the
+    # difference would just be the candidate. Candidates are only subtracted from the denies which could intersect them.
+    deny_index = PolicyShardIndex(deny_shards)
+    intersecting_denies: Dict[Tuple, List[int]] = {}
+
+    results = []
+    for allow_shard in allow_shards:
+        result = []
+        trace: List[PolicyShard] = []
+        # Candidates are paired with the position of the next deny to apply to them. They are processed depth first
+        # so they come out in the same order as subtracting each deny from every candidate in turn.
+        stack = [(allow_shard, 0)]
+        while stack:
+            allow_candidate, next_deny = stack.pop()
+            trace.append(allow_candidate)
+            arps = (
+                allow_candidate.effective_action.inclusion,
+                allow_candidate.effective_resource.inclusion,
+                allow_candidate.effective_principal.inclusion,
+            )
+            if arps not in intersecting_denies:
+                intersecting_denies[arps] = deny_index.comparable_positions(allow_candidate)
+            deny_positions = intersecting_denies[arps]
+            index = bisect_left(deny_positions, next_deny)
+            if index == len(deny_positions):
+                result.append(allow_candidate)
+                continue
+            deny_position = deny_positions[index]
+            differences = allow_candidate.difference(deny_shards[deny_position])
+            stack.extend((difference, deny_position + 1) for difference in reversed(differences))
+        # The order differences come out in depends on set iteration order, which differs between processes with
+        # different hash seeds. Sorting the remains of each allow shard makes the results the same in any process.
+        results.append(sorted(result, key=_canonical_sort_key))
+        if traces is not None:
+            traces.append(trace)
+    return results
+
+
+@memo_scope()
+def policy_shards_effect(
+    shards: List["PolicyShard"], workers: Optional[int] = None, executor: Optional[Executor] = None
+) -> List["PolicyShard"]:
     """Calculate the effect of merging allow and deny shards together.
 
+    Each allow shard has the deny shards subtracted from it independently, so this can be spread across processes by
+    passing ``workers`` (which uses a persistent pool from :func:`~policyglass.parallel.worker_pool`) or your own
+    ``executor``. The allow shards are split into one contiguous chunk per worker so the deny shards are only sent to
+    each worker once. What remains of each allow shard is sorted by a key which does not depend on the hash seed, and
+    the results are recombined in order before being deduplicated, so the output is the same whatever the number of
+    workers or how they are started.
+
     Example:
         How to get the effective permissions of a policy as :class:`~policyglass.policy_shard.PolicyShard` objects.
 
@@ -132,22 +360,24 @@ def policy_shards_effect(shards: List["PolicyShard"]) -> List["PolicyShard"]:
 
     Parameters:
         shards: The shards to caclulate the effect of.
+        workers: The number of worker processes to spread the allow shards across.
+        executor: The executor to spread the allow shards across, instead of a persistent process pool.
     """
     allow_shards = [shard for shard in shards if shard.effect == "Allow"]
     deny_shards = [shard for shard in shards if shard.effect == "Deny"]
 
-    # This code is ugly because DIFFERENCE takes in a single shard and yields a list of them.
-    merged_allow_shards = []
-    for allow_shard in allow_shards:
-        allow_candidates = [allow_shard]
-        for deny_shard in deny_shards:
-            result = []
-            for allow_candidate in allow_candidates:
-                result.extend(allow_candidate.difference(deny_shard))
-            allow_candidates = result
-        if allow_candidates:
-            merged_allow_shards.extend(allow_candidates)
-    return dedupe_policy_shards(merged_allow_shards)
+    if executor is None and workers is not None and workers > 1:
+        executor = worker_pool(workers)
+    if executor is None:
+        results = _subtract_deny_shards(allow_shards, deny_shards)
+    else:
+        chunks = split_evenly(allow_shards, workers or os.cpu_count() or 1)
+        results = [
+            result
+            for chunk_results in executor.map(_subtract_deny_shards, chunks, repeat(deny_shards, len(chunks)))
+            for result in chunk_results
+        ]
+    return dedupe_policy_shards([shard for result in results for shard in result])
 
 
 def policy_shards_to_json(shards: List["PolicyShard"], exclude_defaults=False, **kwargs) -> str:
@@ -248,6 +478,70 @@ def explain_policy_shards(shards: List["PolicyShard"], language: str = "en") ->
     return [shard.explain for shard in shards]
 
 
+def _effective_condition_issubset(effective_condition: EffectiveCondition, other: EffectiveCondition) -> bool:
+    """Whether a shard with ``effective_condition`` applies in no more scenarios than one with ``other``.
+
+    A shard is more restrictive, and so a subset, if its conditions include all of the other's conditions.
+
+    Parameters:
+        effective_condition: The EffectiveCondition of the shard that may be a subset.
+        other: The EffectiveCondition of the shard that may be a superset.
+    """
+    if (
+        effective_condition.inclusions
+        and other.inclusions
+        and not other.inclusions.issubset(effective_condition.inclusions)
+    ):
+        return False
+    if (
+        effective_condition.exclusions
+        and other.exclusions
+        and not other.exclusions.issubset(effective_condition.exclusions)
+    ):
+        return False
+    if not effective_condition.inclusions and other.inclusions:
+        return False
+    if not effective_condition.exclusions and other.exclusions:
+        return False
+    return True
+
+
+def _intersect_effective_conditions(
+    effect: str, effective_condition: EffectiveCondition, other_effect: str, other: EffectiveCondition
+) -> Optional[EffectiveCondition]:
+    """Return the EffectiveCondition of the intersection of two shards, or None if their conditions exclude it.
+
+    Parameters:
+        effect: The effect of the shard being intersected.
+        effective_condition: The EffectiveCondition of the shard being intersected.
+        other_effect: The effect of the shard it is being intersected with.
+        other: The EffectiveCondition of the shard it is being intersected with.
+    """
+    if effect == other_effect:
+        if (
+            effective_condition.inclusions
+            and other.inclusions
+            and not effective_condition.inclusions.intersection(other.inclusions)
+        ):
+            return None
+        if (
+            effective_condition.exclusions
+            and other.exclusions
+            and not effective_condition.exclusions.intersection(other.exclusions)
+        ):
+            return None
+
+    # intersection conditions/not_conditions cannot be a proper subset of self's as if they were they would include
+    # scenarios not originally included by self.
+    intersection_conditions = effective_condition.inclusions.intersection(other.inclusions)
+    if intersection_conditions < effective_condition.inclusions:
+        intersection_conditions = effective_condition.inclusions
+    intersection_not_conditions = effective_condition.exclusions.intersection(other.exclusions)
+    if intersection_not_conditions < effective_condition.exclusions:
+        intersection_not_conditions = effective_condition.exclusions
+    return EffectiveCondition(inclusions=intersection_conditions, exclusions=intersection_not_conditions)
+
+
 class PolicyShard(BaseModel):
     """A PolicyShard is part of a policy broken down in such a way that it can be deduplicated and collapsed."""
 
@@ -282,6 +576,42 @@ class PolicyShard(BaseModel):
             effective_condition=effective_condition or EffectiveCondition(frozenset(), frozenset()),
         )
 
+    @classmethod
+    def _construct(
+        cls,
+        effect: str,
+        effective_action: EffectiveARP[Action],
+        effective_resource: EffectiveARP[Resource],
+        effective_principal: EffectiveARP[Principal],
+        effective_condition: EffectiveCondition,
+    ) -> "PolicyShard":
+        """Create a PolicyShard from values that are already valid, without Pydantic validation.
+
+        This is for shards derived from existing shards, whose EffectiveARPs and EffectiveCondition have already been
+        validated. It produces a PolicyShard equal to one created with the same values by the normal constructor.
+
+        Parameters:
+            effect: `'Allow'` or `'Deny'`
+            effective_action: The EffectiveAction that this PolicyShard allows or denies
+            effective_resource: The EffectiveResource that this PolicyShard allows or denies
+            effective_principal: The EffectivePrincipal that this PolicyShard allows or denies
+            effective_condition: The EffectiveCondition that needs to be met for this PolicyShard to apply
+        """
+        shard = cls.__new__(cls)
+        object.__setattr__(
+            shard,
+            "__dict__",
+            {
+                "effect": effect,
+                "effective_action": effective_action,
+                "effective_resource": effective_resource,
+                "effective_principal": effective_principal,
+                "effective_condition": effective_condition,
+            },
+        )
+        object.__setattr__(shard, "__fields_set__", set(POLICY_SHARD_FIELDS))
+        return shard
+
     class Config:
         """Pydantic Config."""
 
@@ -289,6 +619,8 @@ class PolicyShard(BaseModel):
             EffectiveAction: lambda v: v.dict() if v else None,
             EffectiveResource: lambda v: v.dict() if v else None,
             EffectivePrincipal: lambda v: v.dict() if v else None,
+            Principal: lambda v: v.dict(),
+            Condition: lambda v: v.dict(),
         }
 
     def union(self, other: object) -> List["PolicyShard"]:
@@ -312,7 +644,7 @@ class PolicyShard(BaseModel):
             return [self, other]
 
         return [
-            self.__class__(
+            self._construct(
                 effect=self.effect,
                 effective_action=effective_action,
                 effective_resource=effective_resource,
@@ -324,6 +656,7 @@ class PolicyShard(BaseModel):
             for effective_principal in self.effective_principal.union(other.effective_principal)
         ]
 
+    @memoised
     def difference(self, other: object, dedupe_result: bool = True) -> List["PolicyShard"]:
         """Calculate the difference between this and another object of the same type.
 
@@ -364,7 +697,7 @@ class PolicyShard(BaseModel):
             if self.effect != other.effect:
                 effective_condition = self.effective_condition.union(other.effective_condition.reverse)
             result.append(
-                self.__class__(
+                self._construct(
                     effect=self.effect,
                     effective_action=self.effective_action,
                     effective_resource=self.effective_resource,
@@ -426,7 +759,7 @@ class PolicyShard(BaseModel):
         result = []
         result.extend(
             [
-                self.__class__(
+                self._construct(
                     effect=self.effect,
                     effective_action=difference_action,
                     effective_resource=intersection.effective_resource,
@@ -438,7 +771,7 @@ class PolicyShard(BaseModel):
         )
         result.extend(
             [
-                self.__class__(
+                self._construct(
                     effect=self.effect,
                     effective_action=intersection.effective_action,
                     effective_resource=difference_resource,
@@ -450,7 +783,7 @@ class PolicyShard(BaseModel):
         )
         result.extend(
             [
-                self.__class__(
+                self._construct(
                     effect=self.effect,
                     effective_action=intersection.effective_action,
                     effective_resource=intersection.effective_resource,
@@ -482,7 +815,7 @@ class PolicyShard(BaseModel):
         result = []
         result.extend(
             [
-                self.__class__(
+                self._construct(
                     effect=self.effect,
                     effective_action=action,
                     effective_resource=self.effective_resource,
@@ -495,7 +828,7 @@ class PolicyShard(BaseModel):
 
         result.extend(
             [
-                self.__class__(
+                self._construct(
                     effect=self.effect,
                     effective_action=self.effective_action,
                     effective_resource=resource,
@@ -508,7 +841,7 @@ class PolicyShard(BaseModel):
 
         result.extend(
             [
-                self.__class__(
+                self._construct(
                     effect=self.effect,
                     effective_action=self.effective_action,
                     effective_resource=self.effective_resource,
@@ -520,6 +853,7 @@ class PolicyShard(BaseModel):
         )
         return result
 
+    @memoised
     def intersection(self, other: object) -> Optional["PolicyShard"]:
         """Calculate the intersection between this object and another object of the same type.
 
@@ -542,41 +876,21 @@ class PolicyShard(BaseModel):
 
         if not intersection_action or not intersection_resource or not intersection_principal:
             return None
-        if self.effect == other.effect:
-            if (
-                self.effective_condition.inclusions
-                and other.effective_condition.inclusions
-                and not self.effective_condition.inclusions.intersection(other.effective_condition.inclusions)
-            ):
-                return None
-            if (
-                self.effective_condition.exclusions
-                and other.effective_condition.exclusions
-                and not self.effective_condition.exclusions.intersection(other.effective_condition.exclusions)
-            ):
-                return None
-
-        # intersection conditions/not_conditions cannot be a proper subset of self's as if they were they would include
-        # scenarios not originally included by self.
-        intersection_conditions = self.effective_condition.inclusions.intersection(other.effective_condition.inclusions)
-        if intersection_conditions < self.effective_condition.inclusions:
-            intersection_conditions = self.effective_condition.inclusions
-        intersection_not_conditions = self.effective_condition.exclusions.intersection(
-            other.effective_condition.exclusions
+        intersection_condition = _intersect_effective_conditions(
+            self.effect, self.effective_condition, other.effect, other.effective_condition
         )
-        if intersection_not_conditions < self.effective_condition.exclusions:
-            intersection_not_conditions = self.effective_condition.exclusions
+        if intersection_condition is None:
+            return None
 
-        return self.__class__(
+        return self._construct(
             effect=self.effect,
             effective_action=intersection_action,
             effective_resource=intersection_resource,
             effective_principal=intersection_principal,
-            effective_condition=EffectiveCondition(
-                inclusions=intersection_conditions, exclusions=intersection_not_conditions
-            ),
+            effective_condition=intersection_condition,
         )
 
+    @memoised
     def issubset(self, other: object) -> bool:
         """Whether this object contains all the elements of another object (i.e. is a subset of the other object).
 
@@ -593,21 +907,7 @@ class PolicyShard(BaseModel):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
-        if (
-            self.effective_condition.inclusions
-            and other.effective_condition.inclusions
-            and not other.effective_condition.inclusions.issubset(self.effective_condition.inclusions)
-        ):
-            return False
-        if (
-            self.effective_condition.exclusions
-            and other.effective_condition.exclusions
-            and not other.effective_condition.exclusions.issubset(self.effective_condition.exclusions)
-        ):
-            return False
-        if not self.effective_condition.inclusions and other.effective_condition.inclusions:
-            return False
-        if not self.effective_condition.exclusions and other.effective_condition.exclusions:
+        if not _effective_condition_issubset(self.effective_condition, other.effective_condition):
             return False
         return (
             self.effective_action.issubset(other.effective_action)
@@ -706,6 +1006,8 @@ class PolicyShard(BaseModel):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
+        if self is other:
+            return True
 
         return (
             self.effective_action == other.effective_action
@@ -714,6 +1016,39 @@ class PolicyShard(BaseModel):
             and self.effective_condition == other.effective_condition
         )
 
+    def __hash__(self) -> int:
+        """Return a hash of this object.
+
+        The effect is not included because, like equality, it only considers the EffectiveARPs and EffectiveCondition.
+        """
+        return hash(
+            (self.effective_action, self.effective_resource, self.effective_principal, self.effective_condition)
+        )
+
+    @property
+    def canonical_key(
+        self,
+    ) -> Tuple[str, EffectiveARP[Action], EffectiveARP[Resource], EffectiveARP[Principal], EffectiveCondition]:
+        """Return a hashable key which is equal for identical PolicyShards, including their effect."""
+        return (
+            self.effect,
+            self.effective_action,
+            self.effective_resource,
+            self.effective_principal,
+            self.effective_condition,
+        )
+
+    @property
+    def memo_key(self) -> Tuple[str, object, object, object, object]:
+        """Return a key which, unlike :attr:`canonical_key`, distinguishes shards whose values differ only in case."""
+        return (
+            self.effect,
+            self.effective_action.memo_key,
+            self.effective_resource.memo_key,
+            self.effective_principal.memo_key,
+            self.effective_condition.memo_key,
+        )
+
     def __lt__(self, other: object) -> bool:
         """Whether this object is a proper subset of another object.
 
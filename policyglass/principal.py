@@ -1,11 +1,13 @@
 """Principal classes."""
 import json
 import re
-from typing import Dict, List, Optional
-
-from pydantic import BaseModel
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .effective_arp import EffectiveARP
+from .interning import InternableString
+
+ACCOUNT_ID_PATTERN = re.compile(r"^\d+$")
+ACCOUNT_ARN_PATTERN = re.compile(r"^arn:aws:iam::\d+:root$")
 
 
 class PrincipalType(str):
@@ -17,7 +19,7 @@ class PrincipalType(str):
     """
 
 
-class PrincipalValue(str):
+class PrincipalValue(InternableString):
     """An ARN, wildcard, or other appropriate value of a policy Principal.
 
     See `AWS JSON policy elements: Principal
@@ -68,22 +70,48 @@ class PrincipalCollection(Dict[PrincipalType, List[PrincipalValue]]):
         raise NotImplementedError()
 
 
-class Principal(BaseModel):
+class Principal:
     """A class which represents a single Principal including its type.
 
     Objects of this type are typically generated by the :class:`~policyglass.statement.Statement` class.
+
+    Principals are immutable, their ARN elements, account id and hash are computed once when they are created.
     """
 
+    __slots__ = ("type", "value", "_arn_elements", "_is_account", "_hash")
+
     #: Principal Type
     type: PrincipalType
     #: Principal value
     value: PrincipalValue
+    _arn_elements: Tuple[str, ...]
+    _is_account: bool
+    _hash: int
 
     def __init__(self, type: PrincipalType, value: PrincipalValue) -> None:
-        super().__init__(
-            type=type,
-            value=self._normalize_account_id(value),
+        if not isinstance(type, str) or not isinstance(value, str):
+            raise ValueError(f"Principal type and value must be strings, not {type!r} and {value!r}")
+        principal_type = PrincipalType(type)
+        principal_value = self._normalize_account_id(value)
+        object.__setattr__(self, "type", principal_type)
+        object.__setattr__(self, "value", principal_value)
+        object.__setattr__(self, "_arn_elements", tuple(principal_value.split(":")))
+        object.__setattr__(
+            self, "_is_account", bool(principal_type == "AWS" and ACCOUNT_ARN_PATTERN.match(principal_value))
         )
+        object.__setattr__(self, "_hash", hash((principal_type, principal_value)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Prevent modification of this object.
+
+        Parameters:
+            name: The name of the attribute.
+            value: The value of the attribute.
+
+        Raises:
+            AttributeError: Principals are immutable.
+        """
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
 
     def issubset(self, other: object) -> bool:
         """Whether this object contains all the elements of another object (i.e. is a subset of the other object).
@@ -100,9 +128,9 @@ class Principal(BaseModel):
             return False
         if other.value == "*":
             return True
-        if other.is_account and self.account_id == other.account_id:
+        if other._is_account and self.account_id == other.account_id:
             return True
-        for self_element, other_element in zip(self.arn_elements, other.arn_elements):
+        for self_element, other_element in zip(self._arn_elements, other._arn_elements):
             if self_element != other_element and other_element:
                 return False
         return True
@@ -110,20 +138,19 @@ class Principal(BaseModel):
     @property
     def account_id(self) -> Optional[str]:
         """Return the account id of this Principal if there is one."""
-        try:
-            return self.arn_elements[4]
-        except IndexError:
-            return None
+        if len(self._arn_elements) > 4:
+            return self._arn_elements[4]
+        return None
 
     @property
     def arn_elements(self) -> List[str]:
         """Return a list of arn elements, replacing blanks with ``""``."""
-        return [element or "" for element in self.value.split(":")]
+        return list(self._arn_elements)
 
     @property
     def is_account(self) -> bool:
         """Return true if the prinncipal is an account."""
-        return bool(self.type == "AWS" and re.match(r"^arn:aws:iam::\d+:root$", self.value))
+        return self._is_account
 
     @staticmethod
     def _normalize_account_id(value: PrincipalValue) -> PrincipalValue:
@@ -132,10 +159,53 @@ class Principal(BaseModel):
         Parameters:
             value: The value to normalize.
         """
-        if re.match(r"^\d+$", value):
+        if ACCOUNT_ID_PATTERN.match(value):
             return PrincipalValue(f"arn:aws:iam::{value}:root")
         return PrincipalValue(value)
 
+    def dict(self, *args, **kwargs) -> Dict[str, str]:
+        """Return a dictionary representation of this object.
+
+        Parameters:
+            *args: Accepted for compatibility with Pydantic's dict method.
+            **kwargs: Accepted for compatibility with Pydantic's dict method.
+        """
+        return {"type": self.type, "value": self.value}
+
+    def json(self, *args, **kwargs) -> str:
+        """Return a JSON representation of this object.
+
+        Parameters:
+            *args: Accepted for compatibility with Pydantic's json method.
+            **kwargs: Keyword arguments passed on to :func:`json.dumps`.
+        """
+        return json.dumps(self.dict(), **kwargs)
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable]:
+        """Allow Pydantic models to have Principal fields."""
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: object) -> "Principal":
+        """Return a Principal from a Principal or a dictionary of its fields.
+
+        Parameters:
+            value: The value to validate.
+
+        Raises:
+            ValueError: If the value cannot be converted to a Principal.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        raise ValueError(f"Cannot convert {value.__class__.__name__} to {cls.__name__}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle using the type and value so the cached hash is recomputed when unpickled."""
+        return (self.__class__, (self.type, self.value))
+
     def __eq__(self, other: object) -> bool:
         """Whether this object contains (but is not equal to) another object.
 
@@ -147,7 +217,9 @@ class Principal(BaseModel):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
-        return self.type == other.type and self.value == other.value
+        if self is other:
+            return True
+        return self._hash == other._hash and self.type == other.type and self.value == other.value
 
     def __lt__(self, other: object) -> bool:
         """Whether this object contains (but is not equal to) another object.
@@ -170,7 +242,7 @@ class Principal(BaseModel):
 
     def __hash__(self) -> int:
         """Return a hash representation of this object."""
-        return hash(str(self))
+        return self._hash
 
     def __str__(self) -> str:
         """Return a string representation of this object."""
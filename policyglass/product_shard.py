@@ -0,0 +1,338 @@
+"""ProductShards represent many PolicyShards that share an effect and conditions without expanding them."""
+from typing import Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .action import Action
+from .condition import EffectiveCondition
+from .effective_arp import EffectiveARP
+from .policy_shard import PolicyShard, _effective_condition_issubset, _intersect_effective_conditions
+from .principal import Principal
+from .resource import Resource
+
+T = TypeVar("T", Action, Resource, Principal)
+
+
+def _unique(arps: Iterable[EffectiveARP[T]]) -> Tuple[EffectiveARP[T], ...]:
+    """Return ``arps`` as a tuple without duplicates, preserving order.
+
+    Parameters:
+        arps: The EffectiveARPs to deduplicate.
+    """
+    return tuple(dict.fromkeys(arps))
+
+
+def _contained(arps: Tuple[EffectiveARP[T], ...], other_arps: Tuple[EffectiveARP[T], ...]) -> bool:
+    """Whether every EffectiveARP in ``arps`` is a subset of one of ``other_arps``.
+
+    Parameters:
+        arps: The EffectiveARPs which may be contained.
+        other_arps: The EffectiveARPs which may contain them.
+    """
+    return all(any(arp.issubset(other_arp) for other_arp in other_arps) for arp in arps)
+
+
+def _intersections(arps: Tuple[EffectiveARP[T], ...], other_arps: Tuple[EffectiveARP[T], ...]) -> Tuple:
+    """Return the intersection of every EffectiveARP in ``arps`` with every EffectiveARP in ``other_arps``.
+
+    Parameters:
+        arps: The EffectiveARPs to intersect.
+        other_arps: The EffectiveARPs to intersect them with.
+    """
+    result = []
+    for arp in arps:
+        for other_arp in other_arps:
+            intersection = arp.intersection(other_arp)
+            if intersection:
+                result.append(intersection)
+    return _unique(result)
+
+
+def _differences(arps: Tuple[EffectiveARP[T], ...], other_arps: Tuple[EffectiveARP[T], ...]) -> Tuple:
+    """Return what remains of each EffectiveARP in ``arps`` after subtracting every EffectiveARP in ``other_arps``.
+
+    Parameters:
+        arps: The EffectiveARPs to subtract from.
+        other_arps: The EffectiveARPs to subtract.
+    """
+    result = []
+    for arp in arps:
+        remaining = [arp]
+        for other_arp in other_arps:
+            remaining = [piece for remainder in remaining for piece in remainder.difference(other_arp)]
+        result.extend(remaining)
+    return _unique(result)
+
+
+class ProductShard:
+    """Every combination of a set of EffectiveActions, EffectiveResources and EffectivePrincipals.
+
+    A statement with N actions, M resources and K principals has N × M × K PolicyShards which differ only in their
+    EffectiveARPs. A ProductShard holds the three sets instead, and compares, intersects and subtracts them a
+    dimension at a time. :meth:`expand` returns the equivalent PolicyShards.
+
+    Example:
+        Represent a statement's shards without expanding them.
+
+            >>> from policyglass import Statement
+            >>> statement = Statement(Effect="Allow", Action=["s3:Get*", "s3:Put*"], Resource=["arn:aws:s3:::a/*", "*"])
+            >>> product_shard = statement.product_shard
+            >>> len(product_shard)
+            4
+            >>> product_shard.expand() == statement.policy_shards
+            True
+    """
+
+    __slots__ = ("effect", "effective_actions", "effective_resources", "effective_principals", "effective_condition")
+
+    def __init__(
+        self,
+        effect: str,
+        effective_actions: Iterable[EffectiveARP[Action]],
+        effective_resources: Iterable[EffectiveARP[Resource]],
+        effective_principals: Iterable[EffectiveARP[Principal]],
+        effective_condition: Optional[EffectiveCondition] = None,
+    ) -> None:
+        """Initialize a ProductShard object.
+
+        Parameters:
+            effect: `'Allow'` or `'Deny'`
+            effective_actions: The EffectiveActions that this ProductShard allows or denies
+            effective_resources: The EffectiveResources that this ProductShard allows or denies
+            effective_principals: The EffectivePrincipals that this ProductShard allows or denies
+            effective_condition: The EffectiveCondition that needs to be met for this ProductShard to apply
+        """
+        self.effect = effect
+        self.effective_actions: Tuple[EffectiveARP[Action], ...] = _unique(effective_actions)
+        self.effective_resources: Tuple[EffectiveARP[Resource], ...] = _unique(effective_resources)
+        self.effective_principals: Tuple[EffectiveARP[Principal], ...] = _unique(effective_principals)
+        self.effective_condition = effective_condition or EffectiveCondition(frozenset(), frozenset())
+
+    @classmethod
+    def from_policy_shard(cls, shard: PolicyShard) -> "ProductShard":
+        """Return a ProductShard of the single PolicyShard ``shard``.
+
+        Parameters:
+            shard: The PolicyShard to convert.
+        """
+        return cls(
+            effect=shard.effect,
+            effective_actions=[shard.effective_action],
+            effective_resources=[shard.effective_resource],
+            effective_principals=[shard.effective_principal],
+            effective_condition=shard.effective_condition,
+        )
+
+    def iter_expand(self) -> Iterator[PolicyShard]:
+        """Yield the PolicyShard of each combination of action, principal and resource, in that order."""
+        for effective_action in self.effective_actions:
+            for effective_principal in self.effective_principals:
+                for effective_resource in self.effective_resources:
+                    yield PolicyShard._construct(
+                        effect=self.effect,
+                        effective_action=effective_action,
+                        effective_resource=effective_resource,
+                        effective_principal=effective_principal,
+                        effective_condition=self.effective_condition,
+                    )
+
+    def expand(self) -> List[PolicyShard]:
+        """Return the PolicyShard of each combination of action, principal and resource, in that order."""
+        return list(self.iter_expand())
+
+    def __len__(self) -> int:
+        """Return the number of PolicyShards this ProductShard expands to."""
+        return len(self.effective_actions) * len(self.effective_resources) * len(self.effective_principals)
+
+    def issubset(self, other: object) -> bool:
+        """Whether every PolicyShard of this object is a subset of a PolicyShard of another object.
+
+        Each PolicyShard of ``other`` is a combination of its EffectiveARPs, so this holds exactly when the
+        conditions allow it and each of our EffectiveARPs is a subset of one of ``other``'s in the same dimension.
+
+        Parameters:
+            other: The object to determine if our object is contained by.
+
+        Raises:
+            ValueError: If the other object is not of the same type as this object.
+        """
+        if not isinstance(other, self.__class__):
+            raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
+        return (
+            self.effect == other.effect
+            and _effective_condition_issubset(self.effective_condition, other.effective_condition)
+            and _contained(self.effective_actions, other.effective_actions)
+            and _contained(self.effective_resources, other.effective_resources)
+            and _contained(self.effective_principals, other.effective_principals)
+        )
+
+    def intersection(self, other: object) -> Optional["ProductShard"]:
+        """Calculate the intersection between this object and another object of the same type.
+
+        The intersections of every pair of PolicyShards are the combinations of the intersections of every pair of
+        EffectiveARPs in each dimension, so the result expands to the same PolicyShards as intersecting the expanded
+        objects pairwise.
+
+        Parameters:
+            other: The object to intersect with this one.
+
+        Raises:
+            ValueError: if ``other`` is not the same type as this object.
+        """
+        if not isinstance(other, self.__class__):
+            raise ValueError(f"Cannot intersect {self.__class__.__name__} with {other.__class__.__name__}")
+        if self.effect == "Deny" and other.effect == "Allow":
+            raise ValueError("Cannot calculate deny.intersection(allow).")
+        effective_condition = _intersect_effective_conditions(
+            self.effect, self.effective_condition, other.effect, other.effective_condition
+        )
+        if effective_condition is None:
+            return None
+        result = self.__class__(
+            effect=self.effect,
+            effective_actions=_intersections(self.effective_actions, other.effective_actions),
+            effective_resources=_intersections(self.effective_resources, other.effective_resources),
+            effective_principals=_intersections(self.effective_principals, other.effective_principals),
+            effective_condition=effective_condition,
+        )
+        return result if result else None
+
+    def difference(self, other: object, dedupe_result: bool = True) -> List["ProductShard"]:
+        """Calculate the difference between this and another object of the same type.
+
+        This decomposes the difference in the same way as :meth:`policyglass.policy_shard.PolicyShard.difference`,
+        using the sets of EffectiveARPs in each dimension in place of single EffectiveARPs.
+
+        Parameters:
+            other:
+                The object to subtract from this one.
+            dedupe_result:
+                Whether to remove resulting ProductShards which are a subset of another.
+
+        Raises:
+            ValueError: If ``other`` is not the same type as this object.
+        """
+        if not isinstance(other, self.__class__):
+            raise ValueError(f"Cannot diff {self.__class__.__name__} with {other.__class__.__name__}")
+        if self.effect == "Deny" and other.effect == "Allow":
+            raise ValueError("Cannot calculate deny.difference(allow).")
+
+        intersection = self.intersection(other)
+        if not intersection:
+            return [self]
+
+        difference_actions = _differences(self.effective_actions, other.effective_actions)
+        difference_resources = _differences(self.effective_resources, other.effective_resources)
+        difference_principals = _differences(self.effective_principals, other.effective_principals)
+        if self.effect != other.effect:
+            combined_condition = self.effective_condition.union(other.effective_condition.reverse)
+        else:
+            combined_condition = self.effective_condition
+
+        candidates = [
+            self._with(difference_actions, intersection.effective_resources, intersection.effective_principals),
+            self._with(intersection.effective_actions, difference_resources, intersection.effective_principals),
+            self._with(intersection.effective_actions, intersection.effective_resources, difference_principals),
+        ]
+        candidates = [
+            self.__class__(
+                self.effect,
+                candidate.effective_actions,
+                candidate.effective_resources,
+                candidate.effective_principals,
+                combined_condition,
+            )
+            for candidate in candidates
+        ]
+        candidates += [
+            self._with(difference_actions, self.effective_resources, self.effective_principals),
+            self._with(self.effective_actions, difference_resources, self.effective_principals),
+            self._with(self.effective_actions, self.effective_resources, difference_principals),
+        ]
+        if other.effective_condition and self.effective_condition != other.effective_condition:
+            candidates.append(
+                self.__class__(
+                    self.effect,
+                    self.effective_actions,
+                    self.effective_resources,
+                    self.effective_principals,
+                    combined_condition,
+                )
+            )
+        result = [candidate for candidate in candidates if candidate]
+        if dedupe_result:
+            return _dedupe_product_shard_subsets(result)
+        return result
+
+    def _with(
+        self,
+        effective_actions: Iterable[EffectiveARP[Action]],
+        effective_resources: Iterable[EffectiveARP[Resource]],
+        effective_principals: Iterable[EffectiveARP[Principal]],
+    ) -> "ProductShard":
+        """Return a ProductShard with this object's effect and condition and the given EffectiveARPs.
+
+        Parameters:
+            effective_actions: The EffectiveActions of the new ProductShard
+            effective_resources: The EffectiveResources of the new ProductShard
+            effective_principals: The EffectivePrincipals of the new ProductShard
+        """
+        return self.__class__(
+            self.effect, effective_actions, effective_resources, effective_principals, self.effective_condition
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Determine whether this object and another object are equal.
+
+        Parameters:
+            other: The object to compare this one to.
+
+        Raises:
+            ValueError: When the object we are compared with is not of the same type.
+        """
+        if not isinstance(other, self.__class__):
+            raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
+        if self is other:
+            return True
+        return self.canonical_key == other.canonical_key
+
+    def __hash__(self) -> int:
+        """Return a hash of this object."""
+        return hash(self.canonical_key)
+
+    @property
+    def canonical_key(self) -> Tuple:
+        """Return a hashable key which is equal for ProductShards with the same effect, EffectiveARPs and condition."""
+        return (
+            self.effect,
+            frozenset(self.effective_actions),
+            frozenset(self.effective_resources),
+            frozenset(self.effective_principals),
+            self.effective_condition,
+        )
+
+    def __repr__(self) -> str:
+        """Return an instantiable representation of this object."""
+        return (
+            f"{self.__class__.__name__}(effect='{self.effect}', "
+            f"effective_actions={list(self.effective_actions)}, "
+            f"effective_resources={list(self.effective_resources)}, "
+            f"effective_principals={list(self.effective_principals)}, "
+            f"effective_condition={self.effective_condition})"
+        )
+
+
+def _dedupe_product_shard_subsets(shards: List[ProductShard]) -> List[ProductShard]:
+    """Remove ProductShards which are a subset of another ProductShard, keeping the first of any equal shards.
+
+    Parameters:
+        shards: The ProductShards to deduplicate.
+    """
+    result = []
+    for position, shard in enumerate(shards):
+        if any(
+            shard.issubset(other) and (not other.issubset(shard) or other_position < position)
+            for other_position, other in enumerate(shards)
+            if other_position != position
+        ):
+            continue
+        result.append(shard)
+    return result
@@ -1,12 +1,44 @@
 """Resource class."""
-from fnmatch import fnmatchcase
-from typing import List
+from typing import List, NamedTuple, Optional, Tuple
 
 from .effective_arp import EffectiveARP
+from .iam_glob import match_glob
+from .interning import InternableString
 
 
-class Resource(str):
-    """A resource ARN may be case sensitive or case insensitive depending on the resource type."""
+class ResourceArn(NamedTuple):
+    """The elements of a resource ARN, with blank elements replaced by ``*``."""
+
+    partition: str
+    service: str
+    region: str
+    account: str
+    resource: str
+
+
+class Resource(InternableString):
+    """A resource ARN may be case sensitive or case insensitive depending on the resource type.
+
+    The ARN is parsed once when the Resource is created and the parsed elements are used by all comparisons.
+    """
+
+    #: The parsed ARN, or None if this Resource is not an ARN (e.g. ``*``).
+    arn: Optional[ResourceArn]
+    #: The elements compared by :meth:`issubset`, ``arn`` followed by the elements of :attr:`arn`.
+    _elements: Tuple[str, ...]
+
+    @classmethod
+    def _create(cls, value: object) -> "Resource":
+        """Create a new instance with its ARN parsed.
+
+        Parameters:
+            value: The value of the string.
+        """
+        instance = str.__new__(cls, value)
+        elements = tuple(element or "*" for element in instance.split(":", 5))
+        instance._elements = elements
+        instance.arn = ResourceArn(*elements[1:]) if len(elements) == 6 and elements[0] == "arn" else None
+        return instance
 
     def __lt__(self, other: object) -> bool:
         """Whether this object contains (but is not equal to) another object.
@@ -21,7 +53,7 @@ class Resource(str):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
         if self == other:
             return False
-        return fnmatchcase(self, other)
+        return self.issubset(other)
 
     def issubset(self, other: object) -> bool:
         """Whether this object contains all the elements of another object (i.e. is a subset of the other object).
@@ -34,15 +66,18 @@ class Resource(str):
         """
         if not isinstance(other, self.__class__):
             raise ValueError(f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__}")
-        for self_element, other_element in zip(self.arn_elements, other.arn_elements):
-            if not fnmatchcase(self_element, other_element):
+        last = min(len(self._elements), len(other._elements)) - 1
+        for self_element, other_element in zip(self._elements[:last], other._elements[:last]):
+            if not match_glob(self_element, other_element):
                 return False
-        return True
+        # If the element counts differ the remaining elements are compared whole, so a wildcard in the shorter
+        # resource's last element can absorb the longer resource's extra elements.
+        return match_glob(":".join(self._elements[last:]), ":".join(other._elements[last:]))
 
     @property
     def arn_elements(self) -> List[str]:
         """Return a list of arn elements, replacing blanks with ``*``."""
-        return [element or "*" for element in self.split(":")]
+        return list(self._elements)
 
     def __contains__(self, other: object) -> bool:
         """Not Implemented.
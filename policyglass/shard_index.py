@@ -0,0 +1,464 @@
+"""Indexes which narrow down the PolicyShards that need to be compared with a given PolicyShard.
+
+Comparing every PolicyShard with every other PolicyShard is quadratic, but most pairs can be ruled out cheaply.
+An ``ec2:*`` shard can never contain an ``s3:GetObject`` shard, and a shard for account ``111111111111`` can
+never contain one for account ``222222222222``. The indexes here bucket shards by the literal parts of their
+inclusions so that only shards which could possibly match are compared.
+
+Indexes only ever rule out shards that cannot match, the candidates they return must still be compared.
+"""
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, DefaultDict, Dict, Hashable, Iterable, List, Optional, Set, cast
+
+from .action import Action
+from .iam_glob import classify_glob, match_glob
+from .principal import Principal
+from .resource import Resource
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .policy_shard import PolicyShard
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the characters of ``pattern`` before its first wildcard.
+
+    Parameters:
+        pattern: The pattern to get the literal prefix of.
+    """
+    for position, character in enumerate(pattern):
+        if character in "*?":
+            return pattern[:position]
+    return pattern
+
+
+def _literal_or_none(element: str) -> Optional[str]:
+    """Return ``element`` if it contains no wildcards, otherwise None.
+
+    Parameters:
+        element: The pattern element to check.
+    """
+    return element if classify_glob(element) == "literal" else None
+
+
+def action_key(action: Action) -> Optional[str]:
+    """Return the case folded service prefix of an Action, or None if the service prefix contains a wildcard.
+
+    Parameters:
+        action: The action to get the key of.
+    """
+    service, separator, _ = action._folded.partition(":")
+    return _literal_or_none(service) if separator else None
+
+
+def principal_key(principal: Principal) -> Optional[str]:
+    """Return the account element of a Principal, or None if any account's principal may be a subset of it.
+
+    Parameters:
+        principal: The principal to get the key of.
+    """
+    if principal.value == "*" or len(principal._arn_elements) <= 4:
+        return None
+    return principal._arn_elements[4] or None
+
+
+class _KeyBuckets:
+    """Positions grouped by a key, where the key None means the position may match any key."""
+
+    def __init__(self) -> None:
+        self.buckets: DefaultDict[Optional[Hashable], Set[int]] = defaultdict(set)
+
+    def add(self, key: Optional[Hashable], position: int) -> None:
+        self.buckets[key].add(position)
+
+    def candidates(self, key: Optional[Hashable]) -> Set[int]:
+        """Return the positions which might match a value with ``key``.
+
+        Parameters:
+            key: The key of the value, or None if the value may match any key.
+        """
+        result = set(self.buckets.get(None, ()))
+        if key is not None:
+            result.update(self.buckets.get(key, ()))
+        return result
+
+    def comparable(self, key: Optional[Hashable]) -> Set[int]:
+        """Return the positions which might be a subset or superset of a value with ``key``.
+
+        Parameters:
+            key: The key of the value, or None if the value may match any key.
+        """
+        if key is None:
+            return self.all()
+        return self.candidates(key)
+
+    def all(self) -> Set[int]:
+        return set().union(*self.buckets.values())
+
+
+class _TrieNode:
+    __slots__ = ("children", "patterns")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        #: The items stored against each case folded pattern whose literal prefix ends at this node.
+        self.patterns: Dict[str, Set[Hashable]] = {}
+
+
+class ActionTrie:
+    """A case folded trie of Action patterns, for finding the patterns which contain or are contained by an Action.
+
+    Each pattern is stored at the node for its literal prefix, the characters before its first wildcard.
+    A pattern can only contain an Action which starts with its literal prefix, so the patterns which could contain
+    an Action are found along the path spelled out by the Action. A pattern can only be contained by an Action if it
+    starts with the Action's literal prefix, so those patterns are found beneath the node for that prefix.
+
+    Items can be stored against each pattern (e.g. the positions of the PolicyShards the pattern came from), the
+    Action itself is stored if no item is given.
+
+    Example:
+        Find the patterns which contain an Action.
+
+            >>> from policyglass import Action
+            >>> from policyglass.shard_index import ActionTrie
+            >>> trie = ActionTrie([Action("s3:*"), Action("s3:Get*"), Action("ec2:*")])
+            >>> sorted(trie.containing(Action("S3:GetObject")), key=str)
+            [Action('s3:*'), Action('s3:Get*')]
+            >>> sorted(trie.contained_by(Action("s3:*")), key=str)
+            [Action('s3:*'), Action('s3:Get*')]
+    """
+
+    def __init__(self, actions: Iterable[Action] = ()) -> None:
+        """Initialise the trie with ``actions``.
+
+        Parameters:
+            actions: The Actions to store.
+        """
+        self._root = _TrieNode()
+        for action in actions:
+            self.add(action)
+
+    def add(self, action: Action, item: Optional[Hashable] = None) -> None:
+        """Store ``item`` against ``action``.
+
+        Parameters:
+            action: The Action pattern to store the item against.
+            item: The item to store, defaults to ``action``.
+        """
+        pattern = action._folded
+        node = self._root
+        for character in pattern:
+            if character in "*?":
+                break
+            node = node.children.setdefault(character, _TrieNode())
+        node.patterns.setdefault(pattern, set()).add(action if item is None else item)
+
+    def containing(self, action: Action) -> Set[Hashable]:
+        """Return the items stored against patterns which contain ``action``.
+
+        This takes time proportional to the length of ``action`` plus the number of patterns along its path.
+
+        Parameters:
+            action: The Action to find the containing patterns of.
+        """
+        name = action._folded
+        result: Set[Hashable] = set()
+        node: Optional[_TrieNode] = self._root
+        position = 0
+        while node is not None:
+            for pattern, items in node.patterns.items():
+                if match_glob(name, pattern):
+                    result.update(items)
+            if position == len(name):
+                break
+            node = node.children.get(name[position])
+            position += 1
+        return result
+
+    def contained_by(self, action: Action) -> Set[Hashable]:
+        """Return the items stored against patterns which are contained by ``action``.
+
+        Parameters:
+            action: The Action to find the contained patterns of.
+        """
+        pattern = action._folded
+        node = self._root
+        for character in pattern:
+            if character in "*?":
+                break
+            child = node.children.get(character)
+            if child is None:
+                return set()
+            node = child
+        result: Set[Hashable] = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for stored_pattern, items in node.patterns.items():
+                if match_glob(stored_pattern, pattern):
+                    result.update(items)
+            stack.extend(node.children.values())
+        return result
+
+    def comparable(self, action: Action) -> Set[Hashable]:
+        """Return the items stored against patterns which contain or are contained by ``action``.
+
+        Parameters:
+            action: The Action to find the comparable patterns of.
+        """
+        return self.containing(action) | self.contained_by(action)
+
+
+class ResourceIndex:
+    """An index of Resource patterns sorted by literal prefix, for finding containing and contained patterns.
+
+    Resources are compared element by element, with blank elements treated as ``*``. An ARN can only be contained by
+    a pattern if the ARN's elements start with the pattern's literal prefix (the characters before its first
+    wildcard), so the containing patterns are found by looking up each prefix of the ARN's literal prefix. The
+    patterns an ARN contains must start with the ARN's literal prefix, so they are found with a bisected range search
+    over the sorted literal prefixes.
+
+    Resources which are not made up of six elements (e.g. ``*``) are only compared for as many elements as they
+    have, so they are always compared directly.
+
+    Items can be stored against each pattern (e.g. the positions of the PolicyShards the pattern came from), the
+    Resource itself is stored if no item is given.
+
+    Example:
+        Find the patterns which contain a Resource.
+
+            >>> from policyglass import Resource
+            >>> from policyglass.shard_index import ResourceIndex
+            >>> index = ResourceIndex(
+            ...     [Resource("arn:aws:s3:::bucket/*"), Resource("arn:aws:s3:::other/*"), Resource("*")]
+            ... )
+            >>> sorted(index.containing(Resource("arn:aws:s3:::bucket/key")), key=str)
+            [Resource('*'), Resource('arn:aws:s3:::bucket/*')]
+            >>> sorted(index.contained_by(Resource("arn:aws:s3:::*")), key=str)
+            [Resource('arn:aws:s3:::bucket/*'), Resource('arn:aws:s3:::other/*')]
+    """
+
+    def __init__(self, resources: Iterable[Resource] = ()) -> None:
+        """Initialise the index with ``resources``.
+
+        Parameters:
+            resources: The Resources to store.
+        """
+        self._prefixes: List[str] = []
+        self._prefix_lengths: Set[int] = set()
+        self._patterns: Dict[str, Dict[Resource, Set[Hashable]]] = {}
+        self._irregular_patterns: Dict[Resource, Set[Hashable]] = {}
+        for resource in resources:
+            self.add(resource)
+
+    def add(self, resource: Resource, item: Optional[Hashable] = None) -> None:
+        """Store ``item`` against ``resource``.
+
+        Parameters:
+            resource: The Resource pattern to store the item against.
+            item: The item to store, defaults to ``resource``.
+        """
+        if len(resource._elements) != 6:
+            patterns = self._irregular_patterns
+        else:
+            prefix = _literal_prefix(":".join(resource._elements))
+            if prefix not in self._patterns:
+                insort(self._prefixes, prefix)
+                self._prefix_lengths.add(len(prefix))
+                self._patterns[prefix] = {}
+            patterns = self._patterns[prefix]
+        patterns.setdefault(resource, set()).add(resource if item is None else item)
+
+    def containing(self, resource: Resource) -> Set[Hashable]:
+        """Return the items stored against patterns which contain ``resource``.
+
+        Parameters:
+            resource: The Resource to find the containing patterns of.
+        """
+        if len(resource._elements) != 6:
+            return self._matching(self._all_patterns(), lambda pattern: resource.issubset(pattern))
+        prefix = _literal_prefix(":".join(resource._elements))
+        candidates = [
+            self._patterns[prefix[:length]]
+            for length in self._prefix_lengths
+            if length <= len(prefix) and prefix[:length] in self._patterns
+        ]
+        candidates.append(self._irregular_patterns)
+        return self._matching(candidates, lambda pattern: resource.issubset(pattern))
+
+    def contained_by(self, resource: Resource) -> Set[Hashable]:
+        """Return the items stored against patterns which are contained by ``resource``.
+
+        Parameters:
+            resource: The Resource to find the contained patterns of.
+        """
+        if len(resource._elements) != 6:
+            return self._matching(self._all_patterns(), lambda pattern: pattern.issubset(resource))
+        prefix = _literal_prefix(":".join(resource._elements))
+        candidates = []
+        for position in range(bisect_left(self._prefixes, prefix), len(self._prefixes)):
+            if not self._prefixes[position].startswith(prefix):
+                break
+            candidates.append(self._patterns[self._prefixes[position]])
+        candidates.append(self._irregular_patterns)
+        return self._matching(candidates, lambda pattern: pattern.issubset(resource))
+
+    def comparable(self, resource: Resource) -> Set[Hashable]:
+        """Return the items stored against patterns which contain or are contained by ``resource``.
+
+        Parameters:
+            resource: The Resource to find the comparable patterns of.
+        """
+        return self.containing(resource) | self.contained_by(resource)
+
+    def _all_patterns(self) -> List[Dict[Resource, Set[Hashable]]]:
+        return [*self._patterns.values(), self._irregular_patterns]
+
+    @staticmethod
+    def _matching(
+        candidates: Iterable[Dict[Resource, Set[Hashable]]], predicate: Callable[[Resource], bool]
+    ) -> Set[Hashable]:
+        result: Set[Hashable] = set()
+        for patterns in candidates:
+            for pattern, items in patterns.items():
+                if predicate(pattern):
+                    result.update(items)
+        return result
+
+
+class PolicyShardIndex:
+    """An index of PolicyShards which returns the shards that could be supersets of a given shard.
+
+    A shard can only be a subset of another if its action, resource and principal inclusions are subsets of the other
+    shard's. Shards are bucketed by:
+
+    * Their action inclusion, in an :class:`ActionTrie`.
+    * Their resource inclusion, in a :class:`ResourceIndex`.
+    * The type and account of their principal inclusion.
+
+    An inclusion with a wildcard in one of these elements goes into a bucket which is always a candidate.
+
+    Example:
+        Find the shards which might contain another shard.
+
+            >>> from policyglass import Policy
+            >>> from policyglass.shard_index import PolicyShardIndex
+            >>> policy = Policy(
+            ...     **{
+            ...         "Statement": [
+            ...             {"Effect": "Allow", "Action": ["s3:*", "ec2:*"], "Resource": "*"},
+            ...         ],
+            ...     }
+            ... )
+            >>> index = PolicyShardIndex(policy.policy_shards)
+            >>> get_object = Policy(**{"Statement": [{"Effect": "Allow", "Action": "s3:GetObject"}]}).policy_shards[0]
+            >>> [shard.effective_action.inclusion for shard in index.superset_candidates(get_object)]
+            [Action('s3:*')]
+    """
+
+    def __init__(self, shards: Iterable["PolicyShard"] = ()) -> None:
+        """Initialise the index with ``shards``.
+
+        Parameters:
+            shards: The PolicyShards to index.
+        """
+        self.shards: List["PolicyShard"] = []
+        self._removed: Set[int] = set()
+        self._actions = ActionTrie()
+        self._resources = ResourceIndex()
+        self._principals: Dict[str, _KeyBuckets] = defaultdict(_KeyBuckets)
+        for shard in shards:
+            self.add(shard)
+
+    def add(self, shard: "PolicyShard") -> None:
+        """Add a PolicyShard to the index.
+
+        Parameters:
+            shard: The PolicyShard to add.
+        """
+        position = len(self.shards)
+        self.shards.append(shard)
+        self._actions.add(shard.effective_action.inclusion, position)
+
+        self._resources.add(shard.effective_resource.inclusion, position)
+
+        principal = shard.effective_principal.inclusion
+        self._principals[principal.type].add(principal_key(principal), position)
+
+    def remove(self, position: int) -> None:
+        """Stop returning the shard at ``position`` as a candidate.
+
+        The shard stays in :attr:`shards` so the positions of the other shards are unchanged.
+
+        Parameters:
+            position: The position of the shard to remove.
+        """
+        self._removed.add(position)
+
+    def superset_candidates(self, shard: "PolicyShard") -> List["PolicyShard"]:
+        """Return the indexed shards which could be supersets of ``shard``, in the order they were added.
+
+        Parameters:
+            shard: The PolicyShard to find candidate supersets of.
+        """
+        positions = cast(Set[int], self._actions.containing(shard.effective_action.inclusion))
+        if positions:
+            positions &= cast(Set[int], self._resources.containing(shard.effective_resource.inclusion))
+        if positions:
+            positions &= self._principal_candidates(shard.effective_principal.inclusion)
+        positions -= self._removed
+        return [self.shards[position] for position in sorted(positions)]
+
+    def comparable_candidates(self, shard: "PolicyShard") -> List["PolicyShard"]:
+        """Return the indexed shards which could be subsets or supersets of, or intersect with ``shard``.
+
+        The shards are returned in the order they were added. EffectiveARPs only intersect if one inclusion contains
+        the other, so every other shard has no intersection with ``shard`` and is not a subset or superset of it.
+
+        Parameters:
+            shard: The PolicyShard to find candidates for.
+        """
+        return [self.shards[position] for position in self.comparable_positions(shard)]
+
+    def comparable_positions(self, shard: "PolicyShard") -> List[int]:
+        """Return the positions of the shards :meth:`comparable_candidates` would return, in ascending order.
+
+        Parameters:
+            shard: The PolicyShard to find candidates for.
+        """
+        positions = cast(Set[int], self._actions.comparable(shard.effective_action.inclusion))
+        if positions:
+            positions &= cast(Set[int], self._resources.comparable(shard.effective_resource.inclusion))
+        if positions:
+            positions &= self._comparable_principal_candidates(shard.effective_principal.inclusion)
+        positions -= self._removed
+        return sorted(positions)
+
+    def containing_action(self, action: Action) -> List["PolicyShard"]:
+        """Return the indexed shards whose EffectiveAction contains ``action``, in the order they were added.
+
+        Parameters:
+            action: The Action to look up.
+        """
+        positions = cast(Set[int], self._actions.containing(action)) - self._removed
+        return [
+            self.shards[position] for position in sorted(positions) if action in self.shards[position].effective_action
+        ]
+
+    def _comparable_principal_candidates(self, principal: Principal) -> Set[int]:
+        buckets = self._principals.get(principal.type)
+        if buckets is None:
+            return set()
+        return buckets.comparable(principal_key(principal))
+
+    def _principal_candidates(self, principal: Principal) -> Set[int]:
+        buckets = self._principals.get(principal.type)
+        if buckets is None:
+            return set()
+        if len(principal._arn_elements) <= 4:
+            return buckets.all()
+        return buckets.candidates(principal._arn_elements[4])
+
+    def __len__(self) -> int:
+        """Return the number of indexed shards which have not been removed."""
+        return len(self.shards) - len(self._removed)
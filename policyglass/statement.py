@@ -1,8 +1,8 @@
 """Statement class."""
 
-from typing import Dict, FrozenSet, List, Optional, Tuple, TypeVar, Union
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, TypeVar, Union
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
 from .action import Action, EffectiveAction
 from .condition import (
@@ -13,8 +13,10 @@ from .condition import (
     EffectiveCondition,
     RawConditionCollection,
 )
-from .policy_shard import PolicyShard
+from .effective_arp import EffectiveARP
+from .policy_shard import PolicyShard, _copy_policy_shards
 from .principal import EffectivePrincipal, Principal, PrincipalCollection, PrincipalType, PrincipalValue
+from .product_shard import ProductShard
 from .resource import EffectiveResource, Resource
 from .utils import to_pascal
 
@@ -39,6 +41,8 @@ class Statement(BaseModel):
     not_principal: Optional[PrincipalCollection]
     condition: Optional[RawConditionCollection]
 
+    _policy_shards: Optional[Tuple[Tuple[object, ...], Tuple[PolicyShard, ...]]] = PrivateAttr(default=None)
+
     class Config:
         """Configure the Pydantic BaseModel."""
 
@@ -49,41 +53,90 @@ class Statement(BaseModel):
 
     @property
     def policy_shards(self) -> List[PolicyShard]:
+        """Shatter this statement into :class:`~policyglass.policy_shard.PolicyShard` objects.
+
+        The shards are cached until a field of the statement is assigned a new value. Changes made in place to a
+        field's value, such as appending to :attr:`action`, are not detected; call
+        :meth:`clear_policy_shards_cache` after making them. Copies of the cached shards are returned, so changing
+        them does not affect the cache.
+        """
+        return _copy_policy_shards(self._cached_policy_shards())
+
+    def _cached_policy_shards(self) -> Tuple[PolicyShard, ...]:
+        """Return the cached shards of this statement, calculating them if a field has been reassigned.
+
+        The shards themselves are returned, so they must not be changed.
+        """
+        fields = tuple(getattr(self, name) for name in self.__fields__)
+        cached = self._policy_shards
+        if cached is None or not all(value is cached_value for value, cached_value in zip(fields, cached[0])):
+            cached = self._policy_shards = (fields, tuple(self.iter_policy_shards()))
+        return cached[1]
+
+    def clear_policy_shards_cache(self) -> None:
+        """Drop the cached shards of this statement."""
+        self._policy_shards = None
+
+    @property
+    def product_shard(self) -> ProductShard:
+        """Return a :class:`~policyglass.product_shard.ProductShard` which expands to :attr:`policy_shards`."""
+        effective_actions, effective_resources, effective_principals, effective_condition = self._shard_elements()
+        return ProductShard(
+            effect=self.effect,
+            effective_actions=effective_actions,
+            effective_resources=effective_resources,
+            effective_principals=effective_principals,
+            effective_condition=effective_condition,
+        )
+
+    def iter_policy_shards(self) -> Iterator[PolicyShard]:
+        """Yield the shards of :attr:`policy_shards` one at a time without building the list.
+
+        Example:
+            Count the shards of a statement.
+
+                >>> from policyglass import Statement
+                >>> statement = Statement(Effect="Allow", Action=["s3:Get*", "s3:Put*"], Resource="*")
+                >>> sum(1 for _ in statement.iter_policy_shards())
+                2
+        """
+        effective_actions, effective_resources, effective_principals, effective_condition = self._shard_elements()
+        for effective_action in effective_actions:
+            for effective_principal in effective_principals:
+                for effective_resource in effective_resources:
+                    yield PolicyShard(
+                        effect=self.effect,
+                        effective_action=effective_action,
+                        effective_resource=effective_resource,
+                        effective_principal=effective_principal,
+                        effective_condition=effective_condition,
+                    )
+
+    def _shard_elements(
+        self,
+    ) -> Tuple[
+        List[EffectiveARP[Action]], List[EffectiveARP[Resource]], List[EffectiveARP[Principal]], EffectiveCondition
+    ]:
+        """Return the EffectiveActions, EffectiveResources, EffectivePrincipals and EffectiveCondition of the shards."""
         conditions: FrozenSet[Condition] = frozenset({})
         not_principals: FrozenSet[Principal] = frozenset({})
         if self.condition:
             conditions = frozenset(self.condition.conditions)
         if self.not_principal:
             not_principals = frozenset(self.not_principal.principals)
-        result = []
-        arps = []
-        for action in self.action or [Action("*")]:
-            if self.principal:
-                principals = self.principal.principals
-            else:
-                principals = [Principal(PrincipalType("AWS"), PrincipalValue("*"))]
-            for principal in principals:
-                for resource in self.resource or [Resource("*")]:
-                    arp: Tuple[Action, Resource, Principal] = (action, resource, principal)
-                    arps.append(arp)
-
-        for action, resource, principal in arps:
-            result.append(
-                PolicyShard(
-                    effect=self.effect,
-                    effective_action=EffectiveAction(
-                        action,
-                        exclusions=frozenset(self.not_action or {}),
-                    ),
-                    effective_resource=EffectiveResource(
-                        resource,
-                        exclusions=frozenset(self.not_resource or {}),
-                    ),
-                    effective_principal=EffectivePrincipal(principal, exclusions=not_principals),
-                    effective_condition=EffectiveCondition(conditions),
-                )
-            )
-        return result
+        not_actions = frozenset(self.not_action or {})
+        not_resources = frozenset(self.not_resource or {})
+        if self.principal:
+            principals = self.principal.principals
+        else:
+            principals = [Principal(PrincipalType("AWS"), PrincipalValue("*"))]
+
+        return (
+            [EffectiveAction(action, exclusions=not_actions) for action in self.action or [Action("*")]],
+            [EffectiveResource(resource, exclusions=not_resources) for resource in self.resource or [Resource("*")]],
+            [EffectivePrincipal(principal, exclusions=not_principals) for principal in principals],
+            EffectiveCondition(conditions),
+        )
 
     @validator("action", "not_action", pre=True)
     def ensure_action_list(cls, v: T) -> List[Action]:
@@ -78,8 +78,8 @@ DIFFERENCE_SCENARIOS = {
                 effective_action=EffectiveAction(inclusion=Action("s3:*"), exclusions=frozenset()),
                 effective_resource=EffectiveResource(inclusion=Resource("*"), exclusions=frozenset()),
                 effective_principal=EffectivePrincipal(
-                    inclusion=Principal(type="AWS", value="*"),
-                    exclusions=frozenset({Principal(type="AWS", value="arn:aws:iam::123456789012:root")}),
+                    inclusion=Principal(type="AWS", value="arn:aws:iam::123456789012:role/RoleName"),
+                    exclusions=frozenset(),
                 ),
             ),
             PolicyShard(
@@ -87,8 +87,8 @@ DIFFERENCE_SCENARIOS = {
                 effective_action=EffectiveAction(inclusion=Action("s3:*"), exclusions=frozenset()),
                 effective_resource=EffectiveResource(inclusion=Resource("*"), exclusions=frozenset()),
                 effective_principal=EffectivePrincipal(
-                    inclusion=Principal(type="AWS", value="arn:aws:iam::123456789012:role/RoleName"),
-                    exclusions=frozenset(),
+                    inclusion=Principal(type="AWS", value="*"),
+                    exclusions=frozenset({Principal(type="AWS", value="arn:aws:iam::123456789012:root")}),
                 ),
             ),
         ],
@@ -178,8 +178,12 @@ DIFFERENCE_SCENARIOS = {
                 effective_action=EffectiveAction(inclusion=Action("*"), exclusions=frozenset()),
                 effective_resource=EffectiveResource(inclusion=Resource("*"), exclusions=frozenset()),
                 effective_principal=EffectivePrincipal(
-                    inclusion=Principal(type="AWS", value="*"),
-                    exclusions=frozenset({Principal(type="AWS", value="arn:aws:iam::123456789012:root")}),
+                    inclusion=Principal(type="AWS", value="*"), exclusions=frozenset()
+                ),
+                effective_condition=EffectiveCondition(
+                    exclusions=frozenset(
+                        {Condition(key="Key", operator="BinaryEquals", values=["QmluYXJ5VmFsdWVJbkJhc2U2NA=="])}
+                    )
                 ),
             ),
             PolicyShard(
@@ -187,12 +191,8 @@ DIFFERENCE_SCENARIOS = {
                 effective_action=EffectiveAction(inclusion=Action("*"), exclusions=frozenset()),
                 effective_resource=EffectiveResource(inclusion=Resource("*"), exclusions=frozenset()),
                 effective_principal=EffectivePrincipal(
-                    inclusion=Principal(type="AWS", value="*"), exclusions=frozenset()
-                ),
-                effective_condition=EffectiveCondition(
-                    exclusions=frozenset(
-                        {Condition(key="Key", operator="BinaryEquals", values=["QmluYXJ5VmFsdWVJbkJhc2U2NA=="])}
-                    )
+                    inclusion=Principal(type="AWS", value="*"),
+                    exclusions=frozenset({Principal(type="AWS", value="arn:aws:iam::123456789012:root")}),
                 ),
             ),
         ],
@@ -414,35 +414,35 @@ DIFFERENCE_SCENARIOS = {
             ),
             PolicyShard(
                 effect="Allow",
-                effective_action=EffectiveAction(
-                    inclusion=Action("s3:*"), exclusions=frozenset({Action("s3:PutObject")})
-                ),
+                effective_action=EffectiveAction(inclusion=Action("s3:*"), exclusions=frozenset()),
                 effective_resource=EffectiveResource(inclusion=Resource("*"), exclusions=frozenset()),
                 effective_principal=EffectivePrincipal(
                     inclusion=Principal(type="AWS", value="*"), exclusions=frozenset()
                 ),
                 effective_condition=EffectiveCondition(
                     inclusions=frozenset(
-                        {Condition(key="aws:PrincipalOrgId", operator="StringNotEquals", values=["o-123456"])}
+                        {
+                            Condition(
+                                key="s3:x-amz-server-side-encryption", operator="StringEquals", values=["AES256"]
+                            ),
+                            Condition(key="aws:PrincipalOrgId", operator="StringNotEquals", values=["o-123456"]),
+                        }
                     ),
                     exclusions=frozenset(),
                 ),
             ),
             PolicyShard(
                 effect="Allow",
-                effective_action=EffectiveAction(inclusion=Action("s3:*"), exclusions=frozenset()),
+                effective_action=EffectiveAction(
+                    inclusion=Action("s3:*"), exclusions=frozenset({Action("s3:PutObject")})
+                ),
                 effective_resource=EffectiveResource(inclusion=Resource("*"), exclusions=frozenset()),
                 effective_principal=EffectivePrincipal(
                     inclusion=Principal(type="AWS", value="*"), exclusions=frozenset()
                 ),
                 effective_condition=EffectiveCondition(
                     inclusions=frozenset(
-                        {
-                            Condition(
-                                key="s3:x-amz-server-side-encryption", operator="StringEquals", values=["AES256"]
-                            ),
-                            Condition(key="aws:PrincipalOrgId", operator="StringNotEquals", values=["o-123456"]),
-                        }
+                        {Condition(key="aws:PrincipalOrgId", operator="StringNotEquals", values=["o-123456"])}
                     ),
                     exclusions=frozenset(),
                 ),
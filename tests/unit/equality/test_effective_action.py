@@ -3,3 +3,11 @@ from policyglass import Action, EffectiveAction
 
 def test_equality_true():
     assert EffectiveAction(Action("s3:*")) == EffectiveAction(Action("s3:*"))
+
+
+def test_hash_equal():
+    subject = EffectiveAction(Action("s3:*"), frozenset({Action("s3:Get*"), Action("s3:Put*")}))
+    other = EffectiveAction(Action("S3:*"), frozenset({Action("s3:put*"), Action("s3:get*")}))
+
+    assert hash(subject) == hash(other)
+    assert len({subject, other}) == 1
@@ -90,3 +90,53 @@ SHARD_NOT_MATCH_SCENARIOS = {
 @pytest.mark.parametrize("_, scenario", SHARD_NOT_MATCH_SCENARIOS.items())
 def test_sgard_inequality(_, scenario):
     assert scenario[0] != scenario[1]
+
+
+def test_construct_equal_to_validated():
+    fields = dict(
+        effect="Allow",
+        effective_action=EffectiveAction(inclusion=Action("s3:*"), exclusions=frozenset({Action("s3:Get*")})),
+        effective_resource=EffectiveResource(inclusion=Resource("*")),
+        effective_principal=EffectivePrincipal(inclusion=Principal(type="AWS", value="*")),
+        effective_condition=EffectiveCondition(
+            frozenset({Condition(key="aws:PrincipalOrgId", operator="StringEquals", values=["o-123456"])})
+        ),
+    )
+
+    validated = PolicyShard(**fields)
+    constructed = PolicyShard._construct(**fields)
+
+    assert constructed == validated
+    assert constructed.effect == validated.effect
+    assert constructed.json() == validated.json()
+    assert constructed.__fields_set__ == validated.__fields_set__
+
+
+def test_hash_equal():
+    subject = PolicyShard(
+        effect="Allow",
+        effective_action=EffectiveAction(inclusion=Action("s3:*")),
+        effective_resource=EffectiveResource(inclusion=Resource("*")),
+        effective_principal=EffectivePrincipal(inclusion=Principal(type="AWS", value="*")),
+    )
+    other = PolicyShard(
+        effect="Allow",
+        effective_action=EffectiveAction(inclusion=Action("S3:*")),
+        effective_resource=EffectiveResource(inclusion=Resource("*")),
+        effective_principal=EffectivePrincipal(inclusion=Principal(type="AWS", value="*")),
+    )
+
+    assert hash(subject) == hash(other)
+    assert subject.canonical_key == other.canonical_key
+
+
+def test_canonical_key_effect():
+    shard_fields = dict(
+        effective_action=EffectiveAction(inclusion=Action("s3:*")),
+        effective_resource=EffectiveResource(inclusion=Resource("*")),
+        effective_principal=EffectivePrincipal(inclusion=Principal(type="AWS", value="*")),
+    )
+
+    assert PolicyShard(effect="Allow", **shard_fields).canonical_key != PolicyShard(
+        effect="Deny", **shard_fields
+    ).canonical_key
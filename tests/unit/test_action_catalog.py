@@ -0,0 +1,191 @@
+import io
+import json
+
+import pytest
+
+from policyglass import Action, EffectiveAction, Policy, PolicyShard, Statement, dedupe_policy_shards
+from policyglass.action_catalog import (
+    ActionCatalog,
+    action_catalog,
+    active_action_catalog,
+    disable_action_catalog,
+    enable_action_catalog,
+)
+
+CATALOG = ActionCatalog(
+    [
+        "s3:GetObject",
+        "s3:GetObjectAcl",
+        "s3:GetBucketPolicy",
+        "s3:PutObject",
+        "s3:DeleteObject",
+        "ec2:RunInstances",
+        "ec2:TerminateInstances",
+        "iam:GetRole",
+    ]
+)
+
+ACTION_BITS_SCENARIOS = {
+    "literal": ["s3:GetObject", ["s3:getobject"]],
+    "literal_case_folded": ["S3:getOBJECT", ["s3:getobject"]],
+    "literal_missing": ["s3:GetObjectTagging", []],
+    "prefix": ["s3:GetObject*", ["s3:getobject", "s3:getobjectacl"]],
+    "service": ["ec2:*", ["ec2:runinstances", "ec2:terminateinstances"]],
+    "wildcard": [
+        "*",
+        [
+            "ec2:runinstances",
+            "ec2:terminateinstances",
+            "iam:getrole",
+            "s3:deleteobject",
+            "s3:getbucketpolicy",
+            "s3:getobject",
+            "s3:getobjectacl",
+            "s3:putobject",
+        ],
+    ],
+    "suffix": ["*Object", ["s3:deleteobject", "s3:getobject", "s3:putobject"]],
+    "general": ["s3:*Object?cl", ["s3:getobjectacl"]],
+    "service_wildcard": ["*:Get*", ["iam:getrole", "s3:getbucketpolicy", "s3:getobject", "s3:getobjectacl"]],
+}
+
+
+@pytest.mark.parametrize("_, scenario", ACTION_BITS_SCENARIOS.items())
+def test_action_bits(_, scenario):
+    pattern, expected = scenario
+
+    assert CATALOG.actions(CATALOG.action_bits(Action(pattern))) == expected
+
+
+def test_effective_bits():
+    effective_action = EffectiveAction(Action("s3:*"), frozenset({Action("s3:Get*")}))
+
+    assert CATALOG.actions(CATALOG.effective_bits(effective_action)) == ["s3:deleteobject", "s3:putobject"]
+    assert CATALOG.effective_bits(EffectiveAction(Action("sqs:*"))) is None
+    assert CATALOG.effective_bits(EffectiveAction(Action("s3:GetO*"), frozenset({Action("s3:GetObject*")}))) is None
+
+
+def test_invalid_catalog_action():
+    with pytest.raises(ValueError):
+        ActionCatalog(["s3:Get*"])
+
+
+FROM_JSON_SCENARIOS = {
+    "list": [["s3:GetObject", "ec2:RunInstances"], ["ec2:runinstances", "s3:getobject"]],
+    "services": [{"s3": ["GetObject", "s3:PutObject"]}, ["s3:getobject", "s3:putobject"]],
+}
+
+
+@pytest.mark.parametrize("_, scenario", FROM_JSON_SCENARIOS.items())
+def test_from_json(_, scenario, tmp_path):
+    data, expected = scenario
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(data))
+
+    assert ActionCatalog.from_json(str(path)).actions(-1) == expected
+    assert ActionCatalog.from_json(io.StringIO(json.dumps(data))).actions(-1) == expected
+
+
+def test_from_json_invalid():
+    with pytest.raises(ValueError):
+        ActionCatalog.from_json(io.StringIO('"s3:GetObject"'))
+
+
+def test_action_catalog_context():
+    other_catalog = ActionCatalog(["s3:GetObject"])
+    enable_action_catalog(other_catalog)
+    try:
+        with action_catalog(CATALOG):
+            assert active_action_catalog() is CATALOG
+        assert active_action_catalog() is other_catalog
+    finally:
+        disable_action_catalog()
+    assert active_action_catalog() is None
+
+
+def effective_action(inclusion, *exclusions):
+    return EffectiveAction(Action(inclusion), frozenset(Action(exclusion) for exclusion in exclusions))
+
+
+ISSUBSET_SCENARIOS = {
+    "only_get_object_actions": [effective_action("s3:GetObject*"), effective_action("s3:GetO*"), True],
+    # s3:GetO* may match actions missing from the catalog which s3:*Object* does not.
+    "wildcard_pattern_not_nested": [effective_action("s3:GetO*"), effective_action("s3:*Object*"), False],
+    "exclusions_cover_difference": [
+        effective_action("s3:*", "s3:Delete*", "s3:Put*"),
+        effective_action("s3:Get*"),
+        False,
+    ],
+    "not_subset": [effective_action("s3:*"), effective_action("s3:Get*"), False],
+    "unknown_action": [effective_action("sqs:*"), effective_action("*"), True],
+    "unknown_other": [effective_action("s3:GetObject*"), effective_action("sqs:*"), False],
+}
+
+
+@pytest.mark.parametrize("_, scenario", ISSUBSET_SCENARIOS.items())
+def test_issubset(_, scenario):
+    first, second, expected = scenario
+
+    assert first.issubset(second) == expected
+    with action_catalog(CATALOG):
+        assert first.issubset(second) == expected
+
+
+def test_intersection():
+    get = effective_action("s3:Get*")
+    get_tagging = effective_action("s3:GetObjectTagging*")
+    get_object = effective_action("s3:GetObject*")
+
+    with action_catalog(CATALOG):
+        assert get.intersection(effective_action("s3:*", "s3:Get*")) is None
+        assert get.intersection(get_object) == get_object
+        # No catalog action matches s3:GetObjectTagging*, so it is compared as a pattern.
+        assert get.intersection(get_tagging) == get_tagging
+
+
+def test_difference():
+    with action_catalog(CATALOG):
+        assert effective_action("s3:GetObject*").difference(effective_action("s3:GetO*")) == []
+        # s3:GetO* may match actions missing from the catalog which s3:GetObject* does not.
+        assert effective_action("s3:GetO*").difference(effective_action("s3:GetObject*")) == [
+            effective_action("s3:GetO*", "s3:GetObject*")
+        ]
+        assert effective_action("s3:Put*").difference(effective_action("s3:Get*")) == [effective_action("s3:Put*")]
+        assert effective_action("s3:*").difference(effective_action("s3:Get*")) == [
+            effective_action("s3:*", "s3:Get*")
+        ]
+
+
+def test_in_exclusions():
+    excluding = effective_action("s3:*", "s3:Delete*", "s3:Put*", "s3:GetObject*")
+
+    with action_catalog(CATALOG):
+        # s3:*Object may match actions missing from the catalog which are not excluded.
+        assert not excluding.in_exclusions(Action("s3:*Object"))
+        assert excluding.in_exclusions(Action("s3:GetObjectAcl"))
+        assert not excluding.in_exclusions(Action("s3:ListBucket"))
+
+
+def test_policy_shard_difference():
+    allow = Statement(Effect="Allow", Action="s3:Get*", Resource="*").policy_shards[0]
+    deny = Statement(Effect="Deny", Action="s3:GetObject", Resource="*").policy_shards[0]
+    expected = [
+        PolicyShard(
+            effect="Allow",
+            effective_action=effective_action("s3:Get*", "s3:GetObject"),
+            effective_resource=allow.effective_resource,
+            effective_principal=allow.effective_principal,
+        )
+    ]
+
+    assert allow.difference(deny) == expected
+    with action_catalog(ActionCatalog(["s3:GetObject"])):
+        assert allow.difference(deny) == expected
+
+
+@pytest.mark.parametrize("actions", [["s3:GetObject", "s3:Get*"], ["s3:Get*", "s3:GetObject"]])
+def test_dedupe_keeps_uncatalogued_actions(actions):
+    shards = Policy(**{"Statement": [{"Effect": "Allow", "Action": actions, "Resource": "*"}]}).policy_shards
+
+    with action_catalog(ActionCatalog(["s3:GetObject"])):
+        assert [shard.effective_action.inclusion for shard in dedupe_policy_shards(shards)] == [Action("s3:Get*")]
@@ -0,0 +1,47 @@
+from policyglass import Action, Policy, policy_shards_effect
+from policyglass.action_matcher import ShardActionMatcher
+
+POLICY = Policy(
+    **{
+        "Statement": [
+            {"Effect": "Allow", "Action": ["s3:*", "ec2:Describe*"], "Resource": "*"},
+            {"Effect": "Allow", "Action": "iam:Get?ole", "Resource": "*"},
+            {"Effect": "Allow", "NotAction": ["s3:*", "ec2:*", "iam:*"], "Resource": "*"},
+            {"Effect": "Deny", "Action": ["s3:Delete*", "s3:Put*Tagging"], "Resource": "*"},
+        ]
+    }
+)
+
+ACTIONS = [
+    "s3:GetObject",
+    "s3:DeleteObject",
+    "s3:PutObjectTagging",
+    "S3:GETOBJECT",
+    "ec2:DescribeInstances",
+    "ec2:RunInstances",
+    "iam:GetRole",
+    "iam:GetRoles",
+    "sqs:SendMessage",
+    "sqs:TagQueue",
+    "s3:GetObject",
+]
+
+
+def test_indices_match_effective_action_contains():
+    shards = policy_shards_effect(POLICY.policy_shards)
+    matcher = ShardActionMatcher(shards)
+
+    assert matcher.indices(ACTIONS) == [
+        tuple(position for position, shard in enumerate(shards) if Action(action) in shard.effective_action)
+        for action in ACTIONS
+    ]
+
+
+def test_mask():
+    matcher = ShardActionMatcher(policy_shards_effect(POLICY.policy_shards))
+
+    assert matcher.mask(iter(ACTIONS)) == [True, False, False, True, True, False, True, False, True, True, True]
+
+
+def test_empty_matcher():
+    assert ShardActionMatcher([]).mask(ACTIONS[:2]) == [False, False]
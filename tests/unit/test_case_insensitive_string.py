@@ -0,0 +1,40 @@
+import copy
+import pickle
+
+import pytest
+
+from policyglass import Action, ConditionKey, ConditionOperator
+from policyglass.condition import OPERATOR_REVERSAL_INDEX
+
+
+def test_hash_case_insensitive():
+    assert hash(Action("S3:GetObject")) == hash(Action("s3:getobject"))
+
+
+def test_equal_plain_string():
+    assert Action("S3:GetObject") == "s3:getobject"
+
+
+def test_not_comparable():
+    with pytest.raises(ValueError):
+        Action("s3:GetObject") == 1
+
+
+@pytest.mark.parametrize("subject", [Action("S3:GetObject"), ConditionKey("aws:SourceIp")])
+def test_pickle(subject):
+    result = pickle.loads(pickle.dumps(subject))
+
+    assert type(result) is type(subject)
+    assert repr(result) == repr(subject)
+    assert hash(result) == hash(subject)
+
+
+def test_copy():
+    subject = copy.deepcopy(Action("S3:GetObject"))
+
+    assert repr(subject) == "Action('S3:GetObject')"
+    assert subject == Action("s3:getobject")
+
+
+def test_operator_lookup_case_insensitive():
+    assert OPERATOR_REVERSAL_INDEX[ConditionOperator("stringequals")] == "StringNotEquals"
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from policyglass import Condition, ConditionOperator
@@ -104,10 +106,12 @@ def test_condition_reversible(_, scenario):
 
 @pytest.mark.parametrize("_, scenario", CONDITION_REVERSIBLE_SCENARIOS.items())
 def test_condition_reversible_if_exists(_, scenario):
-    input = scenario["input"]
-    input.operator = ConditionOperator(input.operator + "IfExists")
-    output = scenario["output"]
-    output.operator = ConditionOperator(output.operator + "IfExists")
+    input = Condition(
+        scenario["input"].key, ConditionOperator(scenario["input"].operator + "IfExists"), scenario["input"].values
+    )
+    output = Condition(
+        scenario["output"].key, ConditionOperator(scenario["output"].operator + "IfExists"), scenario["output"].values
+    )
 
     assert input.reverse == output
 
@@ -132,3 +136,32 @@ def test_condition_reversal_not_case_sensitive():
     assert Condition("TestKey", "STRINGEQUALS", ["TestValue"]).reverse == Condition(
         "TestKey", "stringnotequals", ["TestValue"]
     )
+
+
+def test_condition_immutable():
+    subject = Condition("TestKey", "StringEquals", ["TestValue"])
+
+    with pytest.raises(AttributeError):
+        subject.operator = ConditionOperator("StringNotEquals")
+
+
+def test_condition_value_order():
+    subject = Condition("TestKey", "StringEquals", ["b", "a"])
+    other = Condition("TestKey", "StringEquals", ["a", "b"])
+
+    assert subject == other
+    assert hash(subject) == hash(other)
+    assert subject.values == ["a", "b"]
+
+
+def test_condition_reverse_cached():
+    subject = Condition("TestKey", "StringEquals", ["TestValue"])
+
+    assert subject.reverse is subject.reverse
+    assert subject.reverse.reverse is subject
+
+
+def test_condition_pickle():
+    subject = Condition("TestKey", "StringEquals", ["TestValue"])
+
+    assert pickle.loads(pickle.dumps(subject)) == subject
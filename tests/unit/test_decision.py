@@ -0,0 +1,125 @@
+from itertools import product
+
+import pytest
+
+from policyglass import Action, Policy, Principal, Resource, policy_shards_effect
+from policyglass.decision import BatchDecisions, CompiledPolicy, Decision
+
+POLICY = Policy(
+    **{
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": ["s3:Get*", "s3:Put*"],
+                "Resource": ["arn:aws:s3:::bucket/*", "arn:aws:s3:::other/*"],
+                "Principal": {"AWS": "111111111111"},
+            },
+            {"Effect": "Allow", "Action": "ec2:*", "Resource": "*", "Principal": "*"},
+            {"Effect": "Deny", "Action": "s3:PutObject*", "NotResource": "arn:aws:s3:::bucket/uploads/*"},
+            {
+                "Effect": "Deny",
+                "Action": "ec2:Terminate*",
+                "Resource": "*",
+                "Condition": {"Bool": {"aws:MultiFactorAuthPresent": "false"}},
+            },
+        ]
+    }
+)
+COMPILED = CompiledPolicy.from_policy(POLICY)
+
+ACTIONS = ["s3:GetObject", "S3:PUTOBJECT", "s3:DeleteObject", "ec2:RunInstances", "ec2:TerminateInstances"]
+RESOURCES = ["arn:aws:s3:::bucket/key", "arn:aws:s3:::bucket/uploads/key", "arn:aws:s3:::third/key", "*"]
+PRINCIPALS = [
+    Principal("AWS", "arn:aws:iam::111111111111:role/role-name"),
+    Principal("AWS", "arn:aws:iam::222222222222:role/role-name"),
+]
+
+
+@pytest.mark.parametrize("action, resource, principal", list(product(ACTIONS, RESOURCES, PRINCIPALS)))
+def test_decide_matches_shard_contains(action, resource, principal):
+    expected = [
+        shard
+        for shard in COMPILED.shards
+        if Action(action) in shard.effective_action
+        and Resource(resource) in shard.effective_resource
+        and principal in shard.effective_principal
+    ]
+
+    assert COMPILED.decide(action, resource, principal).shards == expected
+
+
+DECISION_SCENARIOS = {
+    "allowed": [("s3:GetObject", "arn:aws:s3:::bucket/key", "111111111111"), True, False],
+    "wrong_account": [("s3:GetObject", "arn:aws:s3:::bucket/key", "222222222222"), False, False],
+    "denied_resource": [("s3:PutObject", "arn:aws:s3:::bucket/key", "111111111111"), False, False],
+    "excluded_from_deny": [("s3:PutObject", "arn:aws:s3:::bucket/uploads/key", "111111111111"), True, False],
+    "unresolved_condition": [("ec2:TerminateInstances", "*", None), False, True],
+    "any_principal": [("ec2:RunInstances", "*", None), True, False],
+}
+
+
+@pytest.mark.parametrize("_, scenario", DECISION_SCENARIOS.items())
+def test_decide(_, scenario):
+    query, allowed, conditional = scenario
+
+    decision = COMPILED.decide(*query)
+
+    assert (decision.allowed, decision.conditional) == (allowed, conditional)
+    assert COMPILED.is_allowed(*query) == allowed
+
+
+def test_decide_no_match():
+    assert COMPILED.decide("sqs:SendMessage") == Decision(allowed=False, conditional=False, shards=[])
+
+
+def test_compile_deny_shards():
+    with pytest.raises(ValueError):
+        CompiledPolicy(POLICY.policy_shards)
+
+
+def test_compile_effect_shards():
+    assert CompiledPolicy(policy_shards_effect(POLICY.policy_shards)).shards == COMPILED.shards
+
+
+def test_decide_batch():
+    requests = list(product(ACTIONS, RESOURCES, PRINCIPALS + ["111111111111", None])) * 2
+    actions, resources, principals = (list(column) for column in zip(*requests))
+
+    result = COMPILED.decide_batch(actions, resources, principals)
+
+    decisions = [COMPILED.decide(*request) for request in requests]
+    assert result == BatchDecisions(
+        allowed=[decision.allowed for decision in decisions],
+        conditional=[decision.conditional for decision in decisions],
+        shards=[decision.shards for decision in decisions],
+    )
+
+
+def test_decide_batch_defaults():
+    assert COMPILED.decide_batch(iter(["ec2:RunInstances", "s3:GetObject"])).allowed == [True, False]
+
+
+def test_decide_batch_mismatched_columns():
+    with pytest.raises(ValueError):
+        COMPILED.decide_batch(["s3:GetObject"], ["*", "*"])
+
+
+def test_decide_none_skips_principal_check():
+    compiled = CompiledPolicy.from_policy(
+        Policy(
+            **{
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": "s3:GetObject",
+                        "Resource": "*",
+                        "Principal": {"AWS": "arn:aws:iam::123456789012:role/role-name"},
+                    }
+                ]
+            }
+        )
+    )
+
+    assert compiled.is_allowed("s3:GetObject")
+    assert compiled.decide_batch(["s3:GetObject"]).allowed == [True]
+    assert not compiled.is_allowed("s3:GetObject", principal=Principal("AWS", "*"))
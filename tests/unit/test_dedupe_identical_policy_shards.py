@@ -0,0 +1,30 @@
+from policyglass import PolicyShard
+from policyglass.action import Action, EffectiveAction
+from policyglass.policy_shard import dedupe_identical_policy_shards
+from policyglass.principal import EffectivePrincipal, Principal
+from policyglass.resource import EffectiveResource, Resource
+
+
+def shard(effect: str, action: str) -> PolicyShard:
+    return PolicyShard(
+        effect=effect,
+        effective_action=EffectiveAction(inclusion=Action(action)),
+        effective_resource=EffectiveResource(inclusion=Resource("*")),
+        effective_principal=EffectivePrincipal(inclusion=Principal(type="AWS", value="*")),
+    )
+
+
+def test_dedupe_identical_policy_shards():
+    first = shard("Allow", "s3:GetObject")
+    second = shard("Allow", "s3:PutObject")
+
+    assert dedupe_identical_policy_shards(
+        [first, second, shard("Allow", "s3:GetObject"), shard("Allow", "s3:PutObject")]
+    ) == [first, second]
+    assert dedupe_identical_policy_shards([first, second])[0] is first
+
+
+def test_dedupe_identical_policy_shards_different_effect():
+    subject = [shard("Allow", "s3:GetObject"), shard("Deny", "s3:GetObject")]
+
+    assert [shard.effect for shard in dedupe_identical_policy_shards(subject)] == ["Allow", "Deny"]
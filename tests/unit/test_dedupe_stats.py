@@ -0,0 +1,90 @@
+import pytest
+
+from policyglass import Policy, explain_policy_shards
+from policyglass.policy_shard import DedupeStats, dedupe_policy_shard_subsets, dedupe_policy_shards
+
+
+def test_dedupe_policy_shards_stats():
+    policy = Policy(**{"Statement": [{"Effect": "Allow", "Action": ["s3:Get*", "s3:Get*", "s3:*"]}]})
+    stats = DedupeStats()
+
+    assert len(dedupe_policy_shards(policy.policy_shards, stats=stats)) == 1
+    assert (stats.examined, stats.requeued, stats.removed) == (3, 0, 1)
+
+
+def test_dedupe_policy_shards_stats_unchanged():
+    policy = Policy(**{"Statement": [{"Effect": "Allow", "Action": ["s3:*", "ec2:*"]}]})
+    stats = DedupeStats()
+
+    assert dedupe_policy_shards(policy.policy_shards, stats=stats) == list(reversed(policy.policy_shards))
+    assert (stats.examined, stats.requeued, stats.removed) == (2, 0, 0)
+
+
+SPLIT_POLICY = Policy(
+    **{
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": "s3:*",
+                "Resource": "*",
+                "Condition": {"Bool": {"aws:SecureTransport": "true"}},
+            },
+            {"Effect": "Allow", "Action": "s3:Get*", "Resource": "*"},
+        ]
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "shards, removed",
+    [(SPLIT_POLICY.policy_shards, 1), (list(reversed(SPLIT_POLICY.policy_shards)), 0)],
+)
+def test_dedupe_policy_shards_stats_split(shards, removed):
+    stats = DedupeStats()
+
+    assert explain_policy_shards(dedupe_policy_shards(shards, stats=stats)) == [
+        "Allow action s3:* (except for s3:Get*) on resource * with principal AWS *. "
+        "Provided conditions aws:SecureTransport Bool ['true'] are met.",
+        "Allow action s3:Get* on resource * with principal AWS *.",
+    ]
+    assert (stats.examined, stats.requeued, stats.removed) == (4, 2, removed)
+
+
+def test_dedupe_policy_shard_subsets_stats():
+    policy = Policy(**{"Statement": [{"Effect": "Allow", "Action": ["s3:Get*", "s3:Get*", "s3:*"]}]})
+    stats = DedupeStats()
+
+    assert len(dedupe_policy_shard_subsets(policy.policy_shards, stats=stats)) == 1
+    assert repr(stats) == "DedupeStats(examined=3, requeued=0, removed=1)"
+
+
+def test_dedupe_policy_shard_subsets_no_reverse_unsorted():
+    policy = Policy(
+        **{"Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": ["arn:aws:s3:::a", "arn:aws:s3:::b"]}]}
+    )
+
+    assert dedupe_policy_shard_subsets(policy.policy_shards, check_reverse=False) == list(
+        reversed(policy.policy_shards)
+    )
+
+
+def test_dedupe_policy_shards_many_shards():
+    actions = [f"s3:{'Get' * count}*" for count in range(1, 60)]
+    policy = Policy(**{"Statement": [{"Effect": "Allow", "Action": actions}]})
+    stats = DedupeStats()
+
+    result = dedupe_policy_shards(policy.policy_shards, stats=stats)
+
+    assert [shard.effective_action.inclusion for shard in result] == ["s3:Get*"]
+    assert stats.examined == len(actions)
+
+
+def test_dedupe_policy_shards_check_reverse_deprecated():
+    policy = Policy(**{"Statement": [{"Effect": "Allow", "Action": ["s3:Get*", "s3:*"]}]})
+
+    with pytest.warns(DeprecationWarning):
+        assert dedupe_policy_shards(policy.policy_shards, check_reverse=False) == dedupe_policy_shards(
+            policy.policy_shards
+        )
+    with pytest.raises(TypeError):
+        dedupe_policy_shards(policy.policy_shards, False)
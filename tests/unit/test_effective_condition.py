@@ -1,3 +1,8 @@
+import json
+import pickle
+
+import pytest
+
 from policyglass import Condition, EffectiveCondition
 
 
@@ -49,3 +54,56 @@ def test_reverse():
             }
         )
     )
+
+
+def test_hash_consed():
+    subject = EffectiveCondition(frozenset({Condition("aws:PrincipalOrgId", "StringEquals", ["o-123456"])}))
+
+    assert subject is EffectiveCondition(frozenset({Condition("aws:PrincipalOrgId", "StringEquals", ["o-123456"])}))
+
+
+def test_hash_consed_preserves_case():
+    subject = EffectiveCondition(frozenset({Condition("aws:PrincipalOrgId", "StringEquals", ["o-123456"])}))
+    other = EffectiveCondition(frozenset({Condition("aws:principalorgid", "StringEquals", ["o-123456"])}))
+
+    assert subject == other
+    assert subject is not other
+    assert hash(subject) == hash(other)
+
+
+def test_immutable():
+    subject = EffectiveCondition()
+
+    with pytest.raises(AttributeError):
+        subject.inclusions = frozenset()
+
+
+def test_reverse_cached():
+    subject = EffectiveCondition(frozenset({Condition("aws:PrincipalOrgId", "StringEquals", ["o-123456"])}))
+
+    assert subject.reverse is subject.reverse
+
+
+def test_union_cached():
+    subject = EffectiveCondition(frozenset({Condition("aws:PrincipalOrgId", "StringEquals", ["o-123456"])}))
+    other = EffectiveCondition(frozenset({Condition("aws:SourceIp", "IpAddress", ["10.0.0.0/8"])}))
+
+    assert subject.union(other) is subject.union(other)
+    assert subject.union(other).inclusions == subject.inclusions.union(other.inclusions)
+
+
+def test_pickle():
+    subject = EffectiveCondition(
+        frozenset({Condition("aws:PrincipalOrgId", "StringEquals", ["o-123456"])}),
+        frozenset({Condition("Key", "BinaryEquals", ["QmluYXJ5VmFsdWVJbkJhc2U2NA=="])}),
+    )
+
+    assert pickle.loads(pickle.dumps(subject)) is subject
+
+
+def test_json():
+    subject = EffectiveCondition(frozenset({Condition("aws:PrincipalOrgId", "StringEquals", ["o-123456"])}))
+
+    assert subject.json(exclude_defaults=True) == json.dumps(
+        {"inclusions": [{"key": "aws:PrincipalOrgId", "operator": "StringEquals", "values": ["o-123456"]}]}
+    )
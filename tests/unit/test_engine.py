@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from policyglass import Policy, Statement, policy_shards_effect
+from policyglass.engine import EffectEngine
+
+STATEMENTS = [
+    {"Effect": "Allow", "Action": ["s3:*", "ec2:*"], "Resource": "*"},
+    {"Effect": "Allow", "Action": "iam:*", "Resource": "*", "Condition": {"Bool": {"aws:SecureTransport": "true"}}},
+    {"Effect": "Allow", "NotAction": "s3:Delete*", "Resource": "arn:aws:s3:::bucket/*"},
+    {"Effect": "Deny", "Action": "s3:Get*", "Resource": "*"},
+    {"Effect": "Deny", "Action": "ec2:Terminate*", "Resource": "*", "Principal": {"AWS": "111111111111"}},
+    {"Effect": "Deny", "Action": "sqs:*", "Resource": "*"},
+    {
+        "Effect": "Deny",
+        "Action": "iam:*",
+        "Resource": "*",
+        "Condition": {"Bool": {"aws:MultiFactorAuthPresent": "false"}},
+    },
+]
+
+
+def expected_effect(statements):
+    return policy_shards_effect(Policy(Statement=statements).policy_shards)
+
+
+def test_engine_initial_effect():
+    statements = [Statement(**statement) for statement in STATEMENTS]
+
+    assert EffectEngine(statements).effect == expected_effect(statements)
+    assert EffectEngine.from_policy(Policy(Statement=STATEMENTS)).effect == expected_effect(statements)
+
+
+def test_engine_random_edits():
+    rng = random.Random(0)
+    engine = EffectEngine()
+    for _ in range(30):
+        operation = rng.choice(["add", "add", "remove", "replace"]) if engine.statements else "add"
+        statement = Statement(**rng.choice(STATEMENTS))
+        if operation == "add":
+            engine.add_statement(statement, rng.randint(-1, len(engine.statements)))
+        elif operation == "remove":
+            engine.remove_statement(rng.randrange(len(engine.statements)))
+        else:
+            engine.replace_statement(rng.randrange(len(engine.statements)), statement)
+
+        assert engine.effect == expected_effect(engine.statements)
+
+
+def test_engine_only_recalculates_affected_shards(monkeypatch):
+    engine = EffectEngine([Statement(**statement) for statement in STATEMENTS[:3]])
+    recalculated = []
+    recalculate = EffectEngine._recalculate
+
+    def recording_recalculate(self, stale):
+        recalculated.extend(stale)
+        return recalculate(self, stale)
+
+    monkeypatch.setattr(EffectEngine, "_recalculate", recording_recalculate)
+
+    # Only the NotAction shard, whose action inclusion is *, could intersect sqs:*.
+    engine.add_statement(Statement(**STATEMENTS[5]))
+    assert recalculated == [(2, 0)]
+
+    recalculated.clear()
+    engine.add_statement(Statement(**STATEMENTS[4]), 0)
+    assert recalculated == [(1, 1), (3, 0)]
+
+    recalculated.clear()
+    engine.remove_statement(0)
+    assert recalculated == [(0, 1), (2, 0)]
+
+
+def test_engine_statement_index_errors():
+    engine = EffectEngine([Statement(**STATEMENTS[0])])
+
+    with pytest.raises(IndexError):
+        engine.remove_statement(1)
+    with pytest.raises(IndexError):
+        engine.replace_statement(-2, Statement(**STATEMENTS[0]))
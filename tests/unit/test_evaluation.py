@@ -0,0 +1,177 @@
+import pytest
+
+from policyglass import Action, Policy, explain_policy_shards, policy_shards_effect
+from policyglass.evaluation import (
+    EffectCache,
+    EvaluationContext,
+    intersect_policy_shards,
+    policy_content_hash,
+)
+
+
+def policy(*statements):
+    return Policy(**{"Version": "2012-10-17", "Statement": list(statements)})
+
+
+IDENTITY = policy({"Effect": "Allow", "Action": ["s3:*", "ec2:*"], "Resource": "*"})
+SCP = policy(
+    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+    {"Effect": "Deny", "Action": "ec2:*", "Resource": "*"},
+)
+CONDITIONAL_SCP = policy(
+    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+    {
+        "Effect": "Deny",
+        "Action": "s3:Delete*",
+        "Resource": "*",
+        "Condition": {"Bool": {"aws:MultiFactorAuthPresent": "false"}},
+    },
+)
+
+EFFECT_SCENARIOS = {
+    "identity_only": [
+        {"identity_policies": [IDENTITY]},
+        explain_policy_shards(policy_shards_effect(IDENTITY.policy_shards)),
+    ],
+    "scp": [
+        {"identity_policies": [IDENTITY], "service_control_policies": [SCP]},
+        ["Allow action s3:* on resource * with principal AWS *."],
+    ],
+    "scp_chain": [
+        {"identity_policies": [IDENTITY], "service_control_policies": [SCP, CONDITIONAL_SCP]},
+        [
+            "Allow action s3:Delete* on resource * with principal AWS *. "
+            "Unless conditions aws:MultiFactorAuthPresent Bool ['false'] are met.",
+            "Allow action s3:* (except for s3:Delete*) on resource * with principal AWS *.",
+        ],
+    ],
+    "permissions_boundary": [
+        {
+            "identity_policies": [IDENTITY],
+            "permissions_boundary": policy({"Effect": "Allow", "Action": "ec2:Describe*", "Resource": "*"}),
+        },
+        ["Allow action ec2:Describe* on resource * with principal AWS *."],
+    ],
+    "resource_policy_deny": [
+        {
+            "identity_policies": [IDENTITY],
+            "resource_policies": [
+                policy({"Effect": "Deny", "Action": "s3:*", "Resource": "arn:aws:s3:::bucket/*", "Principal": "*"})
+            ],
+        },
+        [
+            "Allow action ec2:* on resource * with principal AWS *.",
+            "Allow action s3:* on resource * (except for arn:aws:s3:::bucket/*) with principal AWS *.",
+        ],
+    ],
+    "resource_policy_grant": [
+        {
+            "resource_policies": [
+                policy(
+                    {
+                        "Effect": "Allow",
+                        "Action": "sqs:SendMessage",
+                        "Resource": "*",
+                        "Principal": {"AWS": "111111111111"},
+                    }
+                )
+            ],
+            "service_control_policies": [SCP],
+        },
+        ["Allow action sqs:SendMessage on resource * with principal AWS arn:aws:iam::111111111111:root."],
+    ],
+    "no_grants": [{"service_control_policies": [SCP]}, []],
+}
+
+
+@pytest.mark.parametrize("_, scenario", EFFECT_SCENARIOS.items())
+def test_effect(_, scenario):
+    policies, expected = scenario
+
+    effect = EvaluationContext(cache=EffectCache(), **policies).effect
+
+    assert sorted(explain_policy_shards(effect)) == sorted(expected)
+
+
+def test_shared_policies_are_evaluated_once():
+    cache = EffectCache()
+    roles = [policy({"Effect": "Allow", "Action": f"s3:Get{number}*", "Resource": "*"}) for number in range(5)]
+
+    for role in roles:
+        EvaluationContext(identity_policies=[role], service_control_policies=[SCP, CONDITIONAL_SCP], cache=cache).effect
+
+    # Each role's effect and deny shards, each SCP's effect, and the SCP chain's intersection.
+    assert cache.misses == len(roles) * 2 + 3
+    assert len(cache) == cache.misses
+
+
+def test_effect_recalculated_when_policies_change():
+    cache = EffectCache()
+    context = EvaluationContext(identity_policies=[IDENTITY], cache=cache)
+    context.effect
+    misses = cache.misses
+
+    context.effect
+    assert cache.misses == misses
+
+    context.service_control_policies.append(SCP)
+    assert explain_policy_shards(context.effect) == ["Allow action s3:* on resource * with principal AWS *."]
+
+    boundary = policy({"Effect": "Allow", "Action": "s3:*", "Resource": "*"})
+    context.permissions_boundary = boundary
+    context.effect
+    boundary.statement[0].action = [Action("s3:Get*")]
+    assert explain_policy_shards(context.effect) == ["Allow action s3:Get* on resource * with principal AWS *."]
+
+
+def test_effect_returns_copies():
+    context = EvaluationContext(identity_policies=[IDENTITY], cache=EffectCache())
+    context.effect[0].effect = "Deny"
+
+    assert {shard.effect for shard in context.effect} == {"Allow"}
+
+
+def test_effect_cache_keyed_by_content():
+    cache = EffectCache()
+    cache.effect(IDENTITY)
+    cache.effect(policy({"Effect": "Allow", "Action": ["s3:*", "ec2:*"], "Resource": "*"}))
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert policy_content_hash(IDENTITY) != policy_content_hash(SCP)
+
+
+def test_effect_cache_maxsize():
+    cache = EffectCache(maxsize=1)
+    cache.effect(IDENTITY)
+    cache.effect(SCP)
+    cache.effect(IDENTITY)
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 3, 1)
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_intersect_policy_shards_conditions():
+    conditional_identity = policy(
+        {
+            "Effect": "Allow",
+            "Action": "s3:*",
+            "Resource": "*",
+            "Condition": {"Bool": {"aws:SecureTransport": "true"}},
+        }
+    )
+
+    assert explain_policy_shards(
+        intersect_policy_shards(
+            policy_shards_effect(conditional_identity.policy_shards), policy_shards_effect(SCP.policy_shards)
+        )
+    ) == [
+        "Allow action s3:* on resource * with principal AWS *. "
+        "Provided conditions aws:SecureTransport Bool ['true'] are met."
+    ]
+
+
+def test_intersect_policy_shards_deny():
+    with pytest.raises(ValueError):
+        intersect_policy_shards(SCP.policy_shards, IDENTITY.policy_shards)
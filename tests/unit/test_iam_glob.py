@@ -0,0 +1,66 @@
+import pytest
+
+from policyglass import Action, Resource
+from policyglass.iam_glob import classify_glob, compile_glob, match_glob
+
+CLASSIFY_GLOB_SCENARIOS = {
+    "literal": ["s3:GetObject", "literal"],
+    "prefix": ["s3:Get*", "prefix"],
+    "wildcard": ["*", "prefix"],
+    "suffix": ["*Object", "suffix"],
+    "infix": ["s3:*Object*", "general"],
+    "question_mark": ["s3:Get?bject", "general"],
+    "middle_star": ["s3:Get*Acl", "general"],
+}
+
+
+@pytest.mark.parametrize("_, scenario", CLASSIFY_GLOB_SCENARIOS.items())
+def test_classify_glob(_, scenario):
+    assert classify_glob(scenario[0]) == scenario[1]
+
+
+MATCH_GLOB_SCENARIOS = {
+    "literal": ["s3:GetObject", "s3:GetObject"],
+    "prefix": ["s3:GetObject", "s3:Get*"],
+    "wildcard": ["anything", "*"],
+    "empty_wildcard": ["", "*"],
+    "suffix": ["s3:GetObject", "*Object"],
+    "infix": ["s3:GetObjectAcl", "s3:*Object*"],
+    "question_mark": ["s3:GetObject", "s3:Get?bject"],
+    "narrower_pattern": ["s3:Get*", "s3:*"],
+    "square_brackets_are_literal": ["s3:Get[ab]", "s3:Get[ab]"],
+    "newline": ["s3:Get\nObject", "s3:Get*Object"],
+}
+
+
+@pytest.mark.parametrize("_, scenario", MATCH_GLOB_SCENARIOS.items())
+def test_match_glob(_, scenario):
+    assert match_glob(scenario[0], scenario[1])
+
+
+NOT_MATCH_GLOB_SCENARIOS = {
+    "literal": ["s3:GetObject", "s3:PutObject"],
+    "case_sensitive": ["s3:getobject", "s3:GetObject"],
+    "prefix": ["s3:PutObject", "s3:Get*"],
+    "suffix": ["s3:GetObjectAcl", "*Object"],
+    "question_mark_single_character": ["s3:GetObject", "s3:Get?Object"],
+    "broader_pattern": ["s3:*", "s3:Get*"],
+    "no_character_classes": ["s3:Geta", "s3:Get[ab]"],
+}
+
+
+@pytest.mark.parametrize("_, scenario", NOT_MATCH_GLOB_SCENARIOS.items())
+def test_not_match_glob(_, scenario):
+    assert not match_glob(scenario[0], scenario[1])
+
+
+def test_compile_glob_cached():
+    assert compile_glob("s3:*Object*") is compile_glob("s3:*Object*")
+
+
+def test_action_square_brackets_are_literal():
+    assert not Action("s3:Geta").issubset(Action("s3:Get[ab]"))
+
+
+def test_resource_square_brackets_are_literal():
+    assert not Resource("arn:aws:s3:::bucket/a") < Resource("arn:aws:s3:::bucket/[ab]")
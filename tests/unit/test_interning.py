@@ -0,0 +1,58 @@
+import gc
+import pickle
+
+from policyglass import Action, ConditionKey, PrincipalValue, Resource
+from policyglass.interning import disable_interning, interned_count, interning, interning_enabled
+
+
+def test_interning_disabled_by_default():
+    assert not interning_enabled()
+    assert Action("s3:GetObject") is not Action("s3:GetObject")
+
+
+def test_interning():
+    with interning():
+        assert Action("s3:GetObject") is Action("s3:GetObject")
+        assert Resource("*") is Resource("*")
+        assert PrincipalValue("*") is PrincipalValue("*")
+        assert ConditionKey("aws:SourceIp") is ConditionKey("aws:SourceIp")
+
+
+def test_interning_preserves_case():
+    with interning():
+        assert Action("s3:GetObject") is not Action("S3:GetObject")
+        assert repr(Action("S3:GetObject")) == "Action('S3:GetObject')"
+
+
+def test_interning_keyed_by_type():
+    with interning():
+        assert Action("*") is not Resource("*")
+        assert isinstance(Resource("*"), Resource)
+
+
+def test_interning_context_restores_state():
+    with interning():
+        pass
+
+    assert not interning_enabled()
+
+
+def test_interned_values_freed():
+    with interning():
+        action = Action("s3:UnusedAction")
+        assert interned_count() == 1
+        del action
+        gc.collect()
+        assert interned_count() == 0
+
+
+def test_interned_value_pickle():
+    with interning():
+        action = Action("s3:GetObject")
+        assert pickle.loads(pickle.dumps(action)) is action
+
+
+def test_disable_interning():
+    with interning():
+        disable_interning()
+        assert Action("s3:GetObject") is not Action("s3:GetObject")
@@ -0,0 +1,76 @@
+import pytest
+
+from policyglass import Action, EffectiveAction, EffectivePrincipal, EffectiveResource, PolicyShard, Principal, Resource
+from policyglass.memo import memo_scope
+
+
+def shard(action: str) -> PolicyShard:
+    return PolicyShard(
+        effect="Allow",
+        effective_action=EffectiveAction(inclusion=Action(action)),
+        effective_resource=EffectiveResource(inclusion=Resource("*")),
+        effective_principal=EffectivePrincipal(inclusion=Principal(type="AWS", value="*")),
+    )
+
+
+def test_memo_scope_memoises():
+    with memo_scope() as table:
+        assert shard("s3:GetObject").issubset(shard("s3:*"))
+        size = len(table)
+        assert shard("s3:GetObject").issubset(shard("s3:*"))
+        assert len(table) == size
+
+
+def test_memo_scope_nested_shares_table():
+    with memo_scope() as outer:
+        with memo_scope() as inner:
+            assert inner is outer
+
+
+def test_memo_scope_cleared():
+    with memo_scope() as table:
+        shard("s3:GetObject").issubset(shard("s3:*"))
+
+    with memo_scope() as new_table:
+        assert new_table is not table
+        assert not new_table
+
+
+def test_memo_difference_returns_copy():
+    with memo_scope():
+        result = shard("s3:*").difference(shard("s3:Get*"))
+        result.clear()
+
+        assert shard("s3:*").difference(shard("s3:Get*"))
+
+
+def test_memo_keyed_by_effect():
+    deny_shard = shard("s3:*")
+    deny_shard.effect = "Deny"
+
+    with memo_scope():
+        assert shard("s3:*").issubset(shard("s3:*"))
+        assert not shard("s3:*").issubset(deny_shard)
+
+
+def test_memo_type_errors_not_cached():
+    with memo_scope() as table:
+        with pytest.raises(ValueError):
+            EffectiveAction(Action("*")).issubset(EffectiveResource(Resource("*")))
+        assert not table
+
+
+def test_memo_keyed_by_case():
+    with memo_scope():
+        assert shard("s3:*").difference(shard("s3:Get*")) == shard("s3:*").difference(shard("S3:GET*"))
+        result = shard("s3:*").difference(shard("S3:GET*"))
+
+    assert [str(exclusion) for exclusion in result[0].effective_action.exclusions] == ["S3:GET*"]
+
+
+def test_effective_arp_immutable():
+    effective_action = EffectiveAction(Action("s3:*"))
+    hash(effective_action)
+
+    with pytest.raises(AttributeError):
+        effective_action.inclusion = Action("ec2:*")
@@ -0,0 +1,108 @@
+import multiprocessing
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from policyglass import EffectiveAction, Policy, policy_shards_effect
+from policyglass.action import Action
+from policyglass.parallel import shutdown_worker_pools, split_evenly, worker_pool
+
+POLICY = Policy(
+    **{
+        "Statement": [
+            {"Effect": "Allow", "Action": ["s3:*", "ec2:*", "iam:*", "sqs:*", "sns:*"], "Resource": "*"},
+            {"Effect": "Deny", "Action": ["s3:Get*", "ec2:Describe*", "iam:Pass*"], "Resource": "*"},
+            {"Effect": "Deny", "Action": "sqs:*", "Resource": "arn:aws:sqs:*:111111111111:queue"},
+        ]
+    }
+)
+
+
+SPLIT_EVENLY_SCENARIOS = {
+    "even": [[1, 2, 3, 4], 2, [[1, 2], [3, 4]]],
+    "uneven": [[1, 2, 3, 4, 5], 2, [[1, 2, 3], [4, 5]]],
+    "more_chunks_than_items": [[1, 2], 4, [[1], [2]]],
+    "empty": [[], 4, []],
+    "zero_chunks": [[1, 2], 0, [[1, 2]]],
+}
+
+
+@pytest.mark.parametrize("_, scenario", SPLIT_EVENLY_SCENARIOS.items())
+def test_split_evenly(_, scenario):
+    assert split_evenly(scenario[0], scenario[1]) == scenario[2]
+
+
+def test_worker_pool_reused():
+    try:
+        assert worker_pool(2) is worker_pool(2)
+    finally:
+        shutdown_worker_pools()
+
+
+def test_worker_pool_invalid():
+    with pytest.raises(ValueError):
+        worker_pool(0)
+
+
+def test_effective_arp_pickle_drops_hash():
+    effective_action = EffectiveAction(Action("s3:*"))
+    hash(effective_action)
+
+    assert "_hash" not in pickle.loads(pickle.dumps(effective_action)).__dict__
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+def test_policy_shards_effect_workers(workers):
+    try:
+        assert policy_shards_effect(POLICY.policy_shards, workers=workers) == policy_shards_effect(
+            POLICY.policy_shards
+        )
+    finally:
+        shutdown_worker_pools()
+
+
+def test_policy_shards_effect_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = policy_shards_effect(POLICY.policy_shards, executor=executor)
+
+    assert result == policy_shards_effect(POLICY.policy_shards)
+
+
+def test_policy_shards_effect_thread_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = policy_shards_effect(POLICY.policy_shards, workers=2, executor=executor)
+
+    assert result == policy_shards_effect(POLICY.policy_shards)
+
+
+CONDITIONAL_POLICY = Policy(
+    **{
+        "Statement": [
+            {"Effect": "Allow", "Action": ["s3:*", "ec2:*"], "Resource": ["*", "arn:aws:s3:::bucket/*"]},
+            {
+                "Effect": "Deny",
+                "Action": ["s3:Get*", "s3:Put*", "ec2:Describe*"],
+                "NotResource": "arn:aws:s3:::bucket/*",
+                "Condition": {"Bool": {"aws:SecureTransport": "false"}},
+            },
+            {
+                "Effect": "Deny",
+                "Action": "s3:Delete*",
+                "Resource": "*",
+                "Condition": {"StringNotEquals": {"aws:PrincipalOrgID": "o-123456"}},
+            },
+        ]
+    }
+)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="ProcessPoolExecutor takes mp_context from Python 3.7")
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_policy_shards_effect_spawned_workers(workers):
+    # Spawned workers have their own hash seed, so iterate sets in a different order to this process.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        result = policy_shards_effect(CONDITIONAL_POLICY.policy_shards, workers=workers, executor=executor)
+
+    assert result == policy_shards_effect(CONDITIONAL_POLICY.policy_shards)
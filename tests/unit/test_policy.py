@@ -10,6 +10,7 @@ from policyglass import (
     PolicyShard,
     Principal,
     Resource,
+    Statement,
 )
 from policyglass.condition import EffectiveCondition
 
@@ -150,3 +151,35 @@ POLICIES = {
 )
 def test_policy_shards(_, policy, shards):
     assert Policy(**policy).policy_shards == shards
+
+
+@pytest.mark.parametrize(
+    "_, policy, shards", [(name, value["policy"], value["shards"]) for name, value in POLICIES.items()]
+)
+def test_iter_policy_shards(_, policy, shards):
+    assert list(Policy(**policy).iter_policy_shards()) == shards
+
+
+def test_policy_shards_cache():
+    policy = Policy(**{"Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": "*"}]})
+    policy.policy_shards
+
+    policy.statement.append(Statement(**{"Effect": "Deny", "Action": "s3:Get*", "Resource": "*"}))
+    assert len(policy.policy_shards) == 2
+
+    policy.statement[0].action = [Action("s3:*"), Action("ec2:*")]
+    assert len(policy.policy_shards) == 3
+
+    policy.statement[0].action.append(Action("iam:*"))
+    assert len(policy.policy_shards) == 3
+
+    policy.clear_policy_shards_cache()
+    assert len(policy.policy_shards) == 4
+
+
+def test_policy_shards_cache_not_changed_by_returned_shards():
+    policy = Policy(**{"Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": "*"}]})
+    policy.policy_shards[0].effective_action = EffectiveAction(Action("ec2:*"))
+
+    assert [shard.effective_action.inclusion for shard in policy.policy_shards] == [Action("s3:*")]
+    assert [shard.effective_action.inclusion for shard in policy.statement[0].policy_shards] == [Action("s3:*")]
@@ -370,3 +370,30 @@ POLICY_SHARDS_EFFECT_SCENARIOS = {
 )
 def test_policy_shards_effect(_, input, expected):
     assert policy_shards_effect(input) == expected
+
+
+def test_policy_shards_effect_skips_unrelated_denies(monkeypatch):
+    policy = Policy(
+        **{
+            "Statement": [
+                {"Effect": "Allow", "Action": "s3:*", "Resource": "arn:aws:s3:::bucket/*"},
+                {"Effect": "Deny", "Action": [f"ec2:Action{index}" for index in range(50)], "Resource": "*"},
+                {"Effect": "Deny", "Action": "s3:*", "Resource": "arn:aws:s3:::other-bucket/*"},
+                {"Effect": "Deny", "Action": "s3:Delete*", "Resource": "arn:aws:s3:::bucket/*"},
+            ]
+        }
+    )
+    differences = []
+    difference = PolicyShard.difference
+
+    def recording_difference(self, other, *args, **kwargs):
+        differences.append(other)
+        return difference(self, other, *args, **kwargs)
+
+    monkeypatch.setattr(PolicyShard, "difference", recording_difference)
+    result = policy_shards_effect(policy.policy_shards)
+
+    assert [shard.effective_action for shard in result] == [
+        EffectiveAction(inclusion=Action("s3:*"), exclusions=frozenset({Action("s3:Delete*")}))
+    ]
+    assert [shard.effective_action.inclusion for shard in differences] == [Action("s3:Delete*")]
@@ -1,4 +1,9 @@
-from policyglass import Principal
+import pickle
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from policyglass import Principal, PrincipalValue
 
 
 def test_short_account_id():
@@ -26,3 +31,41 @@ def test_arn_elements():
         "123456789012",
         "role/role-name",
     ]
+
+
+def test_immutable():
+    subject = Principal("AWS", "*")
+
+    with pytest.raises(AttributeError):
+        subject.value = PrincipalValue("arn:aws:iam::123456789012:root")
+
+
+def test_hash_equal():
+    assert hash(Principal("AWS", "123456789012")) == hash(Principal("AWS", "arn:aws:iam::123456789012:root"))
+
+
+def test_pickle():
+    subject = Principal("AWS", "arn:aws:iam::123456789012:role/role-name")
+
+    result = pickle.loads(pickle.dumps(subject))
+
+    assert result == subject
+    assert hash(result) == hash(subject)
+    assert result.account_id == "123456789012"
+
+
+def test_pydantic_field():
+    class Model(BaseModel):
+        principal: Principal
+
+    assert Model(principal={"type": "AWS", "value": "123456789012"}).principal == Principal(
+        "AWS", "arn:aws:iam::123456789012:root"
+    )
+
+
+def test_pydantic_field_invalid():
+    class Model(BaseModel):
+        principal: Principal
+
+    with pytest.raises(ValidationError):
+        Model(principal=1)
@@ -0,0 +1,165 @@
+from itertools import product
+
+import pytest
+
+from policyglass import Policy, PolicyShard, ProductShard, Statement
+from policyglass.action import Action, EffectiveAction
+from policyglass.condition import Condition, EffectiveCondition
+from policyglass.principal import EffectivePrincipal, Principal
+from policyglass.resource import EffectiveResource, Resource
+
+STATEMENTS = {
+    "actions_and_resources": {
+        "Effect": "Allow",
+        "Action": ["s3:Get*", "s3:Put*", "ec2:*"],
+        "Resource": ["arn:aws:s3:::bucket/*", "arn:aws:s3:::other/*"],
+    },
+    "principals_and_condition": {
+        "Effect": "Allow",
+        "Action": "s3:*",
+        "Principal": {"AWS": ["111111111111", "arn:aws:iam::222222222222:role/role-name"]},
+        "Resource": "*",
+        "Condition": {"Bool": {"aws:SecureTransport": "true"}},
+    },
+    "not_action_not_resource": {
+        "Effect": "Allow",
+        "NotAction": "s3:Delete*",
+        "NotResource": "arn:aws:s3:::bucket/secret/*",
+    },
+    "deny_get": {"Effect": "Deny", "Action": ["s3:Get*", "ec2:Terminate*"], "Resource": "arn:aws:s3:::bucket/*"},
+    "deny_conditional": {
+        "Effect": "Deny",
+        "Action": "s3:*",
+        "Resource": "*",
+        "Condition": {"Bool": {"aws:MultiFactorAuthPresent": "false"}},
+    },
+}
+
+
+def statement_shards(name):
+    return Statement(**STATEMENTS[name]).product_shard
+
+
+@pytest.mark.parametrize("name", STATEMENTS.keys())
+def test_statement_product_shard_expands_to_policy_shards(name):
+    statement = Statement(**STATEMENTS[name])
+
+    assert statement.product_shard.expand() == statement.policy_shards
+    assert len(statement.product_shard) == len(statement.policy_shards)
+
+
+def test_from_policy_shard():
+    shard = Policy(**{"Statement": [STATEMENTS["principals_and_condition"]]}).policy_shards[0]
+
+    assert ProductShard.from_policy_shard(shard).expand() == [shard]
+
+
+@pytest.mark.parametrize("name, other_name", list(product(STATEMENTS.keys(), repeat=2)))
+def test_issubset_matches_expanded(name, other_name):
+    product_shard = statement_shards(name)
+    other = statement_shards(other_name)
+
+    assert product_shard.issubset(other) == all(
+        any(shard.issubset(other_shard) for other_shard in other.expand()) for shard in product_shard.expand()
+    )
+
+
+def expanded_intersections(product_shard, other):
+    return {
+        intersection
+        for shard, other_shard in product(product_shard.expand(), other.expand())
+        for intersection in [shard.intersection(other_shard)]
+        if intersection
+    }
+
+
+@pytest.mark.parametrize("name, other_name", list(product(STATEMENTS.keys(), repeat=2)))
+def test_intersection_matches_expanded(name, other_name):
+    product_shard = statement_shards(name)
+    other = statement_shards(other_name)
+    if product_shard.effect == "Deny" and other.effect == "Allow":
+        with pytest.raises(ValueError):
+            product_shard.intersection(other)
+        return
+
+    intersection = product_shard.intersection(other)
+
+    assert set(intersection.expand() if intersection else []) == expanded_intersections(product_shard, other)
+
+
+def single(action, resource, effect="Allow", condition=None):
+    return PolicyShard(
+        effect=effect,
+        effective_action=EffectiveAction(Action(action)),
+        effective_resource=EffectiveResource(Resource(resource)),
+        effective_principal=EffectivePrincipal(Principal("AWS", "*")),
+        effective_condition=condition,
+    )
+
+
+DIFFERENCE_SCENARIOS = {
+    "action": [single("s3:*", "*"), single("s3:Get*", "*", "Deny")],
+    "resource": [single("s3:*", "*"), single("s3:*", "arn:aws:s3:::bucket/*", "Deny")],
+    "both": [single("s3:*", "*"), single("s3:Get*", "arn:aws:s3:::bucket/*", "Deny")],
+    "disjoint": [single("s3:*", "*"), single("ec2:*", "*", "Deny")],
+    "conditional": [
+        single("s3:*", "*"),
+        single(
+            "s3:Get*",
+            "*",
+            "Deny",
+            EffectiveCondition(frozenset({Condition("aws:SecureTransport", "Bool", ["false"])})),
+        ),
+    ],
+}
+
+
+@pytest.mark.parametrize("_, scenario", DIFFERENCE_SCENARIOS.items())
+def test_difference_of_single_shards_matches_policy_shard(_, scenario):
+    shard, other = scenario
+    product_shard = ProductShard.from_policy_shard(shard)
+
+    result = product_shard.difference(ProductShard.from_policy_shard(other), dedupe_result=False)
+
+    assert [expanded for difference in result for expanded in difference.expand()] == shard.difference(
+        other, dedupe_result=False
+    )
+
+
+def test_difference():
+    allow = ProductShard(
+        "Allow",
+        [EffectiveAction(Action("s3:*")), EffectiveAction(Action("ec2:*"))],
+        [EffectiveResource(Resource("*"))],
+        [EffectivePrincipal(Principal("AWS", "*"))],
+    )
+    deny = ProductShard(
+        "Deny",
+        [EffectiveAction(Action("s3:Get*")), EffectiveAction(Action("ec2:Terminate*"))],
+        [EffectiveResource(Resource("*"))],
+        [EffectivePrincipal(Principal("AWS", "*"))],
+    )
+
+    assert allow.difference(deny) == [
+        ProductShard(
+            "Allow",
+            [
+                EffectiveAction(Action("s3:*"), frozenset({Action("s3:Get*")})),
+                EffectiveAction(Action("ec2:*"), frozenset({Action("ec2:Terminate*")})),
+            ],
+            [EffectiveResource(Resource("*"))],
+            [EffectivePrincipal(Principal("AWS", "*"))],
+        )
+    ]
+
+
+def test_difference_deny_allow():
+    with pytest.raises(ValueError):
+        statement_shards("deny_get").difference(statement_shards("actions_and_resources"))
+
+
+def test_equality():
+    assert statement_shards("actions_and_resources") == statement_shards("actions_and_resources")
+    assert len({statement_shards("actions_and_resources"), statement_shards("actions_and_resources")}) == 1
+    with pytest.raises(ValueError):
+        statement_shards("actions_and_resources") == 1
@@ -1,4 +1,7 @@
+import pytest
+
 from policyglass import Resource
+from policyglass.resource import ResourceArn
 
 
 def test_arn_elements():
@@ -14,3 +17,54 @@ def test_arn_elements_blanks():
         "*",
         "bucket_name/key_name",
     ]
+
+
+def test_arn():
+    assert Resource("arn:aws:s3:::bucket_name/key:name").arn == ResourceArn(
+        partition="aws", service="s3", region="*", account="*", resource="bucket_name/key:name"
+    )
+
+
+def test_arn_not_an_arn():
+    assert Resource("*").arn is None
+
+
+def test_issubset_resource_path_with_colons():
+    assert not Resource("arn:aws:logs:eu-west-2:123456789012:log-group:name:*").issubset(
+        Resource("arn:aws:logs:eu-west-2:123456789012:log-group:name")
+    )
+
+
+def test_lt_matches_issubset_for_blank_elements():
+    subject = Resource("arn:aws:s3:eu-west-2::bucket_name")
+    other = Resource("arn:aws:s3:::bucket_name")
+
+    assert subject.issubset(other)
+    assert subject < other
+
+
+def test_arn_elements_resource_path_with_colons():
+    assert Resource("arn:aws:logs:eu-west-2:123456789012:log-group:name").arn_elements == [
+        "arn",
+        "aws",
+        "logs",
+        "eu-west-2",
+        "123456789012",
+        "log-group:name",
+    ]
+
+
+ELEMENT_COUNT_SCENARIOS = {
+    "longer_not_in_shorter": ["arn:aws:s3:::bucket/x", "arn:aws:s3", False],
+    "longer_in_shorter_wildcard": ["arn:aws:s3:::bucket/x", "arn:aws:s3*", True],
+    "shorter_not_in_longer": ["arn:aws:s3*", "arn:aws:s3:::bucket/x", False],
+    "any_resource": ["arn:aws:s3:::bucket/x", "*", True],
+}
+
+
+@pytest.mark.parametrize("_, scenario", ELEMENT_COUNT_SCENARIOS.items())
+def test_lt_element_counts_differ(_, scenario):
+    subject, other, expected = scenario
+
+    assert (Resource(subject) < Resource(other)) == expected
+    assert Resource(subject).issubset(Resource(other)) == expected
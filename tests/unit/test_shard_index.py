@@ -0,0 +1,183 @@
+from itertools import product
+
+import pytest
+
+from policyglass import PolicyShard
+from policyglass.action import Action, EffectiveAction
+from policyglass.principal import EffectivePrincipal, Principal
+from policyglass.resource import EffectiveResource, Resource
+from policyglass.shard_index import ActionTrie, PolicyShardIndex, ResourceIndex, action_key, principal_key
+
+ACTIONS = ["*", "s3:*", "S3:Get*", "s3:GetObject", "ec2:*", "ec2:RunInstances", "s*:Get*", "s3*"]
+RESOURCES = [
+    "*",
+    "arn:aws:s3:::bucket",
+    "arn:aws:s3:::bucket/*",
+    "arn:aws:s3:::*",
+    "arn:aws:ec2:eu-west-1:111111111111:instance/*",
+    "arn:aws:ec2:*:222222222222:instance/*",
+    "arn:aws:ec2:*:*:*",
+    "arn:aws:s3",
+]
+PRINCIPALS = [
+    ("AWS", "*"),
+    ("AWS", "111111111111"),
+    ("AWS", "arn:aws:iam::111111111111:role/role-name"),
+    ("AWS", "arn:aws:iam::222222222222:role/role-name"),
+    ("AWS", "arn:aws:iam:::role/role-name"),
+    ("Service", "s3.amazonaws.com"),
+    ("AWS", "arn"),
+]
+
+
+def shard(action: str, resource: str, principal: tuple) -> PolicyShard:
+    return PolicyShard(
+        effect="Allow",
+        effective_action=EffectiveAction(inclusion=Action(action)),
+        effective_resource=EffectiveResource(inclusion=Resource(resource)),
+        effective_principal=EffectivePrincipal(inclusion=Principal(*principal)),
+    )
+
+
+ACTION_KEY_SCENARIOS = {
+    "wildcard": ["*", None],
+    "service_wildcard": ["s3:*", "s3"],
+    "case_folded": ["S3:GetObject", "s3"],
+    "wildcard_in_service": ["s*:GetObject", None],
+    "no_separator": ["s3*", None],
+}
+
+
+@pytest.mark.parametrize("_, scenario", ACTION_KEY_SCENARIOS.items())
+def test_action_key(_, scenario):
+    assert action_key(Action(scenario[0])) == scenario[1]
+
+
+PRINCIPAL_KEY_SCENARIOS = {
+    "wildcard": [("AWS", "*"), None],
+    "account": [("AWS", "111111111111"), "111111111111"],
+    "role": [("AWS", "arn:aws:iam::111111111111:role/role-name"), "111111111111"],
+    "no_account": [("AWS", "arn:aws:iam:::role/role-name"), None],
+    "service": [("Service", "s3.amazonaws.com"), None],
+}
+
+
+@pytest.mark.parametrize("_, scenario", PRINCIPAL_KEY_SCENARIOS.items())
+def test_principal_key(_, scenario):
+    assert principal_key(Principal(*scenario[0])) == scenario[1]
+
+
+def test_superset_candidates():
+    s3 = shard("s3:*", "*", ("AWS", "*"))
+    ec2 = shard("ec2:*", "*", ("AWS", "*"))
+    index = PolicyShardIndex([ec2, s3])
+
+    assert index.superset_candidates(shard("s3:GetObject", "*", ("AWS", "*"))) == [s3]
+    assert len(index) == 2
+
+
+def test_superset_candidates_include_all_supersets():
+    shards = [
+        shard(action, resource, principal) for action, resource, principal in product(ACTIONS, RESOURCES, PRINCIPALS)
+    ]
+    index = PolicyShardIndex(shards)
+
+    for subject in shards:
+        candidates = index.superset_candidates(subject)
+        assert [candidate for candidate in shards if subject.issubset(candidate)] == [
+            candidate for candidate in candidates if subject.issubset(candidate)
+        ]
+
+
+TRIE_ACTIONS = ACTIONS + ["s3:Get?bject", "s3:GetObjectAcl", "*Object", "s3:", "S3:*"]
+
+
+def test_action_trie():
+    trie = ActionTrie(Action(action) for action in TRIE_ACTIONS)
+
+    for action in map(Action, TRIE_ACTIONS):
+        assert trie.containing(action) == {other for other in map(Action, TRIE_ACTIONS) if action.issubset(other)}
+        assert trie.contained_by(action) == {other for other in map(Action, TRIE_ACTIONS) if other.issubset(action)}
+
+
+def test_action_trie_items():
+    trie = ActionTrie()
+    trie.add(Action("s3:*"), 0)
+    trie.add(Action("S3:*"), 1)
+    trie.add(Action("ec2:*"), 2)
+
+    assert trie.containing(Action("s3:GetObject")) == {0, 1}
+    assert trie.comparable(Action("s3:Get*")) == {0, 1}
+    assert trie.contained_by(Action("iam:*")) == set()
+
+
+def test_comparable_candidates_include_all_comparable():
+    shards = [
+        shard(action, resource, principal) for action, resource, principal in product(ACTIONS, RESOURCES, PRINCIPALS)
+    ]
+    index = PolicyShardIndex(shards)
+
+    for subject in shards:
+        candidates = index.comparable_candidates(subject)
+        assert [
+            candidate
+            for candidate in shards
+            if subject.issubset(candidate) or candidate.issubset(subject) or subject.intersection(candidate)
+        ] == [
+            candidate
+            for candidate in candidates
+            if subject.issubset(candidate) or candidate.issubset(subject) or subject.intersection(candidate)
+        ]
+
+
+def test_containing_action():
+    s3 = shard("s3:*", "*", ("AWS", "*"))
+    get = shard("s3:Get*", "*", ("AWS", "*"))
+    ec2 = shard("ec2:*", "*", ("AWS", "*"))
+    index = PolicyShardIndex([s3, ec2, get])
+
+    assert index.containing_action(Action("s3:GetObject")) == [s3, get]
+
+
+def test_comparable_positions():
+    s3 = shard("s3:*", "arn:aws:s3:::bucket/*", ("AWS", "*"))
+    ec2 = shard("ec2:*", "*", ("AWS", "*"))
+    other_bucket = shard("s3:*", "arn:aws:s3:::other-bucket/*", ("AWS", "*"))
+    index = PolicyShardIndex([s3, ec2, other_bucket, s3])
+
+    assert index.comparable_positions(shard("s3:Get*", "arn:aws:s3:::bucket/key", ("AWS", "*"))) == [0, 3]
+
+
+INDEX_RESOURCES = RESOURCES + [
+    "arn:aws:s3:::bucket/key",
+    "arn:aws:s3:::bucket/prefix/*",
+    "arn:aws:s3:::bucket/*/key",
+    "arn:aws:s3:::bucket?",
+    "arn:aws:s3:eu-west-1:111111111111:bucket",
+    "arn:aws:*:*:*:*",
+    "arn:*",
+    "arn",
+]
+
+
+def test_resource_index():
+    index = ResourceIndex(Resource(resource) for resource in INDEX_RESOURCES)
+
+    for resource in map(Resource, INDEX_RESOURCES):
+        assert index.containing(resource) == {
+            other for other in map(Resource, INDEX_RESOURCES) if resource.issubset(other)
+        }
+        assert index.contained_by(resource) == {
+            other for other in map(Resource, INDEX_RESOURCES) if other.issubset(resource)
+        }
+
+
+def test_resource_index_items():
+    index = ResourceIndex()
+    index.add(Resource("arn:aws:s3:::bucket/*"), 0)
+    index.add(Resource("arn:aws:s3:::bucket/prefix/*"), 1)
+    index.add(Resource("arn:aws:s3:::other/*"), 2)
+
+    assert index.containing(Resource("arn:aws:s3:::bucket/prefix/key")) == {0, 1}
+    assert index.comparable(Resource("arn:aws:s3:::bucket/prefix/*")) == {0, 1}
+    assert index.contained_by(Resource("arn:aws:ec2:::*")) == set()
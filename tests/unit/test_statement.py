@@ -51,3 +51,61 @@ def test_policy_shards_not_resource_condition():
             ),
         )
     ]
+
+
+def test_iter_policy_shards():
+    statement = Statement(
+        **{
+            "Effect": "Allow",
+            "Action": [f"s3:Action{number}" for number in range(20)],
+            "Principal": {"AWS": [f"arn:aws:iam::111111111111:role/role-{number}" for number in range(10)]},
+            "Resource": [f"arn:aws:s3:::bucket-{number}/*" for number in range(10)],
+        }
+    )
+    shards = statement.iter_policy_shards()
+
+    assert next(shards) == PolicyShard(
+        effect="Allow",
+        effective_action=EffectiveAction(inclusion=Action("s3:Action0")),
+        effective_resource=EffectiveResource(inclusion=Resource("arn:aws:s3:::bucket-0/*")),
+        effective_principal=EffectivePrincipal(
+            inclusion=Principal(type="AWS", value="arn:aws:iam::111111111111:role/role-0")
+        ),
+    )
+    assert sum(1 for _ in shards) == 20 * 10 * 10 - 1
+
+
+def test_policy_shards_cached():
+    statement = Statement(**{"Effect": "Allow", "Action": "s3:*", "Resource": "*"})
+
+    assert statement._cached_policy_shards() is statement._cached_policy_shards()
+    assert statement.policy_shards is not statement.policy_shards
+
+
+def test_policy_shards_cache_not_changed_by_returned_shards():
+    statement = Statement(**{"Effect": "Allow", "Action": "s3:*", "Resource": "*"})
+    statement.policy_shards[0].effect = "Deny"
+
+    assert [shard.effect for shard in statement.policy_shards] == ["Allow"]
+
+
+def test_policy_shards_cache_invalidated_by_assignment():
+    statement = Statement(**{"Effect": "Allow", "Action": "s3:*", "Resource": "*"})
+    statement.policy_shards
+
+    statement.action = [Action("ec2:*")]
+    assert [shard.effective_action.inclusion for shard in statement.policy_shards] == [Action("ec2:*")]
+
+    copied = statement.copy(update={"action": [Action("iam:*")]})
+    assert [shard.effective_action.inclusion for shard in copied.policy_shards] == [Action("iam:*")]
+
+
+def test_clear_policy_shards_cache():
+    statement = Statement(**{"Effect": "Allow", "Action": "s3:*", "Resource": "*"})
+    statement.policy_shards
+
+    statement.action.append(Action("ec2:*"))
+    assert len(statement.policy_shards) == 1
+
+    statement.clear_policy_shards_cache()
+    assert len(statement.policy_shards) == 2